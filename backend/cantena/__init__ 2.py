@@ -1 +0,0 @@
-"""Cantena cost estimation engine."""
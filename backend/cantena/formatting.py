@@ -7,6 +7,7 @@ and per-SF costs — matching how construction PMs communicate numbers
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -30,11 +31,23 @@ def format_cost_range(cr: CostRange) -> str:
     - Millions (>= $1M): '$X.XM - $X.XM'
     - Below $1M: '$XXX,XXX - $XXX,XXX'
     """
-    if cr.high >= 1_000_000:
-        return f"${cr.low / 1_000_000:.1f}M - ${cr.high / 1_000_000:.1f}M"
-    return f"${cr.low:,.0f} - ${cr.high:,.0f}"
+    return _format_cost_range(cr.low, cr.high)
 
 
 def format_sf_cost(cr: CostRange) -> str:
     """Format a per-SF CostRange as '$XXX - $XXX / SF'."""
-    return f"${cr.low:,.0f} - ${cr.high:,.0f} / SF"
+    return _format_sf_cost(cr.low, cr.high)
+
+
+# Reports render the same ranges in several sections (summary, breakdown,
+# export), so cache by the raw floats rather than the CostRange itself.
+@lru_cache(maxsize=4096)
+def _format_cost_range(low: float, high: float) -> str:
+    if high >= 1_000_000:
+        return f"${low / 1_000_000:.1f}M - ${high / 1_000_000:.1f}M"
+    return f"${low:,.0f} - ${high:,.0f}"
+
+
+@lru_cache(maxsize=4096)
+def _format_sf_cost(low: float, high: float) -> str:
+    return f"${low:,.0f} - ${high:,.0f} / SF"
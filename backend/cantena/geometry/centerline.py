@@ -20,6 +20,8 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 
+import numpy as np
+
 from cantena.geometry.extractor import Point2D
 from cantena.geometry.walls import Orientation, WallSegment
 
@@ -50,65 +52,81 @@ def _seg_parallel_range(seg: WallSegment) -> tuple[float, float]:
     return (min(seg.start.y, seg.end.y), max(seg.start.y, seg.end.y))
 
 
+def _seg_bounds(seg: WallSegment) -> tuple[float, float, float]:
+    """Return (perp, par_lo, par_hi) for an H/V segment."""
+    par_lo, par_hi = _seg_parallel_range(seg)
+    return _seg_perp_coord(seg), par_lo, par_hi
+
+
 def _group_by_perp_coord(
     segments: list[WallSegment],
     tolerance: float = _COORD_GROUP_TOLERANCE_PTS,
-) -> dict[float, list[WallSegment]]:
+) -> tuple[list[float], list[list[WallSegment]]]:
     """Group segments by their perpendicular coordinate.
 
     Segments within *tolerance* of each other are merged into the
-    same group, keyed by the mean perpendicular coordinate.
+    same group.  Returns parallel lists ``(means, members)`` sorted
+    by ascending mean perpendicular coordinate, so callers address
+    groups by integer index rather than by float key.
     """
     if not segments:
-        return {}
-
-    coords = [(i, _seg_perp_coord(s)) for i, s in enumerate(segments)]
-    coords.sort(key=lambda t: t[1])
-
-    groups: dict[float, list[WallSegment]] = {}
-    current_indices: list[int] = [coords[0][0]]
-    current_sum = coords[0][1]
-
-    for k in range(1, len(coords)):
-        idx, val = coords[k]
-        prev_val = coords[k - 1][1]
-        if val - prev_val <= tolerance:
-            current_indices.append(idx)
-            current_sum += val
-        else:
-            # Finalize current group
-            mean = current_sum / len(current_indices)
-            groups[mean] = [segments[i] for i in current_indices]
-            current_indices = [idx]
-            current_sum = val
-
-    # Finalize last group
-    if current_indices:
-        mean = current_sum / len(current_indices)
-        groups[mean] = [segments[i] for i in current_indices]
-
-    return groups
-
-
-def _merge_ranges(
-    ranges: list[tuple[float, float]],
-) -> list[tuple[float, float]]:
-    """Merge overlapping 1D ranges.
-
-    Input: list of (min, max) tuples, possibly overlapping.
-    Output: list of merged (min, max) tuples, sorted.
+        return [], []
+
+    perp = np.fromiter(
+        (_seg_perp_coord(s) for s in segments),
+        dtype=np.float64,
+        count=len(segments),
+    )
+    order = np.argsort(perp, kind="stable")
+    sorted_perp = perp[order]
+
+    # A new group starts wherever consecutive sorted coords jump by
+    # more than the tolerance.
+    breaks = np.flatnonzero(np.diff(sorted_perp) > tolerance) + 1
+    starts = np.concatenate(([0], breaks))
+    counts = np.diff(np.concatenate((starts, [len(sorted_perp)])))
+    means = np.add.reduceat(sorted_perp, starts) / counts
+
+    members = [
+        [segments[i] for i in group.tolist()]
+        for group in np.split(order, breaks)
+    ]
+    return means.tolist(), members
+
+
+def _parallel_bounds(
+    segments: list[WallSegment],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return (lo, hi) arrays of each segment's parallel range."""
+    ranges = np.array(
+        [_seg_parallel_range(s) for s in segments], dtype=np.float64
+    ).reshape(-1, 2)
+    return ranges[:, 0], ranges[:, 1]
+
+
+def _merge_ranges_np(
+    lo: np.ndarray,
+    hi: np.ndarray,
+    max_gap: float = 0.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Merge 1D ranges whose gap is at most *max_gap*.
+
+    With ``max_gap=0`` only overlapping or touching ranges merge;
+    a positive *max_gap* also bridges short gaps (e.g. doorways).
+    Input ranges may be unsorted; output ranges are sorted by ``lo``.
     """
-    if not ranges:
-        return []
-    sorted_ranges = sorted(ranges)
-    merged: list[tuple[float, float]] = [sorted_ranges[0]]
-    for lo, hi in sorted_ranges[1:]:
-        prev_lo, prev_hi = merged[-1]
-        if lo <= prev_hi:
-            merged[-1] = (prev_lo, max(prev_hi, hi))
-        else:
-            merged.append((lo, hi))
-    return merged
+    if lo.size == 0:
+        return lo, hi
+    order = np.lexsort((hi, lo))
+    lo = lo[order]
+    hi = hi[order]
+    # Running max of hi is the right edge of the run so far; since
+    # hi >= lo, it never leaks across a gap into the next run.
+    run_hi = np.maximum.accumulate(hi)
+    starts = np.flatnonzero(lo[1:] - run_hi[:-1] > max_gap) + 1
+    ends = np.append(starts - 1, lo.size - 1)
+    starts = np.insert(starts, 0, 0)
+    return lo[starts], run_hi[ends]
 
 
 def _make_segment(
@@ -165,23 +183,22 @@ def extract_centerlines(
         (Orientation.HORIZONTAL, h_segs),
         (Orientation.VERTICAL, v_segs),
     ]:
-        groups = _group_by_perp_coord(segs)
-        if not groups:
+        means, members = _group_by_perp_coord(segs)
+        if not means:
             continue
 
-        sorted_keys = sorted(groups.keys())
-        used: set[float] = set()
+        used = [False] * len(means)
 
         # Greedy pair: each group pairs with its nearest unused neighbor
         # at wall-thickness distance.
-        for i, k1 in enumerate(sorted_keys):
-            if k1 in used:
+        for i, k1 in enumerate(means):
+            if used[i]:
                 continue
-            for j in range(i + 1, len(sorted_keys)):
-                k2 = sorted_keys[j]
-                if k2 in used:
+            for j in range(i + 1, len(means)):
+                if used[j]:
                     continue
-                gap = abs(k2 - k1)
+                k2 = means[j]
+                gap = k2 - k1
                 if gap < min_gap_pts:
                     continue
                 if gap > max_gap_pts:
@@ -190,24 +207,26 @@ def extract_centerlines(
                 center = (k1 + k2) / 2.0
                 thicknesses.append(gap)
                 # Project all segments from both groups onto center
-                all_ranges: list[tuple[float, float]] = []
-                for seg in groups[k1] + groups[k2]:
-                    all_ranges.append(_seg_parallel_range(seg))
-                merged = _merge_ranges(all_ranges)
-                for par_lo, par_hi in merged:
-                    if par_hi - par_lo < 1.0:
-                        continue
+                merged_lo, merged_hi = _merge_ranges_np(
+                    *_parallel_bounds(members[i] + members[j])
+                )
+                keep = merged_hi - merged_lo >= 1.0
+                for par_lo, par_hi in zip(
+                    merged_lo[keep].tolist(),
+                    merged_hi[keep].tolist(),
+                    strict=True,
+                ):
                     centerlines.append(
                         _make_segment(orientation, center, par_lo, par_hi)
                     )
-                used.add(k1)
-                used.add(k2)
+                used[i] = True
+                used[j] = True
                 break
 
         # Collect unpaired segments
-        for key in sorted_keys:
-            if key not in used:
-                unpaired.extend(groups[key])
+        for i, group in enumerate(members):
+            if not used[i]:
+                unpaired.extend(group)
 
     wall_thickness: float | None = None
     if thicknesses:
@@ -250,25 +269,19 @@ def close_gaps(
         (Orientation.HORIZONTAL, h_segs),
         (Orientation.VERTICAL, v_segs),
     ]:
-        groups = _group_by_perp_coord(segs, tolerance=1.0)
-
-        for perp_coord, group in groups.items():
-            ranges = [_seg_parallel_range(s) for s in group]
-            ranges.sort()
+        means, members = _group_by_perp_coord(segs, tolerance=1.0)
 
+        for perp_coord, group in zip(means, members, strict=True):
             # Bridge gaps smaller than max_gap_pts
-            bridged: list[tuple[float, float]] = [ranges[0]] if ranges else []
-            for lo, hi in ranges[1:]:
-                prev_lo, prev_hi = bridged[-1]
-                gap = lo - prev_hi
-                if gap <= max_gap_pts:
-                    bridged[-1] = (prev_lo, max(prev_hi, hi))
-                else:
-                    bridged.append((lo, hi))
-
-            for par_lo, par_hi in bridged:
-                if par_hi - par_lo < 1.0:
-                    continue
+            bridged_lo, bridged_hi = _merge_ranges_np(
+                *_parallel_bounds(group), max_gap=max_gap_pts
+            )
+            keep = bridged_hi - bridged_lo >= 1.0
+            for par_lo, par_hi in zip(
+                bridged_lo[keep].tolist(),
+                bridged_hi[keep].tolist(),
+                strict=True,
+            ):
                 result.append(
                     _make_segment(orientation, perp_coord, par_lo, par_hi)
                 )
@@ -302,20 +315,19 @@ def extend_to_intersections(
     h_segs = [s for s in centerlines if s.orientation == Orientation.HORIZONTAL]
     v_segs = [s for s in centerlines if s.orientation == Orientation.VERTICAL]
 
+    # (perp, par_lo, par_hi) per segment, computed once up front.
+    h_bounds = [_seg_bounds(h) for h in h_segs]
+    v_bounds = [_seg_bounds(v) for v in v_segs]
+
     extended_h = list(h_segs)
     extended_v = list(v_segs)
 
     # Extend horizontal endpoints to nearby vertical lines
-    for i, h in enumerate(extended_h):
-        h_y = (h.start.y + h.end.y) / 2.0
-        h_x_min = min(h.start.x, h.end.x)
-        h_x_max = max(h.start.x, h.end.x)
-
-        for v in v_segs:
-            v_x = (v.start.x + v.end.x) / 2.0
-            v_y_min = min(v.start.y, v.end.y)
-            v_y_max = max(v.start.y, v.end.y)
+    for i, (h_y, orig_lo, orig_hi) in enumerate(h_bounds):
+        h_x_min = orig_lo
+        h_x_max = orig_hi
 
+        for v_x, v_y_min, v_y_max in v_bounds:
             # Check if the vertical line spans this horizontal line's y
             if not (v_y_min - max_extension_pts <= h_y <= v_y_max + max_extension_pts):
                 continue
@@ -327,22 +339,17 @@ def extend_to_intersections(
             if 0 < v_x - h_x_max <= max_extension_pts:
                 h_x_max = v_x
 
-        if h_x_min != min(h.start.x, h.end.x) or h_x_max != max(h.start.x, h.end.x):
+        if h_x_min != orig_lo or h_x_max != orig_hi:
             extended_h[i] = _make_segment(
                 Orientation.HORIZONTAL, h_y, h_x_min, h_x_max
             )
 
     # Extend vertical endpoints to nearby horizontal lines
-    for i, v in enumerate(extended_v):
-        v_x = (v.start.x + v.end.x) / 2.0
-        v_y_min = min(v.start.y, v.end.y)
-        v_y_max = max(v.start.y, v.end.y)
-
-        for h in h_segs:
-            h_y = (h.start.y + h.end.y) / 2.0
-            h_x_min = min(h.start.x, h.end.x)
-            h_x_max = max(h.start.x, h.end.x)
+    for i, (v_x, orig_lo, orig_hi) in enumerate(v_bounds):
+        v_y_min = orig_lo
+        v_y_max = orig_hi
 
+        for h_y, h_x_min, h_x_max in h_bounds:
             # Check if the horizontal line spans this vertical line's x
             if not (h_x_min - max_extension_pts <= v_x <= h_x_max + max_extension_pts):
                 continue
@@ -354,7 +361,7 @@ def extend_to_intersections(
             if 0 < h_y - v_y_max <= max_extension_pts:
                 v_y_max = h_y
 
-        if v_y_min != min(v.start.y, v.end.y) or v_y_max != max(v.start.y, v.end.y):
+        if v_y_min != orig_lo or v_y_max != orig_hi:
             extended_v[i] = _make_segment(
                 Orientation.VERTICAL, v_x, v_y_min, v_y_max
             )
@@ -0,0 +1,252 @@
+"""Planar-face polygonize for axis-aligned wall linework.
+
+Floor plans are overwhelmingly horizontal and vertical lines.  For that
+case the general GEOS path (``union_all`` noding followed by
+``polygonize``) can be replaced by integer arithmetic:
+
+  1. Snap endpoints to a fixed grid (0.1 pt) and extend each segment.
+  2. Merge collinear overlapping segments on each grid line.
+  3. Node every horizontal line against every vertical line.
+  4. Prune dangling edges (the extension overshoots, stray stubs).
+  5. Trace faces over the half-edge graph, always taking the sharpest
+     left turn; bounded faces are the counter-clockwise ones.
+
+``fast_polygonize`` returns ``None`` whenever the input is outside what
+the tracer handles exactly — any segment whose endpoints do not snap
+to the same grid line (even a slightly skewed wall), more than
+one connected component (faces may need holes), or a bridge edge — and
+the caller falls back to Shapely.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import shapely
+
+# Grid resolution in PDF points for snapping endpoints.
+_GRID_PTS = 0.1
+
+# Outgoing-direction preference relative to the arrival heading:
+# left turn, straight on, right turn, then back the way we came.
+_TURN_ORDER = (1, 0, 3, 2)
+
+
+def fast_polygonize(
+    xyxy: np.ndarray, extension: float = 0.0
+) -> np.ndarray | None:
+    """Polygonize axis-aligned segments without GEOS noding.
+
+    Parameters
+    ----------
+    xyxy:
+        ``(N, 4)`` array of segment endpoints ``(x0, y0, x1, y1)``.
+    extension:
+        Length in PDF points added to both ends of every segment so
+        near-miss endpoints still meet.
+
+    Returns
+    -------
+    np.ndarray | None
+        Object array of Shapely polygons (possibly empty), or ``None``
+        if the linework is not supported and the caller should use the
+        general Shapely path.
+    """
+    xyxy = np.asarray(xyxy, dtype=np.float64).reshape(-1, 4)
+    dx = xyxy[:, 2] - xyxy[:, 0]
+    dy = xyxy[:, 3] - xyxy[:, 1]
+    keep = (dx != 0.0) | (dy != 0.0)
+    xyxy, dx, dy = xyxy[keep], dx[keep], dy[keep]
+
+    # Only exactly axis-aligned segments are traced: flattening a skewed
+    # wall onto one grid line moves its ends and can open a corner.
+    grid = np.rint(xyxy / _GRID_PTS)
+    horiz = grid[:, 1] == grid[:, 3]
+    vert = ~horiz & (grid[:, 0] == grid[:, 2])
+    if not np.all(horiz | vert):
+        return None
+
+    h = _snap_axis_segments(xyxy[horiz], axis=0, extension=extension)
+    v = _snap_axis_segments(xyxy[vert], axis=1, extension=extension)
+    edges = _node_edges(h, v)
+    edges = _prune_dangles(edges)
+    if len(edges) == 0:
+        return np.empty(0, dtype=object)
+
+    faces = _trace_bounded_faces(edges)
+    if faces is None:
+        return None
+    if not faces:
+        return np.empty(0, dtype=object)
+
+    coords = np.concatenate(faces) * _GRID_PTS
+    indices = np.repeat(np.arange(len(faces)), [len(f) for f in faces])
+    rings = shapely.linearrings(coords, indices=indices)
+    return np.asarray(shapely.polygons(rings), dtype=object)
+
+
+def _snap_axis_segments(
+    xyxy: np.ndarray, axis: int, extension: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Snap segments along one axis to the grid and merge overlaps.
+
+    *axis* is 0 for horizontal segments (running along x) and 1 for
+    vertical ones.  Returns integer ``(line, lo, hi)`` arrays: the
+    fixed perpendicular coordinate and the merged parallel extent.
+    """
+    empty = np.empty(0, dtype=np.int64)
+    if len(xyxy) == 0:
+        return empty, empty, empty
+
+    par0, par1 = xyxy[:, axis], xyxy[:, axis + 2]
+    perp = (xyxy[:, 1 - axis] + xyxy[:, 3 - axis]) / 2.0
+    line = np.rint(perp / _GRID_PTS).astype(np.int64)
+    lo = np.rint((np.minimum(par0, par1) - extension) / _GRID_PTS)
+    hi = np.rint((np.maximum(par0, par1) + extension) / _GRID_PTS)
+    lo, hi = lo.astype(np.int64), hi.astype(np.int64)
+    nonzero = hi > lo
+    line, lo, hi = line[nonzero], lo[nonzero], hi[nonzero]
+    if len(line) == 0:
+        return empty, empty, empty
+
+    # Offset each grid line into its own band so a single sorted pass
+    # with a running max merges overlaps without crossing lines.
+    lines, rank = np.unique(line, return_inverse=True)
+    band = int(hi.max() - lo.min()) + 2
+    offset = rank * band
+    olo, ohi = lo + offset, hi + offset
+    order = np.argsort(olo, kind="stable")
+    olo, ohi, rank = olo[order], ohi[order], rank[order]
+    reach = np.maximum.accumulate(ohi)
+    starts = np.flatnonzero(np.r_[True, olo[1:] > reach[:-1]])
+    run_lo = olo[starts]
+    run_hi = np.maximum.reduceat(ohi, starts)
+    run_rank = rank[starts]
+    run_offset = run_rank * band
+    return lines[run_rank], run_lo - run_offset, run_hi - run_offset
+
+
+def _node_edges(
+    h: tuple[np.ndarray, np.ndarray, np.ndarray],
+    v: tuple[np.ndarray, np.ndarray, np.ndarray],
+) -> np.ndarray:
+    """Split horizontal and vertical lines at every crossing.
+
+    Returns an ``(E, 4)`` integer array of grid edges ``(x0, y0, x1, y1)``.
+    """
+    hy, hx0, hx1 = h
+    vx, vy0, vy1 = v
+    hit = (
+        (hx0[:, None] <= vx[None, :])
+        & (vx[None, :] <= hx1[:, None])
+        & (vy0[None, :] <= hy[:, None])
+        & (hy[:, None] <= vy1[None, :])
+    )
+    ii, jj = np.nonzero(hit)
+
+    h_edges = _split_lines(hy, hx0, hx1, ii, vx[jj])
+    v_edges = _split_lines(vx, vy0, vy1, jj, hy[ii])
+    # Vertical edges come back as (y0, x, y1, x); swap into (x, y) order.
+    v_edges = v_edges[:, [1, 0, 3, 2]]
+    return np.concatenate([h_edges, v_edges])
+
+
+def _split_lines(
+    line: np.ndarray,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    cut_ids: np.ndarray,
+    cut_at: np.ndarray,
+) -> np.ndarray:
+    """Cut each line at its endpoints and crossings into edges.
+
+    Returns ``(E, 4)`` edges as ``(par0, perp, par1, perp)``.
+    """
+    n = len(line)
+    if n == 0:
+        return np.empty((0, 4), dtype=np.int64)
+    ids = np.concatenate([np.arange(n), np.arange(n), cut_ids])
+    pos = np.concatenate([lo, hi, cut_at])
+    order = np.lexsort((pos, ids))
+    ids, pos = ids[order], pos[order]
+    step = (ids[1:] == ids[:-1]) & (pos[1:] != pos[:-1])
+    a = np.flatnonzero(step)
+    perp = line[ids[a]]
+    return np.column_stack([pos[a], perp, pos[a + 1], perp])
+
+
+def _prune_dangles(edges: np.ndarray) -> np.ndarray:
+    """Repeatedly drop edges that end at a degree-1 node."""
+    while len(edges):
+        nodes, inv = np.unique(
+            edges.reshape(-1, 2), axis=0, return_inverse=True
+        )
+        inv = inv.reshape(-1, 2)
+        degree = np.bincount(inv.ravel(), minlength=len(nodes))
+        dangling = (degree[inv] == 1).any(axis=1)
+        if not dangling.any():
+            break
+        edges = edges[~dangling]
+    return edges
+
+
+def _trace_bounded_faces(edges: np.ndarray) -> list[np.ndarray] | None:
+    """Trace the faces of the planar graph *edges*.
+
+    Returns the vertex rings (open, grid units) of every bounded face,
+    or ``None`` if the graph has several components or a bridge edge.
+    """
+    nodes, inv = np.unique(edges.reshape(-1, 2), axis=0, return_inverse=True)
+    inv = inv.reshape(-1, 2)
+
+    # Half-edge 2k runs edge k forward, 2k+1 runs it backward.
+    tail = inv.ravel()
+    head = inv[:, ::-1].ravel()
+    d = nodes[head] - nodes[tail]
+    # Headings: 0 = +x, 1 = +y, 2 = -x, 3 = -y.
+    heading = np.where(
+        d[:, 0] != 0,
+        np.where(d[:, 0] > 0, 0, 2),
+        np.where(d[:, 1] > 0, 1, 3),
+    )
+
+    n_half = len(tail)
+    out = np.full((len(nodes), 4), -1, dtype=np.int64)
+    out[tail, heading] = np.arange(n_half)
+
+    candidates = np.stack(
+        [out[head, (heading + turn) % 4] for turn in _TURN_ORDER], axis=1
+    )
+    nxt = candidates[np.arange(n_half), np.argmax(candidates >= 0, axis=1)]
+
+    face_of = np.full(n_half, -1, dtype=np.int64)
+    cycles: list[list[int]] = []
+    for start in range(n_half):
+        if face_of[start] >= 0:
+            continue
+        cycle: list[int] = []
+        he = start
+        while face_of[he] < 0:
+            face_of[he] = len(cycles)
+            cycle.append(he)
+            he = int(nxt[he])
+        cycles.append(cycle)
+
+    # A bridge puts both halves of an edge on the same face.
+    if np.any(face_of[0::2] == face_of[1::2]):
+        return None
+
+    rings: list[np.ndarray] = []
+    outer = 0
+    for cycle in cycles:
+        ring = nodes[tail[cycle]]
+        x, y = ring[:, 0], ring[:, 1]
+        twice_area = int(np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y))
+        if twice_area > 0:
+            rings.append(ring)
+        else:
+            outer += 1
+    # Each component has exactly one unbounded (clockwise) face.  More
+    # than one component may nest and need holes; leave that to GEOS.
+    if outer > 1:
+        return None
+    return rings
@@ -0,0 +1,36 @@
+"""Vectorized numeric kernels over polygon coordinate arrays.
+
+Each kernel takes a contiguous ``(N, 2)`` float64 array of ring
+vertices in PDF points.  The ring may be open or closed (first vertex
+repeated at the end); the closing edge is always included, and a
+repeated vertex contributes a zero-length edge.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def as_xy(points: object) -> np.ndarray:
+    """Return *points* as a contiguous ``(N, 2)`` float64 array."""
+    return np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 2)
+
+
+def perimeter_xy(xy: np.ndarray) -> float:
+    """Return the perimeter of the ring *xy*."""
+    if len(xy) < 2:
+        return 0.0
+    d = np.roll(xy, -1, axis=0) - xy
+    # Plain squared norms plus one vector sqrt; hypot's overflow
+    # guarding is unnecessary at page-coordinate magnitudes.
+    return float(np.sqrt(d[:, 0] * d[:, 0] + d[:, 1] * d[:, 1]).sum())
+
+
+def polygon_area_xy(xy: np.ndarray) -> float:
+    """Return the unsigned shoelace area of the ring *xy*."""
+    if len(xy) < 3:
+        return 0.0
+    x = xy[:, 0]
+    y = xy[:, 1]
+    cross = x * np.roll(y, -1) - np.roll(x, -1) * y
+    return float(abs(cross.sum()) / 2.0)
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Final
 
 if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+    from pathlib import Path
+
     import fitz  # type: ignore[import-untyped]
 
     from cantena.geometry.extractor import (
@@ -26,12 +35,23 @@ if TYPE_CHECKING:
         LlmInterpretation,
     )
 
+from cantena.geometry.kernels import as_xy, perimeter_xy
 from cantena.geometry.scale import (
     Confidence,
     ScaleDetector,
     ScaleResult,
 )
 
+# Fallback scale when neither text nor dimensions yield one: 1/8"=1'-0".
+# ScaleResult is frozen, so one shared instance serves every page.
+_DEFAULT_SCALE_ESTIMATE: Final[ScaleResult] = ScaleResult(
+    drawing_units=0.125,
+    real_units=12.0,
+    scale_factor=96.0,
+    notation="estimated (1/8\"=1'-0\")",
+    confidence=Confidence.MEDIUM,
+)
+
 
 class MeasurementConfidence(StrEnum):
     """Confidence level for computed measurements."""
@@ -42,6 +62,20 @@ class MeasurementConfidence(StrEnum):
     NONE = "none"
 
 
+@lru_cache(maxsize=16)
+def _coefs(scale_factor: float) -> tuple[float, float]:
+    """Return ``(sf_coef, lf_coef)`` multipliers for *scale_factor*.
+
+    ``sf_coef`` converts square PDF points to square feet and
+    ``lf_coef`` converts PDF points to linear feet.  Both also
+    broadcast over NumPy arrays.
+    """
+    return (
+        scale_factor * scale_factor / (72.0 * 72.0 * 144.0),
+        scale_factor / (72.0 * 12.0),
+    )
+
+
 def pts_to_real_sf(
     pts_squared: float, scale: ScaleResult
 ) -> float:
@@ -49,9 +83,7 @@ def pts_to_real_sf(
 
     Formula: area_sf = area_pts * (1/72)^2 * scale_factor^2 / 144
     """
-    paper_sq_in = pts_squared / (72.0 * 72.0)
-    real_sq_in = paper_sq_in * scale.scale_factor * scale.scale_factor
-    return real_sq_in / 144.0
+    return pts_squared * _coefs(scale.scale_factor)[0]
 
 
 def pts_to_real_lf(pts: float, scale: ScaleResult) -> float:
@@ -59,9 +91,40 @@ def pts_to_real_lf(pts: float, scale: ScaleResult) -> float:
 
     Formula: length_lf = length_pts * (1/72) * scale_factor / 12
     """
-    paper_in = pts / 72.0
-    real_in = paper_in * scale.scale_factor
-    return real_in / 12.0
+    return pts * _coefs(scale.scale_factor)[1]
+
+
+# Process-wide cache of detect_from_text results.  Sheets in a set
+# repeat the same title-block notation, so parsing is skipped for any
+# page text already seen.  Keys carry the detector type so subclasses
+# with different parsing never share entries.
+_SCALE_TEXT_CACHE_SIZE = 1024
+_scale_text_cache: OrderedDict[tuple[type, bytes], ScaleResult | None] = (
+    OrderedDict()
+)
+_scale_text_lock = threading.Lock()
+
+
+def _detect_from_text_cached(
+    detector: ScaleDetector, page_text: str
+) -> ScaleResult | None:
+    """Return ``detector.detect_from_text(page_text)`` through an LRU cache."""
+    key = (
+        type(detector),
+        hashlib.blake2b(page_text.encode(), digest_size=16).digest(),
+    )
+    with _scale_text_lock:
+        if key in _scale_text_cache:
+            _scale_text_cache.move_to_end(key)
+            return _scale_text_cache[key]
+
+    result = detector.detect_from_text(page_text)
+
+    with _scale_text_lock:
+        _scale_text_cache[key] = result
+        if len(_scale_text_cache) > _SCALE_TEXT_CACHE_SIZE:
+            _scale_text_cache.popitem(last=False)
+    return result
 
 
 @dataclass(frozen=True)
@@ -84,12 +147,43 @@ class PageMeasurements:
     outer_boundary_polygon: list[tuple[float, float]] | None = None
 
 
+@dataclass(frozen=True)
+class _PageRun:
+    """A page's measurements plus the inputs its scale verification needs.
+
+    ``measured`` is ``False`` for pages without vector data, which are
+    never verified.
+    """
+
+    measurements: PageMeasurements
+    text_blocks: list[TextBlock]
+    detected_scale: ScaleResult | None
+    measured: bool = True
+
+
+def _verified_confidence(
+    confidence: MeasurementConfidence,
+    verification: ScaleVerificationResult,
+) -> MeasurementConfidence:
+    """Boost MEDIUM confidence to HIGH when the scale was confirmed."""
+    if (
+        verification.verification_source
+        in ("TEXT_CONFIRMED", "LLM_CONFIRMED", "LLM_RECOVERED")
+        and confidence == MeasurementConfidence.MEDIUM
+    ):
+        return MeasurementConfidence.HIGH
+    return confidence
+
+
 class MeasurementService:
     """Combines vector extraction + scale detection + wall analysis.
 
     Produces real-world measurements (square feet, linear feet)
     from a single PDF page.  Optionally uses RoomDetector for
     polygonize-based area computation and LLM enrichment.
+
+    When *cache_dir* is given, results are cached on disk keyed by the
+    page's content hash (see ``cantena.geometry.measurement_cache``).
     """
 
     def __init__(
@@ -99,49 +193,272 @@ class MeasurementService:
         wall_detector: WallDetector,
         llm_interpreter: LlmGeometryInterpreter | None = None,
         scale_verifier: ScaleVerifier | None = None,
+        cache_dir: Path | None = None,
     ) -> None:
         self._extractor = extractor
         self._scale_detector = scale_detector
         self._wall_detector = wall_detector
         self._llm_interpreter = llm_interpreter
         self._scale_verifier = scale_verifier
+        self._cache_dir = cache_dir
 
     def measure(self, page: fitz.Page) -> PageMeasurements:
         """Run full measurement pipeline on a single page."""
+        if self._cache_dir is None:
+            return self._measure_page(page)
+
+        from cantena.geometry.measurement_cache import read_cache, write_cache
+
+        key = self._cache_key(page)
+        cached = read_cache(self._cache_dir, key)
+        if cached is not None:
+            return cached
+
+        result = self._measure_page(page)
+        write_cache(self._cache_dir, key, result)
+        return result
+
+    def _cache_key(self, page: fitz.Page) -> str:
+        """Disk-cache key for *page* under this service's configuration."""
+        from cantena.geometry.measurement_cache import cache_key, compute_page_hash
+
+        # LLM steps change the output, so they are part of the key.
+        variant = (
+            f"llm={self._llm_interpreter is not None}"
+            f";verify={self._scale_verifier is not None}"
+        )
+        return cache_key(compute_page_hash(page), variant)
+
+    def measure_pages(
+        self,
+        doc_path: str,
+        page_indices: list[int],
+        workers: int | None = None,
+        mp_context: BaseContext | None = None,
+    ) -> list[PageMeasurements]:
+        """Measure several pages of one PDF in parallel worker processes.
+
+        Pages share no state, so each worker process opens its own copy
+        of the document (fitz handles are not safe to share) and runs
+        the deterministic pipeline on the pages it is handed.  Workers
+        only receive the extractor and detectors; the LLM steps (scale
+        verification and geometry interpretation) and the disk cache are
+        run in this process, since their clients cannot be pickled.
+        Scale verification goes through the async API, all pages at
+        once, so this must not be called from a running event loop.
+        Results are returned in the order of *page_indices*.
+
+        Parameters
+        ----------
+        doc_path:
+            Path to the PDF file.
+        page_indices:
+            Zero-based page numbers to measure.
+        workers:
+            Number of worker processes.  Defaults to ``os.cpu_count()``.
+            Values above the core count can help when text extraction,
+            rather than geometry, dominates.
+        mp_context:
+            Multiprocessing context for the pool (e.g. ``spawn``).
+            Defaults to the platform's start method.
+
+        Returns
+        -------
+        list[PageMeasurements]
+            One result per entry in *page_indices*.
+        """
+        import fitz
+
+        max_workers = min(workers or os.cpu_count() or 1, len(page_indices))
+        if max_workers <= 1:
+            with fitz.open(doc_path) as doc:
+                return [self.measure(doc[i]) for i in page_indices]
+
+        with fitz.open(doc_path) as doc:
+            results: dict[int, PageMeasurements] = {}
+            keys: dict[int, str] = {}
+            if self._cache_dir is not None:
+                from cantena.geometry.measurement_cache import read_cache
+
+                for i in page_indices:
+                    keys[i] = self._cache_key(doc[i])
+                    cached = read_cache(self._cache_dir, keys[i])
+                    if cached is not None:
+                        results[i] = cached
+            todo = list(dict.fromkeys(
+                i for i in page_indices if i not in results
+            ))
+            if todo:
+                results.update(zip(
+                    todo,
+                    self._measure_pages_pooled(
+                        doc, doc_path, todo, max_workers, mp_context
+                    ),
+                    strict=True,
+                ))
+                if self._cache_dir is not None:
+                    from cantena.geometry.measurement_cache import write_cache
+
+                    for i in todo:
+                        write_cache(self._cache_dir, keys[i], results[i])
+        return [results[i] for i in page_indices]
+
+    def _measure_pages_pooled(
+        self,
+        doc: fitz.Document,
+        doc_path: str,
+        page_indices: list[int],
+        max_workers: int,
+        mp_context: BaseContext | None,
+    ) -> list[PageMeasurements]:
+        """Run the deterministic pipeline in workers, LLM steps here.
+
+        Each page is extracted once.  Verifications that keep the
+        deterministic scale only add the verification and its confidence
+        boost; pages whose scale the LLM recovered are measured again
+        with that scale.
+        """
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_measure_worker,
+            initargs=(
+                self._extractor,
+                self._scale_detector,
+                self._wall_detector,
+                doc_path,
+            ),
+        ) as pool:
+            runs = list(pool.map(_run_page_in_worker, page_indices))
+            if self._scale_verifier is not None:
+                runs = self._apply_verifications(doc, page_indices, runs, pool)
+
+        if self._llm_interpreter is None:
+            return [run.measurements for run in runs]
+
+        enriched: list[PageMeasurements] = []
+        for run in runs:
+            result = run.measurements
+            if result.rooms is not None:
+                total_area_sf = sum(
+                    r.area_sf for r in result.rooms if r.area_sf is not None
+                )
+                result = replace(
+                    result,
+                    llm_interpretation=self._run_llm_enrichment(
+                        result.scale,
+                        result.rooms,
+                        total_area_sf,
+                        run.text_blocks,
+                    ),
+                )
+            enriched.append(result)
+        return enriched
+
+    def _apply_verifications(
+        self,
+        doc: fitz.Document,
+        page_indices: list[int],
+        runs: list[_PageRun],
+        pool: ProcessPoolExecutor,
+    ) -> list[_PageRun]:
+        """Verify every measured page's scale concurrently and fold it in."""
+        import asyncio
+
+        assert self._scale_verifier is not None
+        verifier = self._scale_verifier
+        # Pages without vector data are never verified (see _run_page).
+        pending = [k for k, run in enumerate(runs) if run.measured]
+
+        async def verify_all() -> list[ScaleVerificationResult]:
+            return await asyncio.gather(*(
+                verifier.verify_or_recover_scale_async(
+                    doc[page_indices[k]],
+                    runs[k].detected_scale,
+                    runs[k].text_blocks,
+                )
+                for k in pending
+            ))
+
+        verifications = asyncio.run(verify_all()) if pending else []
+
+        runs = list(runs)
+        redo: list[tuple[int, ScaleVerificationResult]] = []
+        for k, verification in zip(pending, verifications, strict=True):
+            if verification.scale is None or (
+                verification.scale == runs[k].detected_scale
+            ):
+                # Same scale, so every measurement stands.
+                result = runs[k].measurements
+                runs[k] = replace(
+                    runs[k],
+                    measurements=replace(
+                        result,
+                        scale_verification=verification,
+                        confidence=_verified_confidence(
+                            result.confidence, verification
+                        ),
+                    ),
+                )
+            else:
+                redo.append((k, verification))
+        if redo:
+            remeasured = pool.map(
+                _run_page_in_worker,
+                [page_indices[k] for k, _ in redo],
+                [verification for _, verification in redo],
+            )
+            for (k, _), run in zip(redo, remeasured, strict=True):
+                runs[k] = run
+        return runs
+
+    def _measure_page(self, page: fitz.Page) -> PageMeasurements:
+        """Run the uncached measurement pipeline on a single page."""
+        return self._run_page(page).measurements
+
+    def _run_page(
+        self,
+        page: fitz.Page,
+        scale_verification: ScaleVerificationResult | None = None,
+    ) -> _PageRun:
+        """Run the pipeline and keep the inputs to scale verification.
+
+        A *scale_verification* computed elsewhere (``measure_pages``
+        verifies in the parent process) is used in place of calling the
+        service's own verifier.
+        """
         from cantena.geometry.rooms import RoomDetector
 
         # Step 1: Extract vector data
         data = self._extractor.extract(page)
 
         if not data.paths:
-            return PageMeasurements(
-                scale=None,
-                gross_area_sf=None,
-                building_perimeter_lf=None,
-                total_wall_length_lf=None,
-                wall_count=0,
-                confidence=MeasurementConfidence.NONE,
-                raw_data=data,
+            return _PageRun(
+                PageMeasurements(
+                    scale=None,
+                    gross_area_sf=None,
+                    building_perimeter_lf=None,
+                    total_wall_length_lf=None,
+                    wall_count=0,
+                    confidence=MeasurementConfidence.NONE,
+                    raw_data=data,
+                ),
+                text_blocks=[],
+                detected_scale=None,
+                measured=False,
             )
 
         # Step 2: Detect scale
-        text_blocks = self._scale_detector.extract_text_blocks(page)
-        page_text = "\n".join(tb.text for tb in text_blocks)
-        scale = self._scale_detector.detect_from_text(page_text)
-
-        if scale is None:
-            scale = self._scale_detector.detect_from_dimensions(
-                data.paths, text_blocks
-            )
+        text_blocks, scale = self._detect_scale(page, data)
+        detected_scale = scale
 
         # Step 2b: Optionally verify/recover scale via LLM
-        scale_verification: ScaleVerificationResult | None = None
-        if self._scale_verifier is not None:
+        if scale_verification is None and self._scale_verifier is not None:
             scale_verification = self._scale_verifier.verify_or_recover_scale(
                 page, scale, text_blocks
             )
-            if scale_verification.scale is not None:
-                scale = scale_verification.scale
+        if scale_verification is not None and scale_verification.scale is not None:
+            scale = scale_verification.scale
 
         # Step 3: Detect walls
         wall_analysis = self._wall_detector.detect(data)
@@ -194,13 +511,8 @@ class MeasurementService:
                 gross_area_sf = pts_to_real_sf(area_pts, scale)
 
         # Boost confidence if scale was verified/confirmed
-        if (
-            scale_verification is not None
-            and scale_verification.verification_source
-            in ("LLM_CONFIRMED", "LLM_RECOVERED")
-            and confidence == MeasurementConfidence.MEDIUM
-        ):
-            confidence = MeasurementConfidence.HIGH
+        if scale_verification is not None:
+            confidence = _verified_confidence(confidence, scale_verification)
 
         # Compute perimeter
         perimeter_lf: float | None = None
@@ -222,33 +534,62 @@ class MeasurementService:
         llm_interpretation: LlmInterpretation | None = None
         if self._llm_interpreter is not None and room_analysis is not None:
             llm_interpretation = self._run_llm_enrichment(
-                scale, room_analysis, text_blocks
+                scale,
+                room_analysis.rooms,
+                room_analysis.total_area_sf,
+                text_blocks,
             )
 
-        return PageMeasurements(
-            scale=scale,
-            gross_area_sf=gross_area_sf,
-            building_perimeter_lf=perimeter_lf,
-            total_wall_length_lf=total_wall_lf,
-            wall_count=len(wall_analysis.segments),
-            confidence=confidence,
-            raw_data=data,
-            rooms=room_analysis.rooms if room_analysis else None,
-            room_count=room_analysis.room_count if room_analysis else 0,
-            polygonize_success=polygonize_success,
-            llm_interpretation=llm_interpretation,
-            scale_verification=scale_verification,
-            wall_segments=wall_analysis.segments or None,
-            outer_boundary_polygon=(
-                room_analysis.outer_boundary_polygon
-                if room_analysis else None
+        return _PageRun(
+            PageMeasurements(
+                scale=scale,
+                gross_area_sf=gross_area_sf,
+                building_perimeter_lf=perimeter_lf,
+                total_wall_length_lf=total_wall_lf,
+                wall_count=len(wall_analysis.segments),
+                confidence=confidence,
+                raw_data=data,
+                rooms=room_analysis.rooms if room_analysis else None,
+                room_count=room_analysis.room_count if room_analysis else 0,
+                polygonize_success=polygonize_success,
+                llm_interpretation=llm_interpretation,
+                scale_verification=scale_verification,
+                wall_segments=wall_analysis.segments or None,
+                outer_boundary_polygon=(
+                    room_analysis.outer_boundary_polygon
+                    if room_analysis else None
+                ),
             ),
+            text_blocks=text_blocks,
+            detected_scale=detected_scale,
         )
 
+    def _detect_scale(
+        self, page: fitz.Page, data: DrawingData
+    ) -> tuple[list[TextBlock], ScaleResult | None]:
+        """Return the page's text blocks and its deterministic scale."""
+        text_blocks = self._scale_detector.extract_text_blocks(page)
+        scale = self._scale_detector.detect_from_text_blocks(
+            text_blocks, architectural_only=True
+        )
+        if scale is None:
+            # Notation may be split across blocks: search the joined text,
+            # where a split architectural notation still outranks a
+            # whole-inch or metric one.
+            page_text = "\n".join(tb.text for tb in text_blocks)
+            scale = _detect_from_text_cached(self._scale_detector, page_text)
+
+        if scale is None:
+            scale = self._scale_detector.detect_from_dimensions(
+                data.paths, text_blocks
+            )
+        return text_blocks, scale
+
     def _run_llm_enrichment(
         self,
         scale: ScaleResult | None,
-        room_analysis: RoomAnalysis,
+        rooms: list[DetectedRoom],
+        total_area_sf: float | None,
         text_blocks: list[TextBlock],
     ) -> LlmInterpretation | None:
         """Run LLM geometry interpretation if interpreter is available."""
@@ -267,13 +608,13 @@ class MeasurementService:
                 area_sf=r.area_sf,
                 perimeter_lf=r.perimeter_lf,
             )
-            for r in room_analysis.rooms
+            for r in rooms
         ]
 
         summary = GeometrySummary(
             scale_notation=scale.notation if scale else None,
             scale_factor=scale.scale_factor if scale else None,
-            total_area_sf=room_analysis.total_area_sf,
+            total_area_sf=total_area_sf,
             rooms=room_summaries,
             all_text_blocks=[tb.text for tb in text_blocks],
             wall_count=0,
@@ -290,29 +631,42 @@ class MeasurementService:
         representing roughly 100'x66' at 1/4"=1'-0" scale.
         Uses 1/8"=1'-0" (factor 96) as a conservative default.
         """
-        return ScaleResult(
-            drawing_units=0.125,
-            real_units=12.0,
-            scale_factor=96.0,
-            notation="estimated (1/8\"=1'-0\")",
-            confidence=Confidence.MEDIUM,
-        )
+        return _DEFAULT_SCALE_ESTIMATE
 
     @staticmethod
     def _compute_perimeter_pts(
         boundary: list[Point2D],
     ) -> float:
         """Compute perimeter of a boundary polygon in PDF points."""
-        import math
-
         if len(boundary) < 2:
             return 0.0
+        return perimeter_xy(as_xy([(p.x, p.y) for p in boundary]))
+
+
+# ---------------------------------------------------------------------------
+# Worker-process state for MeasurementService.measure_pages
+# ---------------------------------------------------------------------------
+
+_worker_service: MeasurementService | None = None
+_worker_doc: fitz.Document | None = None
+
+
+def _init_measure_worker(
+    extractor: VectorExtractor,
+    scale_detector: ScaleDetector,
+    wall_detector: WallDetector,
+    doc_path: str,
+) -> None:
+    """Build a deterministic service and open the document once per worker."""
+    import fitz
+
+    global _worker_service, _worker_doc
+    _worker_service = MeasurementService(extractor, scale_detector, wall_detector)
+    _worker_doc = fitz.open(doc_path)
+
 
-        perimeter = 0.0
-        for i in range(len(boundary)):
-            p1 = boundary[i]
-            p2 = boundary[(i + 1) % len(boundary)]
-            dx = p2.x - p1.x
-            dy = p2.y - p1.y
-            perimeter += math.sqrt(dx * dx + dy * dy)
-        return perimeter
+def _run_page_in_worker(
+    page_index: int, scale_verification: ScaleVerificationResult | None = None
+) -> _PageRun:
+    assert _worker_service is not None and _worker_doc is not None
+    return _worker_service._run_page(_worker_doc[page_index], scale_verification)
@@ -0,0 +1,246 @@
+"""On-disk cache of ``PageMeasurements`` keyed by page content.
+
+Re-measuring the same PDF page (retries, previews, edits to unrelated
+fields) re-runs extraction, wall detection, polygonize and any LLM
+calls.  This module stores computed measurements as JSON files named
+by a hash of the page's content stream and the resources it draws,
+so repeat runs become a single file read.
+
+Keys include ``MEASUREMENT_PIPELINE_VERSION``; bump it whenever the
+pipeline's output changes and old entries stop matching.
+
+``raw_data`` is not cached.  Cached results carry a ``DrawingData``
+stub with the page dimensions but no vector paths.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import fitz  # type: ignore[import-untyped]
+
+from cantena.geometry.extractor import DrawingData, Point2D
+from cantena.geometry.measurement import MeasurementConfidence, PageMeasurements
+from cantena.geometry.rooms import DetectedRoom
+from cantena.geometry.scale import Confidence, ScaleResult
+from cantena.geometry.walls import Orientation, WallSegment
+
+logger = logging.getLogger(__name__)
+
+MEASUREMENT_PIPELINE_VERSION = "1"
+
+
+def compute_page_hash(page: fitz.Page) -> str:
+    """Return a SHA-256 hex digest of the page's content, resources and size.
+
+    Pages placed with ``show_pdf_page`` have a one-line content stream
+    (``q /fzFrm0 Do Q``) and keep the drawing in Form XObjects, so the
+    dictionary and stream of every XObject, font and image the page
+    references (nested ones included) are hashed as well.
+    """
+    doc = page.parent
+    digest = hashlib.sha256(page.read_contents())
+    rect = page.rect
+    digest.update(f"|{rect.width:.3f}x{rect.height:.3f}".encode())
+    xrefs = [x[0] for x in page.get_xobjects()]
+    xrefs += [f[0] for f in page.get_fonts(full=True)]
+    xrefs += [i[0] for i in page.get_images(full=True)]
+    for xref in xrefs:
+        if xref <= 0:
+            continue
+        digest.update(doc.xref_object(xref, compressed=True).encode())
+        digest.update(doc.xref_stream_raw(xref) or b"")
+    return digest.hexdigest()
+
+
+def cache_key(page_hash: str, variant: str = "") -> str:
+    """Combine *page_hash* with the pipeline version and a *variant* tag.
+
+    *variant* distinguishes service configurations that produce
+    different output for the same page (e.g. with or without LLM steps).
+    """
+    raw = f"{MEASUREMENT_PIPELINE_VERSION}|{variant}|{page_hash}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def read_cache(cache_dir: Path, key: str) -> PageMeasurements | None:
+    """Return cached measurements for *key*, or ``None`` on a miss."""
+    path = cache_dir / f"{key}.json"
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    try:
+        return _measurements_from_dict(payload)
+    except (KeyError, TypeError, ValueError):
+        logger.warning("Ignoring unreadable measurement cache entry %s", path)
+        return None
+
+
+def write_cache(
+    cache_dir: Path, key: str, measurements: PageMeasurements
+) -> None:
+    """Store *measurements* under *key*, replacing any existing entry.
+
+    Each write goes through its own temporary file, so concurrent
+    writers of the same key never share one.  Failures are logged and
+    ignored; the cache is only an optimization.
+    """
+    path = cache_dir / f"{key}.json"
+    payload = json.dumps(_measurements_to_dict(measurements))
+    tmp_name: str | None = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache_dir, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp_name = tmp.name
+            tmp.write(payload)
+        os.replace(tmp_name, path)
+    except OSError:
+        logger.warning("Could not write measurement cache %s", path)
+        if tmp_name is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+
+
+# ---------------------------------------------------------------------------
+# Serialization
+# ---------------------------------------------------------------------------
+
+
+def _measurements_to_dict(m: PageMeasurements) -> dict[str, Any]:
+    raw = m.raw_data
+    return {
+        "scale": asdict(m.scale) if m.scale else None,
+        "gross_area_sf": m.gross_area_sf,
+        "building_perimeter_lf": m.building_perimeter_lf,
+        "total_wall_length_lf": m.total_wall_length_lf,
+        "wall_count": m.wall_count,
+        "confidence": m.confidence.value,
+        "raw_data": {
+            "page_width_pts": raw.page_width_pts,
+            "page_height_pts": raw.page_height_pts,
+            "page_size_inches": list(raw.page_size_inches),
+        },
+        "rooms": [asdict(r) for r in m.rooms] if m.rooms is not None else None,
+        "room_count": m.room_count,
+        "polygonize_success": m.polygonize_success,
+        "llm_interpretation": (
+            asdict(m.llm_interpretation) if m.llm_interpretation else None
+        ),
+        "scale_verification": (
+            asdict(m.scale_verification) if m.scale_verification else None
+        ),
+        "wall_segments": (
+            [asdict(s) for s in m.wall_segments]
+            if m.wall_segments is not None else None
+        ),
+        "outer_boundary_polygon": m.outer_boundary_polygon,
+    }
+
+
+def _scale_from_dict(d: dict[str, Any] | None) -> ScaleResult | None:
+    if d is None:
+        return None
+    return ScaleResult(
+        drawing_units=d["drawing_units"],
+        real_units=d["real_units"],
+        scale_factor=d["scale_factor"],
+        notation=d["notation"],
+        confidence=Confidence(d["confidence"]),
+    )
+
+
+def _room_from_dict(d: dict[str, Any]) -> DetectedRoom:
+    return DetectedRoom(
+        polygon_pts=[(x, y) for x, y in d["polygon_pts"]],
+        area_pts=d["area_pts"],
+        area_sf=d["area_sf"],
+        perimeter_pts=d["perimeter_pts"],
+        perimeter_lf=d["perimeter_lf"],
+        centroid=Point2D(**d["centroid"]),
+        label=d["label"],
+        room_index=d["room_index"],
+    )
+
+
+def _segment_from_dict(d: dict[str, Any]) -> WallSegment:
+    return WallSegment(
+        start=Point2D(**d["start"]),
+        end=Point2D(**d["end"]),
+        thickness_pts=d["thickness_pts"],
+        orientation=Orientation(d["orientation"]),
+        length_pts=d["length_pts"],
+    )
+
+
+def _measurements_from_dict(d: dict[str, Any]) -> PageMeasurements:
+    from cantena.geometry.scale_verify import ScaleVerificationResult
+    from cantena.services.llm_geometry_interpreter import (
+        LlmInterpretation,
+        LlmRoomInterpretation,
+    )
+
+    raw = d["raw_data"]
+    page_w_in, page_h_in = raw["page_size_inches"]
+    llm = d["llm_interpretation"]
+    verification = d["scale_verification"]
+    outer = d["outer_boundary_polygon"]
+    return PageMeasurements(
+        scale=_scale_from_dict(d["scale"]),
+        gross_area_sf=d["gross_area_sf"],
+        building_perimeter_lf=d["building_perimeter_lf"],
+        total_wall_length_lf=d["total_wall_length_lf"],
+        wall_count=d["wall_count"],
+        confidence=MeasurementConfidence(d["confidence"]),
+        raw_data=DrawingData(
+            paths=[],
+            page_width_pts=raw["page_width_pts"],
+            page_height_pts=raw["page_height_pts"],
+            page_size_inches=(page_w_in, page_h_in),
+        ),
+        rooms=(
+            [_room_from_dict(r) for r in d["rooms"]]
+            if d["rooms"] is not None else None
+        ),
+        room_count=d["room_count"],
+        polygonize_success=d["polygonize_success"],
+        llm_interpretation=(
+            LlmInterpretation(
+                building_type=llm["building_type"],
+                structural_system=llm["structural_system"],
+                rooms=[LlmRoomInterpretation(**r) for r in llm["rooms"]],
+                special_conditions=llm["special_conditions"],
+                measurement_flags=llm["measurement_flags"],
+                confidence_notes=llm["confidence_notes"],
+            )
+            if llm is not None else None
+        ),
+        scale_verification=(
+            ScaleVerificationResult(
+                scale=_scale_from_dict(verification["scale"]),
+                verification_source=verification["verification_source"],
+                warnings=verification["warnings"],
+                llm_raw_notation=verification["llm_raw_notation"],
+            )
+            if verification is not None else None
+        ),
+        wall_segments=(
+            [_segment_from_dict(s) for s in d["wall_segments"]]
+            if d["wall_segments"] is not None else None
+        ),
+        outer_boundary_polygon=(
+            [(x, y) for x, y in outer] if outer is not None else None
+        ),
+    )
@@ -7,41 +7,57 @@ instead of the convex-hull approximation from ``WallDetector``.
 Workflow:
   1. Snap endpoints (via US-371 ``snap_endpoints``).
   2. Extend wall segments slightly at both ends (1 pt) to ensure overlap.
-  3. Convert to Shapely ``LineString`` objects.
-  4. Union linework with ``unary_union``.
-  5. Call ``polygonize()`` to form closed polygons.
-  6. Filter tiny artifacts (<100 sq pts) and page-boundary polygons
+  3. For axis-aligned linework, trace faces on an integer grid
+     (``fast_polygonize``).  Otherwise:
+  4. Convert to Shapely ``LineString`` objects in one batched call,
+     union linework with ``shapely.union_all`` (skipped when endpoints
+     already form a closed, noded network) and call ``polygonize()``
+     to form closed polygons.
+  5. Filter tiny artifacts (<100 sq pts) and page-boundary polygons
      (>80% of bounding page area).
-  7. Fall back to convex hull if ``polygonize`` produces 0 rooms.
+  6. Fall back to convex hull if ``polygonize`` produces 0 rooms.
 """
 
 from __future__ import annotations
 
-import math
 import re
+from collections import Counter
 from dataclasses import dataclass, field, replace
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
-if TYPE_CHECKING:
-    from shapely.geometry import Polygon as ShapelyPolygon
+import numpy as np
+import shapely
+from shapely.geometry import Polygon
+from shapely.ops import polygonize
+from shapely.strtree import STRtree
 
+if TYPE_CHECKING:
     from cantena.geometry.scale import TextBlock
     from cantena.geometry.walls import WallSegment
 
 from cantena.geometry.extractor import Point2D
+from cantena.geometry.fast_polygonize import fast_polygonize
+from cantena.geometry.kernels import as_xy
 from cantena.geometry.snap import snap_endpoints
+from cantena.geometry.walls import segments_to_xyxy
 
 # Minimum polygon area in square PDF points to keep (filters tiny artifacts).
-_MIN_ROOM_AREA_PTS = 100.0
+_MIN_ROOM_AREA_PTS: Final[float] = 100.0
 
 # Maximum fraction of page area for a single polygon (filters page boundary).
-_MAX_PAGE_AREA_FRACTION = 0.80
+_MAX_PAGE_AREA_FRACTION: Final[float] = 0.80
 
 # Extension length in PDF points added to each segment endpoint.
-_SEGMENT_EXTENSION_PTS = 1.0
+_SEGMENT_EXTENSION_PTS: Final[float] = 1.0
+
+# Lines per batch in the cascaded union before polygonize.
+_UNION_CHUNK_SIZE: Final[int] = 200
+
+# Grid (pts) that endpoints are rounded to when testing for a closed network.
+_ENDPOINT_GRID_PTS: Final[float] = 0.01
 
 # Maximum distance (pts) to assign an outside label to nearest centroid.
-_MAX_LABEL_DISTANCE_PTS = 50.0
+_MAX_LABEL_DISTANCE_PTS: Final[float] = 50.0
 
 # Curated list of common architectural room names (case-insensitive match).
 _ROOM_NAMES: frozenset[str] = frozenset({
@@ -84,8 +100,30 @@ _ROOM_NAMES: frozenset[str] = frozenset({
     "LINEN",
 })
 
-
-@dataclass(frozen=True)
+# Room names, longest first, then alphabetical.  Sorted once at import;
+# the explicit tie-break keeps the order (and the compiled pattern
+# below) independent of set iteration order.
+_ROOM_NAMES_SORTED: tuple[str, ...] = tuple(
+    sorted(_ROOM_NAMES, key=lambda n: (-len(n), n))
+)
+
+# Leading three characters of every room name.  A text that contains
+# none of them cannot contain a room name, which rejects most blocks
+# (dimensions, notes) before any normalization.
+_ROOM_NAME_TRIGRAMS: frozenset[str] = frozenset(n[:3] for n in _ROOM_NAMES)
+
+# Multi-pattern scanner over all room names, matched as whole words.
+# The zero-width lookahead lets matches overlap, so one finditer pass
+# reports, at every word start, the longest name beginning there
+# (alternation is tried longest first).
+_ROOM_NAMES_RE = re.compile(
+    r"\b(?=("
+    + "|".join(re.escape(n) for n in _ROOM_NAMES_SORTED)
+    + r")\b)"
+)
+
+
+@dataclass(frozen=True, slots=True)
 class DetectedRoom:
     """A single detected room polygon."""
 
@@ -99,7 +137,7 @@ class DetectedRoom:
     room_index: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoomAnalysis:
     """Result of room detection on a drawing."""
 
@@ -120,103 +158,340 @@ def _normalize_label_text(text: str) -> str:
 
 
 def _match_room_name(text: str) -> str | None:
-    """Return the matched room name if *text* contains a known room name."""
-    normalized = _normalize_label_text(text)
-    # Try exact match first, then substring match (longest first).
+    """Return the matched room name if *text* contains a known room name.
+
+    An exact match wins; otherwise the longest room name found as a
+    whole word in the text (leftmost on ties), so ``DECK`` does not
+    match inside ``DECKING``.
+    """
+    upper = text.upper()
+    if not any(tg in upper for tg in _ROOM_NAME_TRIGRAMS):
+        return None
+    normalized = _normalize_label_text(upper)
     if normalized in _ROOM_NAMES:
         return normalized
-    for name in sorted(_ROOM_NAMES, key=len, reverse=True):
-        if name in normalized:
-            return name
-    return None
-
-
-def _extend_segment(
-    start: Point2D,
-    end: Point2D,
-    extension: float,
-) -> tuple[Point2D, Point2D]:
-    """Extend a segment by *extension* pts at both ends along its direction."""
-    dx = end.x - start.x
-    dy = end.y - start.y
-    length = math.hypot(dx, dy)
-    if length < 1e-9:
-        return start, end
-    ux = dx / length
-    uy = dy / length
-    new_start = Point2D(start.x - ux * extension, start.y - uy * extension)
-    new_end = Point2D(end.x + ux * extension, end.y + uy * extension)
-    return new_start, new_end
+    best: str | None = None
+    for m in _ROOM_NAMES_RE.finditer(normalized):
+        name = m.group(1)
+        if best is None or len(name) > len(best):
+            best = name
+    return best
+
+
+def _extend_segments(xyxy: np.ndarray, extension: float) -> np.ndarray:
+    """Extend every segment by *extension* pts at both ends along its direction.
+
+    *xyxy* is an ``(N, 4)`` array with rows ``(start_x, start_y, end_x,
+    end_y)``.  Returns an ``(N, 2, 2)`` array of extended ``[start, end]``
+    coordinate pairs, ready for ``shapely.linestrings``.  Zero-length
+    segments are left unchanged.
+    """
+    starts = xyxy[:, 0:2]
+    ends = xyxy[:, 2:4]
+    d = ends - starts
+    l2 = d[:, 0] * d[:, 0] + d[:, 1] * d[:, 1]
+    ok = l2 >= 1e-18
+    offset = np.zeros_like(d)
+    offset[ok] = d[ok] * (extension / np.sqrt(l2[ok]))[:, None]
+    return np.stack((starts - offset, ends + offset), axis=1)
+
+
+def _area_mask(
+    areas_pts: np.ndarray, page_area_pts: float | None
+) -> np.ndarray:
+    """Boolean mask of polygon areas that pass the room-size filters.
+
+    Drops artifacts below ``_MIN_ROOM_AREA_PTS`` and, when
+    *page_area_pts* is given, page-boundary polygons above
+    ``_MAX_PAGE_AREA_FRACTION`` of the page.
+    """
+    if page_area_pts is None:
+        return areas_pts >= _MIN_ROOM_AREA_PTS
+    max_area = page_area_pts * _MAX_PAGE_AREA_FRACTION
+    return (areas_pts >= _MIN_ROOM_AREA_PTS) & (areas_pts <= max_area)
+
+
+def _can_enclose_room(xyxy: np.ndarray) -> bool:
+    """Cheap O(n) check that polygonize could yield a room at all.
+
+    Fewer than three segments, all segments parallel, or an endpoint
+    bounding box smaller than ``_MIN_ROOM_AREA_PTS`` can never produce
+    a polygon that survives the area filter.
+    """
+    if len(xyxy) < 3:
+        return False
+    direction = np.arctan2(
+        xyxy[:, 3] - xyxy[:, 1], xyxy[:, 2] - xyxy[:, 0]
+    ) % np.pi
+    if direction.std() < 1e-3:
+        return False
+    pts = xyxy.reshape(-1, 2)
+    w, h = pts.max(axis=0) - pts.min(axis=0)
+    return bool(w * h >= _MIN_ROOM_AREA_PTS)
+
+
+def _closed_network_lines(xyxy: np.ndarray) -> np.ndarray | None:
+    """Return LineStrings that can be polygonized without noding, or ``None``.
+
+    Endpoints are rounded to ``_ENDPOINT_GRID_PTS`` so coincident ends
+    compare equal.  If every endpoint is shared by at least two
+    segments and no segment touches another except at endpoints
+    (``shapely.is_simple``), the linework is already a noded network
+    and the extend + ``union_all`` pass can be skipped.
+    """
+    q = np.round(xyxy / _ENDPOINT_GRID_PTS) * _ENDPOINT_GRID_PTS
+    ends = q.reshape(-1, 2)
+    _, counts = np.unique(ends, axis=0, return_counts=True)
+    if counts.min() < 2:
+        return None
+    lines: np.ndarray = shapely.linestrings(q.reshape(-1, 2, 2))
+    if not shapely.is_simple(shapely.multilinestrings(lines)):
+        return None
+    return lines
+
+
+def _cascaded_union(
+    lines: np.ndarray, chunk_size: int = _UNION_CHUNK_SIZE
+) -> shapely.Geometry:
+    """Node *lines* with a two-level union.
+
+    Lines are unioned in batches of *chunk_size*, then the batch results
+    are unioned together.  GEOS overlay cost grows faster than linearly,
+    so many small unions plus one merge beat a single large call on
+    plans with thousands of segments.
+    """
+    if len(lines) <= chunk_size:
+        return shapely.union_all(lines)
+    parts = [
+        shapely.union_all(lines[i:i + chunk_size])
+        for i in range(0, len(lines), chunk_size)
+    ]
+    return shapely.union_all(parts)
+
+
+def _areas_to_sf(areas_pts: np.ndarray, scale_factor: float) -> np.ndarray:
+    """Convert areas in square PDF points to square feet.
+
+    area_sf = area_pts * (1/72)^2 * scale_factor^2 / 144, fused into
+    a single multiplier.
+    """
+    return areas_pts * (scale_factor * scale_factor / (72.0 * 72.0 * 144.0))
+
+
+def _lengths_to_lf(lengths_pts: np.ndarray, scale_factor: float) -> np.ndarray:
+    """Convert lengths in PDF points to linear feet.
+
+    length_lf = length_pts * (1/72) * scale_factor / 12, fused into
+    a single multiplier.
+    """
+    return lengths_pts * (scale_factor / (72.0 * 12.0))
+
+
+def _polygons_to_detected_rooms(
+    polygons: np.ndarray,
+    scale_factor: float | None,
+    areas_pts: np.ndarray | None = None,
+) -> list[DetectedRoom]:
+    """Convert an array of Shapely polygons to ``DetectedRoom`` objects.
+
+    Areas, perimeters and their real-world conversions are computed
+    for all polygons at once.  *areas_pts* may be passed when the
+    caller already has them (e.g. from the area filter).  Rooms are
+    indexed in input order.
+    """
+    if areas_pts is None:
+        areas_pts = shapely.area(polygons)
+    perimeters_pts = shapely.length(polygons)
+
+    n = len(polygons)
+    areas_sf: list[float | None] = [None] * n
+    perimeters_lf: list[float | None] = [None] * n
+    if scale_factor is not None:
+        areas_sf = _areas_to_sf(areas_pts, scale_factor).tolist()
+        perimeters_lf = _lengths_to_lf(perimeters_pts, scale_factor).tolist()
+
+    # Centroids and exterior vertices for all polygons in one GEOS pass
+    # each; vertices come back flat and are split per ring by index.
+    centroids_xy = shapely.get_coordinates(shapely.centroid(polygons))
+    ring_xy, ring_idx = shapely.get_coordinates(
+        shapely.get_exterior_ring(polygons), return_index=True
+    )
+    rings = np.split(ring_xy, np.searchsorted(ring_idx, np.arange(1, n)))
+
+    rooms: list[DetectedRoom] = []
+    for i, (ring, (cx, cy), area_pts, perimeter_pts, area_sf, perimeter_lf) in enumerate(
+        zip(
+            rings,
+            centroids_xy.tolist(),
+            areas_pts.tolist(),
+            perimeters_pts.tolist(),
+            areas_sf,
+            perimeters_lf,
+            strict=True,
+        )
+    ):
+        rooms.append(
+            DetectedRoom(
+                polygon_pts=[(x, y) for x, y in ring.tolist()],
+                area_pts=area_pts,
+                area_sf=area_sf,
+                perimeter_pts=perimeter_pts,
+                perimeter_lf=perimeter_lf,
+                centroid=Point2D(cx, cy),
+                label=None,
+                room_index=i,
+            )
+        )
+    return rooms
 
 
 def _polygon_to_detected_room(
-    polygon: ShapelyPolygon,
+    polygon: Polygon,
     room_index: int,
     scale_factor: float | None,
 ) -> DetectedRoom:
-    """Convert a Shapely polygon to a ``DetectedRoom``."""
-    area_pts: float = polygon.area
-    perimeter_pts: float = polygon.length
-    centroid = polygon.centroid
-    coords = [(float(x), float(y)) for x, y in polygon.exterior.coords]
-
-    area_sf: float | None = None
-    perimeter_lf: float | None = None
-    if scale_factor is not None:
-        # area_sf = area_pts * (1/72)^2 * scale_factor^2 / 144
-        paper_sq_in = area_pts / (72.0 * 72.0)
-        real_sq_in = paper_sq_in * scale_factor * scale_factor
-        area_sf = real_sq_in / 144.0
-        # perimeter_lf = perimeter_pts * (1/72) * scale_factor / 12
-        paper_in = perimeter_pts / 72.0
-        real_in = paper_in * scale_factor
-        perimeter_lf = real_in / 12.0
-
-    return DetectedRoom(
-        polygon_pts=coords,
-        area_pts=area_pts,
-        area_sf=area_sf,
-        perimeter_pts=perimeter_pts,
-        perimeter_lf=perimeter_lf,
-        centroid=Point2D(centroid.x, centroid.y),
-        label=None,
-        room_index=room_index,
+    """Convert a single Shapely polygon to a ``DetectedRoom``."""
+    polygons = np.empty(1, dtype=object)
+    polygons[0] = polygon
+    room = _polygons_to_detected_rooms(polygons, scale_factor)[0]
+    return replace(room, room_index=room_index)
+
+
+def _outer_boundary_of_rooms(
+    polygons: np.ndarray,
+) -> list[tuple[float, float]] | None:
+    """Return the convex hull of all room polygons as a closed ring.
+
+    The hull of the union equals the hull of the per-room hulls, so
+    only each room's hull vertices (one vectorized ``convex_hull``
+    call) are stacked, deduplicated at 0.001 pt resolution, and hulled
+    again.  Returns ``None`` when the vertices do not span an area.
+    """
+    if len(polygons) == 0:
+        return None
+    pts = np.unique(
+        shapely.get_coordinates(shapely.convex_hull(polygons)).round(3),
+        axis=0,
     )
+    if len(pts) < 3:
+        return None
+    hull = shapely.convex_hull(shapely.multipoints(pts))
+    if not isinstance(hull, Polygon) or hull.is_empty:
+        return None
+    return [(x, y) for x, y in shapely.get_coordinates(hull.exterior).tolist()]
 
 
 def _convex_hull_fallback(
-    segments: list[WallSegment],
+    xyxy: np.ndarray,
     scale_factor: float | None,
 ) -> RoomAnalysis:
-    """Fall back to convex hull when polygonize produces 0 rooms."""
-    from shapely.geometry import MultiPoint, Polygon
-
-    points = []
-    for seg in segments:
-        points.append((seg.start.x, seg.start.y))
-        points.append((seg.end.x, seg.end.y))
+    """Fall back to convex hull when polygonize produces 0 rooms.
 
+    *xyxy* is the ``(N, 4)`` segment array from ``segments_to_xyxy``.
+    """
+    points = xyxy.reshape(-1, 2)
     if len(points) < 3:
         return RoomAnalysis()
 
-    mp = MultiPoint(points)
-    hull = mp.convex_hull
+    hull = shapely.convex_hull(shapely.multipoints(points))
 
     if not isinstance(hull, Polygon) or hull.is_empty:
         return RoomAnalysis()
 
+    # The room's vertices are the hull's exterior ring, already read
+    # back in one get_coordinates call; reuse them for the boundary.
     room = _polygon_to_detected_room(hull, 0, scale_factor)
-    coords = [(float(x), float(y)) for x, y in hull.exterior.coords]
     return RoomAnalysis(
         rooms=[room],
         total_area_pts=room.area_pts,
         total_area_sf=room.area_sf,
         room_count=1,
-        outer_boundary_polygon=coords,
+        outer_boundary_polygon=list(room.polygon_pts),
         polygonize_success=False,
     )
 
 
+def _room_polygons(rooms: list[DetectedRoom]) -> np.ndarray:
+    """Shapely polygons for *rooms*, built in one batched call."""
+    rings = [as_xy(r.polygon_pts) for r in rooms]
+    indices = np.repeat(np.arange(len(rings)), [len(r) for r in rings])
+    return np.asarray(
+        shapely.polygons(shapely.linearrings(np.concatenate(rings), indices=indices)),
+        dtype=object,
+    )
+
+
+def _candidates_by_point(
+    tree: STRtree,
+    geoms: np.ndarray,
+    pts: np.ndarray,
+    max_distance: float,
+    *,
+    by_distance: bool = False,
+) -> list[list[tuple[int, float]]]:
+    """Per point, the ``(index, distance)`` of geometries within *max_distance*.
+
+    One bulk ``dwithin`` tree query and one vectorized ``distance`` call
+    cover every point; pairs are then kept only when strictly closer
+    than *max_distance*.  Each list is sorted by geometry index, or by
+    distance then index when *by_distance* is set (nearest first, as a
+    k-nearest query would return them).
+    """
+    pt_idx, geom_idx = tree.query(
+        pts, predicate="dwithin", distance=max_distance
+    )
+    dists = shapely.distance(geoms[geom_idx], pts[pt_idx])
+    near = dists < max_distance
+    pt_idx, geom_idx, dists = pt_idx[near], geom_idx[near], dists[near]
+    keys = (geom_idx, dists, pt_idx) if by_distance else (geom_idx, pt_idx)
+    order = np.lexsort(keys)
+
+    out: list[list[tuple[int, float]]] = [[] for _ in range(len(pts))]
+    for p, g, d in zip(
+        pt_idx[order].tolist(),
+        geom_idx[order].tolist(),
+        dists[order].tolist(),
+        strict=True,
+    ):
+        out[p].append((g, d))
+    return out
+
+
+def _containing_by_point(
+    polys: np.ndarray, pts: np.ndarray, tolerance: float
+) -> list[list[int]]:
+    """Per point, indices of polygons containing it or within *tolerance*.
+
+    The polygons are prepared and used as the query side of an STRtree
+    over the points, so each exact test runs against a prepared edge
+    index.  Pairs inside a polygon are confirmed with ``contains_xy``;
+    only the few boundary-adjacent pairs pay for an exact distance,
+    kept when strictly closer than *tolerance*.  Each list is sorted by
+    polygon index.
+    """
+    shapely.prepare(polys)
+    poly_idx, pt_idx = STRtree(pts).query(
+        polys, predicate="dwithin", distance=tolerance
+    )
+    inside = shapely.contains_xy(
+        polys[poly_idx], shapely.get_x(pts[pt_idx]), shapely.get_y(pts[pt_idx])
+    )
+    outside = np.flatnonzero(~inside)
+    inside[outside] = (
+        shapely.distance(polys[poly_idx[outside]], pts[pt_idx[outside]])
+        < tolerance
+    )
+    poly_idx, pt_idx = poly_idx[inside], pt_idx[inside]
+    order = np.lexsort((poly_idx, pt_idx))
+
+    out: list[list[int]] = [[] for _ in range(len(pts))]
+    for p, g in zip(
+        pt_idx[order].tolist(), poly_idx[order].tolist(), strict=True
+    ):
+        out[p].append(g)
+    return out
+
+
 class RoomDetector:
     """Reconstructs enclosed room polygons from wall segments."""
 
@@ -256,6 +531,13 @@ class RoomDetector:
         if not snapped:
             return RoomAnalysis()
 
+        # Coordinates as one (N, 4) array for the vectorized steps.
+        xyxy = segments_to_xyxy(snapped)
+
+        # Nothing can enclose a room: go straight to the hull fallback.
+        if not _can_enclose_room(xyxy):
+            return _convex_hull_fallback(xyxy, scale_factor)
+
         # Step 2: Try center-line approach (for parallel wall pairs).
         result = self._try_centerline_polygonize(
             snapped, scale_factor, page_area_pts
@@ -265,13 +547,13 @@ class RoomDetector:
 
         # Step 3: Try raw segments approach (original method).
         result = self._try_raw_polygonize(
-            snapped, scale_factor, page_area_pts
+            xyxy, scale_factor, page_area_pts
         )
         if result is not None:
             return result
 
         # Step 4: Convex hull fallback.
-        return _convex_hull_fallback(snapped, scale_factor)
+        return _convex_hull_fallback(xyxy, scale_factor)
 
     def _try_centerline_polygonize(
         self,
@@ -303,7 +585,7 @@ class RoomDetector:
         all_lines = extended + cl_result.unpaired
 
         result = self._polygonize_segments(
-            all_lines, scale_factor, page_area_pts,
+            segments_to_xyxy(all_lines), scale_factor, page_area_pts,
         )
 
         # Only accept if we got at least 2 rooms (otherwise not useful
@@ -314,65 +596,50 @@ class RoomDetector:
 
     def _try_raw_polygonize(
         self,
-        segments: list[WallSegment],
+        xyxy: np.ndarray,
         scale_factor: float | None,
         page_area_pts: float | None,
     ) -> RoomAnalysis | None:
         """Attempt room detection from raw wall segments (original method)."""
         return self._polygonize_segments(
-            segments, scale_factor, page_area_pts,
+            xyxy, scale_factor, page_area_pts,
         )
 
     def _polygonize_segments(
         self,
-        segments: list[WallSegment],
+        xyxy: np.ndarray,
         scale_factor: float | None,
         page_area_pts: float | None,
     ) -> RoomAnalysis | None:
-        """Run polygonize on a set of segments and build RoomAnalysis.
+        """Run polygonize on an ``(N, 4)`` segment array and build RoomAnalysis.
 
         Returns ``None`` if no rooms survive filtering.
         """
-        from shapely.geometry import LineString, MultiPoint, Polygon
-        from shapely.ops import polygonize, unary_union
-
-        # Extend segments slightly and convert to LineStrings.
-        lines: list[LineString] = []
-        for seg in segments:
-            ext_start, ext_end = _extend_segment(
-                seg.start, seg.end, _SEGMENT_EXTENSION_PTS
-            )
-            lines.append(
-                LineString(
-                    [(ext_start.x, ext_start.y), (ext_end.x, ext_end.y)]
-                )
-            )
-
-        # Union all linework, then polygonize.
-        merged = unary_union(lines)
-        polygons: list[Polygon] = list(polygonize(merged))
-
-        # Filter tiny and page-boundary polygons.
-        filtered: list[Polygon] = []
-        for poly in polygons:
-            if poly.area < _MIN_ROOM_AREA_PTS:
-                continue
-            if (
-                page_area_pts is not None
-                and poly.area > page_area_pts * _MAX_PAGE_AREA_FRACTION
-            ):
-                continue
-            filtered.append(poly)
-
-        if not filtered:
+        # Axis-aligned linework is traced on an integer grid; anything
+        # else goes through GEOS noding and polygonize.
+        polygons = fast_polygonize(xyxy, _SEGMENT_EXTENSION_PTS)
+        if polygons is None:
+            # A closed, already-noded network polygonizes as is; only
+            # dangling or crossing linework needs extend + union_all.
+            lines = _closed_network_lines(xyxy)
+            if lines is None:
+                lines = _cascaded_union(shapely.linestrings(
+                    _extend_segments(xyxy, _SEGMENT_EXTENSION_PTS)
+                ))
+            polygons = np.array(list(polygonize(lines)), dtype=object)
+
+        # Filter tiny and page-boundary polygons in one vectorized pass.
+        areas = shapely.area(polygons)
+        keep = _area_mask(areas, page_area_pts)
+        filtered = polygons[keep]
+
+        if filtered.size == 0:
             return None
 
         # Build DetectedRoom objects.
-        rooms: list[DetectedRoom] = []
-        for i, poly in enumerate(filtered):
-            rooms.append(
-                _polygon_to_detected_room(poly, i, scale_factor)
-            )
+        rooms = _polygons_to_detected_rooms(
+            filtered, scale_factor, areas_pts=areas[keep]
+        )
 
         total_area_pts = sum(r.area_pts for r in rooms)
         total_area_sf: float | None = None
@@ -381,19 +648,7 @@ class RoomDetector:
                 r.area_sf for r in rooms if r.area_sf is not None
             )
 
-        # Outer boundary = convex hull of all room polygon vertices.
-        all_pts: list[tuple[float, float]] = []
-        for r in rooms:
-            all_pts.extend(r.polygon_pts)
-        outer_boundary: list[tuple[float, float]] | None = None
-        if len(all_pts) >= 3:
-            mp = MultiPoint(all_pts)
-            hull = mp.convex_hull
-            if isinstance(hull, Polygon) and not hull.is_empty:
-                outer_boundary = [
-                    (float(x), float(y))
-                    for x, y in hull.exterior.coords
-                ]
+        outer_boundary = _outer_boundary_of_rooms(filtered)
 
         return RoomAnalysis(
             rooms=rooms,
@@ -428,15 +683,35 @@ class RoomDetector:
         -------
         A new ``RoomAnalysis`` with labels assigned to rooms.
         """
-        from shapely.geometry import Point, Polygon
-
         if not rooms.rooms or not text_blocks:
             return rooms
 
-        # Build Shapely polygons for containment checks.
-        shapely_polys: list[Polygon] = [
-            Polygon(r.polygon_pts) for r in rooms.rooms
+        matched = [
+            (name, tb)
+            for tb in text_blocks
+            if (name := _match_room_name(tb.text)) is not None
         ]
+        if not matched:
+            return rooms
+
+        # Candidate rooms for every matched label in bulk: containment
+        # (inside or within 1 pt of the boundary) and centroids within
+        # the fallback radius, each from one indexed query.
+        shapely_polys = _room_polygons(rooms.rooms)
+        centroids = shapely.points(
+            [(r.centroid.x, r.centroid.y) for r in rooms.rooms]
+        )
+        pts = shapely.points(
+            [(tb.position.x, tb.position.y) for _, tb in matched]
+        )
+        containing = _containing_by_point(shapely_polys, pts, 1.0)
+        nearby = _candidates_by_point(
+            STRtree(centroids),
+            centroids,
+            pts,
+            _MAX_LABEL_DISTANCE_PTS,
+            by_distance=True,
+        )
 
         # Track which rooms already have a label assigned.
         labels: dict[int, str] = {}
@@ -444,46 +719,25 @@ class RoomDetector:
         # Collect matched (room_name, room_index) pairs for dedup.
         matched_labels: list[tuple[str, int]] = []
 
-        for tb in text_blocks:
-            room_name = _match_room_name(tb.text)
-            if room_name is None:
-                continue
-
-            pt = Point(tb.position.x, tb.position.y)
-
-            # 1. Check containment.
-            assigned_idx: int | None = None
-            for i, poly in enumerate(shapely_polys):
-                if (
-                    poly.contains(pt) or poly.boundary.distance(pt) < 1.0
-                ) and i not in labels:
-                    assigned_idx = i
-                    break
+        for j, (room_name, _) in enumerate(matched):
+            # 1. First unlabeled room containing the label.
+            assigned_idx: int | None = next(
+                (i for i in containing[j] if i not in labels), None
+            )
 
-            # 2. Fallback: nearest centroid within threshold.
+            # 2. Fallback: nearest unlabeled centroid within threshold.
             if assigned_idx is None:
-                best_dist = _MAX_LABEL_DISTANCE_PTS
-                for i, room in enumerate(rooms.rooms):
-                    if i in labels:
-                        continue
-                    dist = math.hypot(
-                        tb.position.x - room.centroid.x,
-                        tb.position.y - room.centroid.y,
-                    )
-                    if dist < best_dist:
-                        best_dist = dist
-                        assigned_idx = i
+                assigned_idx = next(
+                    (i for i, _dist in nearby[j] if i not in labels), None
+                )
 
             if assigned_idx is not None:
                 labels[assigned_idx] = room_name
                 matched_labels.append((room_name, assigned_idx))
 
-        # Handle duplicate labels: append index suffix.
-        name_counts: dict[str, int] = {}
-        for name, _ in matched_labels:
-            name_counts[name] = name_counts.get(name, 0) + 1
-
-        # For names appearing more than once, renumber them.
+        # Handle duplicate labels: names appearing more than once get
+        # an index suffix in assignment order.
+        name_counts = Counter(name for name, _ in matched_labels)
         name_seen: dict[str, int] = {}
         final_labels: dict[int, str] = {}
         for name, idx in matched_labels:
@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     import fitz  # type: ignore[import-untyped]
 
@@ -22,7 +24,7 @@ class Confidence(StrEnum):
     MEDIUM = "medium"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScaleResult:
     """Result of scale detection from a PDF page."""
 
@@ -33,7 +35,7 @@ class ScaleResult:
     confidence: Confidence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TextBlock:
     """A block of text extracted from a PDF page with position."""
 
@@ -55,31 +57,32 @@ _FRACTION_MAP: dict[str, float] = {
     "3": 3.0,
 }
 
-# Pattern: fractional inch = feet-inches, e.g. 1/8"=1'-0"
-# Captures: (fraction)(optional ")(=)(feet)('-)(inches)(")?
-_ARCH_SCALE_RE = re.compile(
+# Pattern: any supported scale notation, in one alternation.
+#   arch:   fractional or whole inch = feet-inches, e.g. 1/8"=1'-0"
+#   metric: 1:N, e.g. 1:100
+# The arch branch's inch mark is optional, so it also matches everything
+# the whole-inch pattern below does; a whole-inch notation such as
+# 2"=10'-0" surfaces as an arch match with an unmapped fraction.
+_SCALE_RE = re.compile(
     r"""
-    (\d+(?:\s+\d+)?/\d+|\d+)       # fraction or whole number (group 1)
-    \s*(?:["\u201d\u2033]|'')?      # optional inch mark
-    \s*=\s*                         # equals sign
-    (\d+)                           # feet (group 2)
-    \s*['\u2019\u2032]              # foot mark
-    \s*-?\s*                        # optional dash
-    (\d+)                           # inches (group 3)
-    \s*(?:["\u201d\u2033]|'')?      # optional inch mark
+    (?P<arch>
+        (?P<frac>\d+(?:\s+\d+)?/\d+|\d+)   # fraction or whole number
+        \s*(?:["\u201d\u2033]|'')?      # optional inch mark
+        \s*=\s*                         # equals sign
+        (?P<feet>\d+)                    # feet
+        \s*['\u2019\u2032]              # foot mark
+        \s*-?\s*                        # optional dash
+        (?P<inches>\d+)                  # inches
+        \s*(?:["\u201d\u2033]|'')?      # optional inch mark
+    )
+    |
+    (?P<metric>1\s*:\s*(?P<n>\d+))      # 1:N
     """,
     re.VERBOSE | re.IGNORECASE,
 )
 
-# Pattern: metric-style scales like 1:100, 1:50
-_METRIC_SCALE_RE = re.compile(
-    r"""
-    1\s*:\s*(\d+)                   # 1:N (group 1 = N)
-    """,
-    re.VERBOSE,
-)
-
-# Pattern: whole inch = feet, e.g. 1"=10'-0"
+# Pattern: whole inch = feet, e.g. 1"=10'-0".  Only searched within an
+# arch match of _SCALE_RE whose fraction was not recognised.
 _WHOLE_INCH_SCALE_RE = re.compile(
     r"""
     (\d+)                           # whole inches (group 1)
@@ -127,6 +130,22 @@ def parse_dimension_string(text: str) -> float | None:
     return feet * 12.0 + inches
 
 
+# Unicode quote and prime characters folded to ASCII before parsing.
+_QUOTE_TRANSLATE = str.maketrans({
+    "\u201c": '"',  # left double quote
+    "\u201d": '"',  # right double quote
+    "\u2033": '"',  # double prime
+    "\u201e": '"',  # double low-9 quote
+    "\u00ab": '"',  # left guillemet
+    "\u00bb": '"',  # right guillemet
+    "\u2018": "'",  # left single quote
+    "\u2019": "'",  # right single quote
+    "\u2032": "'",  # prime
+})
+
+_WHITESPACE_RE = re.compile(r"[ \t]+")
+
+
 def _normalize_scale_text(text: str) -> str:
     """Normalize scale text for tolerant parsing.
 
@@ -134,20 +153,65 @@ def _normalize_scale_text(text: str) -> str:
     collapse whitespace, and standardize separators so that the
     regex patterns in step 2 can match reliably.
     """
-    # Replace Unicode right-double-quote / double-prime with ASCII "
-    text = text.replace("\u201c", '"')  # left double quote
-    text = text.replace("\u201d", '"')  # right double quote
-    text = text.replace("\u2033", '"')  # double prime
-    text = text.replace("\u201e", '"')  # double low-9 quote
-    text = text.replace("\u00ab", '"')  # left guillemet
-    text = text.replace("\u00bb", '"')  # right guillemet
-    # Replace Unicode right-single-quote / prime with ASCII '
-    text = text.replace("\u2018", "'")  # left single quote
-    text = text.replace("\u2019", "'")  # right single quote
-    text = text.replace("\u2032", "'")  # prime
-    # Collapse multiple spaces / tabs into one space
-    text = re.sub(r"[ \t]+", " ", text)
-    return text
+    # One translate pass for the quotes, then collapse spaces / tabs
+    return _WHITESPACE_RE.sub(" ", text.translate(_QUOTE_TRANSLATE))
+
+
+def _scan_scales(
+    text: str,
+) -> tuple[ScaleResult | None, ScaleResult | None, ScaleResult | None]:
+    """Scan *text* once with ``_SCALE_RE``.
+
+    Returns the first valid ``(architectural, whole_inch, metric)``
+    result of each kind, stopping at the first architectural hit since
+    nothing outranks it.
+    """
+    whole: ScaleResult | None = None
+    metric: ScaleResult | None = None
+    for match in _SCALE_RE.finditer(text):
+        if match.group("arch") is None:
+            n = int(match.group("n"))
+            if metric is None and n > 0:
+                metric = ScaleResult(
+                    drawing_units=1.0,
+                    real_units=float(n),
+                    scale_factor=float(n),
+                    notation=match.group(0).strip(),
+                    confidence=Confidence.HIGH,
+                )
+            continue
+
+        drawing_inches = _FRACTION_MAP.get(match.group("frac").strip())
+        real_inches = int(match.group("feet")) * 12.0 + int(match.group("inches"))
+        if drawing_inches is not None and real_inches > 0:
+            arch = ScaleResult(
+                drawing_units=drawing_inches,
+                real_units=real_inches,
+                scale_factor=real_inches / drawing_inches,
+                notation=match.group(0).strip(),
+                confidence=Confidence.HIGH,
+            )
+            return arch, whole, metric
+        if whole is None:
+            whole = _whole_inch_scale(text, match.start(), match.end())
+    return None, whole, metric
+
+
+def _whole_inch_scale(text: str, start: int, end: int) -> ScaleResult | None:
+    """Return the first valid whole-inch scale in ``text[start:end]``."""
+    for match in _WHOLE_INCH_SCALE_RE.finditer(text, start, end):
+        drawing_inches = float(match.group(1))
+        real_inches = int(match.group(2)) * 12.0 + int(match.group(3))
+        if real_inches <= 0 or drawing_inches <= 0:
+            continue
+        return ScaleResult(
+            drawing_units=drawing_inches,
+            real_units=real_inches,
+            scale_factor=real_inches / drawing_inches,
+            notation=match.group(0).strip(),
+            confidence=Confidence.HIGH,
+        )
+    return None
 
 
 class ScaleDetector:
@@ -166,19 +230,46 @@ class ScaleDetector:
         # Step 1: Normalize text
         normalized = _normalize_scale_text(page_text)
 
-        # Step 2: Tolerant parsing on normalized text
-        # Try architectural fractional scales first
-        result = self._try_arch_scale(normalized)
-        if result is not None:
-            return result
-
-        # Try whole-inch scales: 1"=10'-0"
-        result = self._try_whole_inch_scale(normalized)
-        if result is not None:
-            return result
+        # Step 2: One tolerant pass over the normalized text; results are
+        # ranked architectural, then whole-inch (1"=10'-0"), then metric.
+        arch, whole, metric = _scan_scales(normalized)
+        return arch or whole or metric
 
-        # Try metric-style 1:N scales
-        return self._try_metric_scale(normalized)
+    def detect_from_text_blocks(
+        self, blocks: list[TextBlock], architectural_only: bool = False
+    ) -> ScaleResult | None:
+        """Find a scale notation contained within a single text block.
+
+        Same patterns and priority as ``detect_from_text`` (architectural,
+        then whole-inch, then metric), but each block is searched on its
+        own and the search stops at the first architectural hit, so the
+        page text is never joined.  Blocks without ``=`` or ``:`` cannot
+        hold any supported notation and are skipped before normalization.
+
+        With *architectural_only*, whole-inch and metric hits are ignored.
+        Callers that fall back to the joined page text need this: an
+        architectural notation split across blocks still outranks a
+        metric or whole-inch one that fits in a single block.
+
+        Returns ``None`` when no single block holds a notation; callers
+        should then fall back to ``detect_from_text`` on the joined page
+        text, which also finds notations split across blocks.
+        """
+        whole: ScaleResult | None = None
+        metric: ScaleResult | None = None
+        for tb in blocks:
+            if "=" not in tb.text and ":" not in tb.text:
+                continue
+            arch, block_whole, block_metric = _scan_scales(
+                _normalize_scale_text(tb.text)
+            )
+            if arch is not None:
+                return arch
+            whole = whole or block_whole
+            metric = metric or block_metric
+        if architectural_only:
+            return None
+        return whole or metric
 
     def detect_from_dimensions(
         self,
@@ -210,146 +301,76 @@ class ScaleDetector:
         if not lines:
             return None
 
-        best_scale: ScaleResult | None = None
-        best_dist = float("inf")
-
-        for tb, real_inches in dim_texts:
-            for line in lines:
-                if len(line.points) < 2:
-                    continue
-
-                midpoint = Point2D(
-                    (line.points[0].x + line.points[1].x) / 2,
-                    (line.points[0].y + line.points[1].y) / 2,
-                )
-
-                dx = midpoint.x - tb.position.x
-                dy = midpoint.y - tb.position.y
-                dist = (dx * dx + dy * dy) ** 0.5
-
-                # Only consider text within 50 pts of line midpoint
-                if dist > 50:
-                    continue
-
-                # Compute line length in pts
-                ldx = line.points[1].x - line.points[0].x
-                ldy = line.points[1].y - line.points[0].y
-                line_len_pts = (ldx * ldx + ldy * ldy) ** 0.5
-
-                if line_len_pts < 1:
-                    continue
-
-                # paper_inches = line_len_pts / 72
-                paper_inches = line_len_pts / 72.0
-                scale_factor = real_inches / paper_inches
-
-                if dist < best_dist:
-                    best_dist = dist
-                    best_scale = ScaleResult(
-                        drawing_units=paper_inches,
-                        real_units=real_inches,
-                        scale_factor=scale_factor,
-                        notation=tb.text.strip(),
-                        confidence=Confidence.MEDIUM,
-                    )
+        # Line endpoints and text positions as arrays; every text/line
+        # pair is scored in one broadcast instead of a nested loop.
+        ends = np.array(
+            [
+                (ln.points[0].x, ln.points[0].y, ln.points[1].x, ln.points[1].y)
+                for ln in lines
+                if len(ln.points) >= 2
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+        if len(ends) == 0:
+            return None
+        mid_x = (ends[:, 0] + ends[:, 2]) / 2
+        mid_y = (ends[:, 1] + ends[:, 3]) / 2
+        ldx = ends[:, 2] - ends[:, 0]
+        ldy = ends[:, 3] - ends[:, 1]
+        line_len_pts = np.sqrt(ldx * ldx + ldy * ldy)
+
+        text_xy = np.array(
+            [(tb.position.x, tb.position.y) for tb, _ in dim_texts],
+            dtype=np.float64,
+        )
+        dx = mid_x[None, :] - text_xy[:, 0:1]
+        dy = mid_y[None, :] - text_xy[:, 1:2]
+        dist = np.sqrt(dx * dx + dy * dy)
+
+        # Only consider text within 50 pts of a line midpoint, and lines
+        # at least 1 pt long.  Ties go to the earliest text, then line.
+        dist[(dist > 50) | (line_len_pts < 1)[None, :]] = np.inf
+        best = int(np.argmin(dist))
+        t, k = divmod(best, dist.shape[1])
+        if not np.isfinite(dist[t, k]):
+            return None
 
-        return best_scale
+        tb, real_inches = dim_texts[t]
+        # paper_inches = line_len_pts / 72
+        paper_inches = float(line_len_pts[k]) / 72.0
+        return ScaleResult(
+            drawing_units=paper_inches,
+            real_units=real_inches,
+            scale_factor=real_inches / paper_inches,
+            notation=tb.text.strip(),
+            confidence=Confidence.MEDIUM,
+        )
 
     def extract_text_blocks(self, page: fitz.Page) -> list[TextBlock]:
         """Extract all text blocks from a PDF page with positions."""
-        blocks: list[TextBlock] = []
         raw_blocks: list[tuple[object, ...]] = page.get_text("blocks")
 
-        for raw in raw_blocks:
-            # Each block: (x0, y0, x1, y1, text, block_no, block_type)
-            if len(raw) < 7:
-                continue
-
-            block_type = raw[6]
-            if block_type != 0:  # 0 = text block
-                continue
-
-            x0 = float(raw[0])  # type: ignore[arg-type]
-            y0 = float(raw[1])  # type: ignore[arg-type]
-            x1 = float(raw[2])  # type: ignore[arg-type]
-            y1 = float(raw[3])  # type: ignore[arg-type]
-            text = str(raw[4])
-
-            center = Point2D((x0 + x1) / 2, (y0 + y1) / 2)
-            rect = BoundingRect(
-                x=x0, y=y0, width=x1 - x0, height=y1 - y0
-            )
-            blocks.append(TextBlock(text=text, position=center, bounding_rect=rect))
-
-        return blocks
-
-    def _try_arch_scale(self, text: str) -> ScaleResult | None:
-        """Try to match architectural fractional scale patterns."""
-        for match in _ARCH_SCALE_RE.finditer(text):
-            frac_str = match.group(1).strip()
-            feet = int(match.group(2))
-            inches = int(match.group(3))
-
-            drawing_inches = _FRACTION_MAP.get(frac_str)
-            if drawing_inches is None:
-                continue
-
-            real_inches = feet * 12.0 + inches
-            if real_inches <= 0:
-                continue
-
-            scale_factor = real_inches / drawing_inches
-            notation = match.group(0).strip()
-
-            return ScaleResult(
-                drawing_units=drawing_inches,
-                real_units=real_inches,
-                scale_factor=scale_factor,
-                notation=notation,
-                confidence=Confidence.HIGH,
-            )
-
-        return None
-
-    def _try_whole_inch_scale(self, text: str) -> ScaleResult | None:
-        """Try to match whole-inch scale patterns like 1\"=10'-0\"."""
-        for match in _WHOLE_INCH_SCALE_RE.finditer(text):
-            drawing_inches = float(match.group(1))
-            feet = int(match.group(2))
-            inches = int(match.group(3))
-
-            real_inches = feet * 12.0 + inches
-            if real_inches <= 0 or drawing_inches <= 0:
-                continue
-
-            scale_factor = real_inches / drawing_inches
-            notation = match.group(0).strip()
-
-            return ScaleResult(
-                drawing_units=drawing_inches,
-                real_units=real_inches,
-                scale_factor=scale_factor,
-                notation=notation,
-                confidence=Confidence.HIGH,
+        # Each block: (x0, y0, x1, y1, text, block_no, block_type);
+        # block_type 0 is text.
+        text_raw = [
+            raw for raw in raw_blocks if len(raw) >= 7 and raw[6] == 0
+        ]
+        if not text_raw:
+            return []
+
+        # Convert all rectangles in one batch, then build the blocks.
+        rects = np.array([raw[:4] for raw in text_raw], dtype=np.float64)
+        centers = ((rects[:, :2] + rects[:, 2:]) / 2).tolist()
+        sizes = (rects[:, 2:] - rects[:, :2]).tolist()
+        origins = rects[:, :2].tolist()
+
+        return [
+            TextBlock(
+                text=str(raw[4]),
+                position=Point2D(cx, cy),
+                bounding_rect=BoundingRect(x=x0, y=y0, width=w, height=h),
             )
-
-        return None
-
-    def _try_metric_scale(self, text: str) -> ScaleResult | None:
-        """Try to match metric-style 1:N scale patterns."""
-        for match in _METRIC_SCALE_RE.finditer(text):
-            n = int(match.group(1))
-            if n <= 0:
-                continue
-
-            notation = match.group(0).strip()
-
-            return ScaleResult(
-                drawing_units=1.0,
-                real_units=float(n),
-                scale_factor=float(n),
-                notation=notation,
-                confidence=Confidence.HIGH,
+            for raw, (cx, cy), (w, h), (x0, y0) in zip(
+                text_raw, centers, sizes, origins, strict=True
             )
-
-        return None
+        ]
@@ -8,21 +8,97 @@ producing massively wrong areas (scale^2 error).
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
 import json
 import logging
+import os
+import re
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal
 
 import anthropic
 from anthropic.types import TextBlockParam
+from anthropic.types.message_create_params import (
+    MessageCreateParamsNonStreaming,
+)
+from anthropic.types.messages.batch_create_params import Request
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
     import fitz  # type: ignore[import-untyped]
+    from anthropic.types import ContentBlock
 
-from cantena.geometry.scale import ScaleResult, TextBlock
+from cantena.geometry.scale import (
+    ScaleResult,
+    TextBlock,
+    _normalize_scale_text,
+)
 
 logger = logging.getLogger(__name__)
 
+# JSON object inside ```json ... ``` (or bare ```) code fences.
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+
+# Text that might carry a scale notation ("SCALE", 1/4", 1:100, ...).
+_SCALE_CANDIDATE_RE = re.compile(
+    r"(?:scale|1/\d+|1:\d+|\d+/\d+\s*[\"'=])", re.IGNORECASE
+)
+
+# Published drawing scales, as normalized notation -> scale factor.  A
+# title-block string carrying one of these that agrees with the detected
+# scale confirms it without an LLM call.
+_STANDARD_SCALES: dict[str, float] = {
+    '1/16"=1\'-0"': 192.0,
+    '3/32"=1\'-0"': 128.0,
+    '1/8"=1\'-0"': 96.0,
+    '3/16"=1\'-0"': 64.0,
+    '1/4"=1\'-0"': 48.0,
+    '3/8"=1\'-0"': 32.0,
+    '1/2"=1\'-0"': 24.0,
+    '3/4"=1\'-0"': 16.0,
+    '1"=1\'-0"': 12.0,
+    '1"=10\'-0"': 120.0,
+    '1"=20\'-0"': 240.0,
+    '1"=30\'-0"': 360.0,
+    '1"=40\'-0"': 480.0,
+    '1"=50\'-0"': 600.0,
+    '1"=100\'-0"': 1200.0,
+    "1:20": 20.0,
+    "1:50": 50.0,
+    "1:100": 100.0,
+    "1:200": 200.0,
+}
+_STANDARD_SCALE_RE = re.compile(
+    r"(?<![\d/])(?:"
+    + "|".join(
+        re.escape(k) for k in sorted(_STANDARD_SCALES, key=len, reverse=True)
+    )
+    + r")(?!\d)"
+)
+
+# API failures that degrade to an UNVERIFIED result instead of raising.
+_API_ERRORS = (
+    anthropic.APITimeoutError,
+    anthropic.APIConnectionError,
+    anthropic.RateLimitError,
+    anthropic.APIStatusError,
+)
+
+# Replies kept in each verifier's in-process LRU.
+_REPLY_MEMO_SIZE = 256
+
+# Upper bound on in-flight async verification calls per event loop.
+_MAX_CONCURRENT_REQUESTS = 8
 
 # ---------------------------------------------------------------------------
 # Data models
@@ -30,6 +106,7 @@ logger = logging.getLogger(__name__)
 
 VerificationSource = Literal[
     "DETERMINISTIC",
+    "TEXT_CONFIRMED",
     "LLM_CONFIRMED",
     "LLM_RECOVERED",
     "UNVERIFIED",
@@ -75,25 +152,59 @@ _SYSTEM_PROMPT = (
 )
 
 
+# The system prompt is identical on every call, so it is marked for
+# prompt caching.
+_SYSTEM_BLOCKS: list[TextBlockParam] = [
+    TextBlockParam(
+        type="text",
+        text=_SYSTEM_PROMPT,
+        cache_control={"type": "ephemeral"},
+    ),
+]
+
+# The reply is a single small JSON object (~80 tokens).
+_MAX_REPLY_TOKENS = 128
+
+
 # ---------------------------------------------------------------------------
 # ScaleVerifier
 # ---------------------------------------------------------------------------
 
 
 class ScaleVerifier:
-    """Verifies or recovers drawing scale via LLM safety rail."""
+    """Verifies or recovers drawing scale via LLM safety rail.
+
+    Parsed LLM replies are memoized per instance in a small LRU keyed
+    by prompt text, so repeated calls within a run skip the API.  When
+    *cache_dir* is given they are also stored there as JSON files keyed
+    by a hash of the model and prompt text, so re-runs on the same title
+    block skip it too.  Entries older than *cache_ttl_s* seconds are
+    ignored in both tiers (``None`` keeps them forever).
+    """
 
     def __init__(
         self,
         api_key: str,
         model: str = "claude-sonnet-4-5-20250929",
         timeout: float = 30.0,
+        cache_dir: Path | None = None,
+        cache_ttl_s: float | None = None,
     ) -> None:
         self._client = anthropic.Anthropic(
             api_key=api_key,
             timeout=timeout,
         )
+        self._async_client = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            timeout=timeout,
+        )
         self._model = model
+        self._cache_dir = cache_dir
+        self._cache_ttl_s = cache_ttl_s
+        self._reply_memo: OrderedDict[str, tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._memo_lock = threading.Lock()
 
     def verify_or_recover_scale(
         self,
@@ -109,15 +220,52 @@ class ScaleVerifier:
         2. LOW/MEDIUM/None detected + LLM HIGH/MEDIUM -> LLM_RECOVERED
         3. LLM disagrees >10% -> keep detected with warning
         4. LLM fails/timeouts/429 -> UNVERIFIED with best deterministic
+
+        A standard scale notation in the text that agrees with *detected*
+        within 1% short-circuits to TEXT_CONFIRMED without an LLM call.
         """
+        confirmed = _confirm_from_text(page, detected, text_blocks)
+        if confirmed is not None:
+            return confirmed
+
         try:
             llm_result = self._ask_llm(page, detected, text_blocks)
-        except (
-            anthropic.APITimeoutError,
-            anthropic.APIConnectionError,
-            anthropic.RateLimitError,
-            anthropic.APIStatusError,
-        ):
+        except _API_ERRORS:
+            logger.warning("LLM scale verification API error")
+            return ScaleVerificationResult(
+                scale=detected,
+                verification_source="UNVERIFIED",
+                warnings=["LLM API call failed; using best deterministic scale"],
+            )
+        except Exception:
+            logger.exception("Unexpected error during LLM scale verification")
+            return ScaleVerificationResult(
+                scale=detected,
+                verification_source="UNVERIFIED",
+                warnings=["LLM verification failed unexpectedly"],
+            )
+
+        return self._result_from_llm(detected, llm_result)
+
+    async def verify_or_recover_scale_async(
+        self,
+        page: fitz.Page,
+        detected: ScaleResult | None,
+        text_blocks: list[TextBlock],
+    ) -> ScaleVerificationResult:
+        """Async variant of ``verify_or_recover_scale``.
+
+        Lets callers verify many pages concurrently with
+        ``asyncio.gather``; at most ``_MAX_CONCURRENT_REQUESTS`` calls are
+        in flight per event loop.
+        """
+        confirmed = _confirm_from_text(page, detected, text_blocks)
+        if confirmed is not None:
+            return confirmed
+
+        try:
+            llm_result = await self._ask_llm_async(page, detected, text_blocks)
+        except _API_ERRORS:
             logger.warning("LLM scale verification API error")
             return ScaleVerificationResult(
                 scale=detected,
@@ -132,6 +280,256 @@ class ScaleVerifier:
                 warnings=["LLM verification failed unexpectedly"],
             )
 
+        return self._result_from_llm(detected, llm_result)
+
+    def verify_or_recover_scales_batch(
+        self,
+        pages: list[tuple[fitz.Page, ScaleResult | None, list[TextBlock]]],
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+        max_wait_s: float | None = 3600.0,
+    ) -> list[ScaleVerificationResult]:
+        """Verify many pages through the Message Batches API.
+
+        Each ``(page, detected, text_blocks)`` entry is submitted as one
+        request of a single batch; results come back in input order and
+        follow the same decision logic as ``verify_or_recover_scale``.
+        Batches trade latency (up to 24h) for half-price, server-side
+        parallel processing, so a single page goes through the
+        synchronous path instead.
+
+        Polling stops after *max_wait_s* seconds (``None`` waits for the
+        batch to end); the batch is then canceled and every page still
+        pending is returned UNVERIFIED with its deterministic scale.
+        """
+        if len(pages) <= 1:
+            return [self.verify_or_recover_scale(*entry) for entry in pages]
+
+        confirmed = [_confirm_from_text(*entry) for entry in pages]
+        user_texts = [
+            _build_user_text(page, detected, text_blocks)
+            for page, detected, text_blocks in pages
+        ]
+        cached = [self._read_cached_reply(text) for text in user_texts]
+        requests: list[Request] = [
+            Request(
+                custom_id=f"page-{i}",
+                params=self._request_params(text),
+            )
+            for i, text in enumerate(user_texts)
+            if confirmed[i] is None and cached[i] is None
+        ]
+        raw_by_id: dict[str, str] = {}
+        failure_warning = "LLM batch request did not succeed"
+        if requests:
+            try:
+                raw_by_id = self._run_batch(
+                    requests, poll_interval, max_poll_interval, max_wait_s
+                )
+            except _API_ERRORS:
+                logger.warning("LLM scale verification batch API error")
+                failure_warning = (
+                    "LLM API call failed; using best deterministic scale"
+                )
+            except TimeoutError:
+                logger.warning(
+                    "LLM scale verification batch still pending after %ss",
+                    max_wait_s,
+                )
+                failure_warning = (
+                    "LLM batch did not finish in time; "
+                    "using best deterministic scale"
+                )
+            except Exception:
+                logger.exception(
+                    "Unexpected error during LLM scale verification batch"
+                )
+                failure_warning = "LLM verification failed unexpectedly"
+
+        results: list[ScaleVerificationResult] = []
+        for i, (_, detected, _) in enumerate(pages):
+            text_result = confirmed[i]
+            if text_result is not None:
+                results.append(text_result)
+                continue
+            reply = cached[i]
+            raw = raw_by_id.get(f"page-{i}")
+            if reply is None and raw is not None:
+                reply = _parse_llm_json(raw)
+                self._write_cached_reply(user_texts[i], reply)
+            elif reply is None:
+                results.append(
+                    ScaleVerificationResult(
+                        scale=detected,
+                        verification_source="UNVERIFIED",
+                        warnings=[failure_warning],
+                    )
+                )
+                continue
+            results.append(self._result_from_llm(detected, reply))
+        return results
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _request_params(self, user_text: str) -> MessageCreateParamsNonStreaming:
+        """Build ``messages.create`` keyword arguments for *user_text*."""
+        content: list[TextBlockParam] = [
+            TextBlockParam(type="text", text=user_text),
+        ]
+        return MessageCreateParamsNonStreaming(
+            model=self._model,
+            max_tokens=_MAX_REPLY_TOKENS,
+            system=_SYSTEM_BLOCKS,
+            messages=[{"role": "user", "content": content}],
+        )
+
+    async def _ask_llm_async(
+        self,
+        page: fitz.Page,
+        detected: ScaleResult | None,
+        text_blocks: list[TextBlock],
+    ) -> dict[str, Any] | None:
+        """Async ``_ask_llm``, throttled by the per-loop semaphore."""
+        user_text = _build_user_text(page, detected, text_blocks)
+        cached = self._read_cached_reply(user_text)
+        if cached is not None:
+            return cached
+        async with _request_semaphore():
+            response = await self._async_client.messages.create(
+                **self._request_params(user_text)
+            )
+        reply = _parse_llm_json(_response_text(response.content))
+        self._write_cached_reply(user_text, reply)
+        return reply
+
+    def _cache_path(self, user_text: str) -> Path | None:
+        """Cache file for the reply to *user_text*, if caching is on."""
+        if self._cache_dir is None:
+            return None
+        digest = hashlib.blake2b(
+            f"{self._model}\n{user_text}".encode(), digest_size=16
+        ).hexdigest()
+        return self._cache_dir / f"{digest}.json"
+
+    def _read_cached_reply(self, user_text: str) -> dict[str, Any] | None:
+        """Return a stored, unexpired LLM reply for *user_text*.
+
+        The in-process LRU is checked first, then the disk cache.
+        """
+        now = time.time()
+        with self._memo_lock:
+            entry = self._reply_memo.get(user_text)
+            if entry is not None and not self._expired(entry[0], now):
+                self._reply_memo.move_to_end(user_text)
+                return entry[1]
+
+        path = self._cache_path(user_text)
+        if path is None:
+            return None
+        try:
+            stored_at = path.stat().st_mtime
+            if self._expired(stored_at, now):
+                return None
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict):
+            return None
+        self._remember_reply(user_text, stored_at, data)
+        return data
+
+    def _write_cached_reply(
+        self, user_text: str, reply: dict[str, Any] | None
+    ) -> None:
+        """Store a parsed LLM reply; unparseable replies are not cached."""
+        if reply is None:
+            return
+        self._remember_reply(user_text, time.time(), reply)
+        path = self._cache_path(user_text)
+        if path is None:
+            return
+        # A temp file per write, so concurrent writers of one key never
+        # share (and truncate) the same one.
+        tmp_name: str | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=path.parent, suffix=".tmp",
+                delete=False,
+            ) as tmp:
+                tmp_name = tmp.name
+                tmp.write(json.dumps(reply))
+            os.replace(tmp_name, path)
+        except OSError:
+            logger.warning("Could not write scale verification cache %s", path)
+            if tmp_name is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+
+    def _remember_reply(
+        self, user_text: str, stored_at: float, reply: dict[str, Any]
+    ) -> None:
+        """Add *reply* to the in-process LRU, evicting the oldest entry."""
+        with self._memo_lock:
+            self._reply_memo[user_text] = (stored_at, reply)
+            self._reply_memo.move_to_end(user_text)
+            if len(self._reply_memo) > _REPLY_MEMO_SIZE:
+                self._reply_memo.popitem(last=False)
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self._cache_ttl_s is not None and now - stored_at > self._cache_ttl_s
+
+    def _run_batch(
+        self,
+        requests: list[Request],
+        poll_interval: float,
+        max_poll_interval: float,
+        max_wait_s: float | None,
+    ) -> dict[str, str]:
+        """Submit *requests*, wait for the batch to end, and collect text.
+
+        Returns the response text of every succeeded request keyed by
+        ``custom_id``; errored, canceled and expired requests are left out.
+        Raises ``TimeoutError`` (after a best-effort cancel) if the batch
+        has not ended within *max_wait_s* seconds.
+        """
+        batches = self._client.messages.batches
+        batch = batches.create(requests=requests)
+        deadline = (
+            None if max_wait_s is None else time.monotonic() + max_wait_s
+        )
+        delay = poll_interval
+        while batch.processing_status != "ended":
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    try:
+                        batches.cancel(batch.id)
+                    except _API_ERRORS:
+                        logger.warning("Could not cancel batch %s", batch.id)
+                    raise TimeoutError(batch.id)
+                time.sleep(min(delay, remaining))
+            else:
+                time.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+            batch = batches.retrieve(batch.id)
+
+        raw_by_id: dict[str, str] = {}
+        for item in batches.results(batch.id):
+            if item.result.type == "succeeded":
+                raw_by_id[item.custom_id] = _response_text(
+                    item.result.message.content
+                )
+        return raw_by_id
+
+    def _result_from_llm(
+        self,
+        detected: ScaleResult | None,
+        llm_result: dict[str, Any] | None,
+    ) -> ScaleVerificationResult:
+        """Apply the verification decision logic to a parsed LLM reply."""
         if llm_result is None:
             return ScaleVerificationResult(
                 scale=detected,
@@ -159,10 +557,6 @@ class ScaleVerifier:
         # Compare LLM vs deterministic
         return self._compare_scales(detected, llm_result, llm_notation)
 
-    # ------------------------------------------------------------------
-    # Private helpers
-    # ------------------------------------------------------------------
-
     def _ask_llm(
         self,
         page: fitz.Page,
@@ -171,21 +565,15 @@ class ScaleVerifier:
     ) -> dict[str, Any] | None:
         """Send title-block text to LLM and parse JSON response."""
         user_text = _build_user_text(page, detected, text_blocks)
-        content: list[TextBlockParam] = [
-            TextBlockParam(type="text", text=user_text),
-        ]
-
+        cached = self._read_cached_reply(user_text)
+        if cached is not None:
+            return cached
         response = self._client.messages.create(
-            model=self._model,
-            max_tokens=512,
-            system=_SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": content}],
+            **self._request_params(user_text)
         )
-
-        raw = "\n".join(
-            block.text for block in response.content if block.type == "text"
-        )
-        return _parse_llm_json(raw)
+        reply = _parse_llm_json(_response_text(response.content))
+        self._write_cached_reply(user_text, reply)
+        return reply
 
     @staticmethod
     def _recover_from_llm(
@@ -287,14 +675,9 @@ def _build_user_text(
     """Build user message text with title-block info."""
     lines: list[str] = []
 
-    # Title-block region text (bottom 20% of page)
-    page_height = float(page.rect.height)
-    title_block_y = page_height * 0.80
-    tb_texts = [
-        tb.text.strip()
-        for tb in text_blocks
-        if tb.position.y >= title_block_y and tb.text.strip()
-    ]
+    tb_texts, scale_candidates = _select_blocks(
+        text_blocks, float(page.rect.height)
+    )
 
     lines.append("## Title Block Region Text\n")
     if tb_texts:
@@ -303,8 +686,6 @@ def _build_user_text(
     else:
         lines.append("(no text found in title block region)")
 
-    # Candidate scale strings (any text containing "scale" or common patterns)
-    scale_candidates = _find_scale_candidates(text_blocks)
     if scale_candidates:
         lines.append("\n## Candidate Scale Strings\n")
         for c in scale_candidates:
@@ -324,48 +705,89 @@ def _build_user_text(
     return "\n".join(lines)
 
 
-def _find_scale_candidates(text_blocks: list[TextBlock]) -> list[str]:
-    """Find text blocks that might contain scale information."""
-    import re
-
+def _confirm_from_text(
+    page: fitz.Page,
+    detected: ScaleResult | None,
+    text_blocks: list[TextBlock],
+) -> ScaleVerificationResult | None:
+    """Confirm *detected* from a standard scale notation in the text.
+
+    Returns a TEXT_CONFIRMED result when some scale candidate contains a
+    ``_STANDARD_SCALES`` notation whose factor is within 1% of the
+    detected factor, otherwise ``None`` (the LLM is still needed).
+    """
+    if detected is None or detected.scale_factor <= 0:
+        return None
+    _, candidates = _select_blocks(text_blocks, float(page.rect.height))
+    for text in candidates:
+        compact = _normalize_scale_text(text).replace(" ", "")
+        for match in _STANDARD_SCALE_RE.finditer(compact):
+            factor = _STANDARD_SCALES[match.group()]
+            if abs(factor - detected.scale_factor) <= 0.01 * factor:
+                return ScaleVerificationResult(
+                    scale=detected,
+                    verification_source="TEXT_CONFIRMED",
+                )
+    return None
+
+
+def _select_blocks(
+    text_blocks: list[TextBlock],
+    page_height: float,
+) -> tuple[list[str], list[str]]:
+    """Split text blocks into title-block text and scale candidates.
+
+    Title-block text is every non-empty block in the bottom 20% of the
+    page; scale candidates are blocks anywhere on the page that contain
+    "scale" or a common scale pattern.  Both come from one pass that
+    strips each block's text once.
+    """
+    title_block_y = page_height * 0.80
+    tb_texts: list[str] = []
     candidates: list[str] = []
-    scale_pattern = re.compile(
-        r"(?:scale|1/\d+|1:\d+|\d+/\d+\s*[\"'=])", re.IGNORECASE
-    )
     for tb in text_blocks:
         text = tb.text.strip()
-        if text and scale_pattern.search(text):
+        if not text:
+            continue
+        if tb.position.y >= title_block_y:
+            tb_texts.append(text)
+        if _SCALE_CANDIDATE_RE.search(text):
             candidates.append(text)
-    return candidates
+    return tb_texts, candidates
 
 
-def _extract_json(text: str) -> str | None:
-    """Extract JSON from ```json ... ``` code fences."""
-    start = text.find("```json")
-    if start == -1:
-        start = text.find("```")
-        if start == -1:
-            return None
-        start += 3
-    else:
-        start += 7
+_SEMAPHORES: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+
+def _request_semaphore() -> asyncio.Semaphore:
+    """Return the concurrency limiter for the running event loop.
+
+    Semaphores bind to the loop they first wait on, so each
+    ``asyncio.run`` gets its own rather than sharing a module global.
+    """
+    loop = asyncio.get_running_loop()
+    sem = _SEMAPHORES.get(loop)
+    if sem is None:
+        sem = _SEMAPHORES[loop] = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+    return sem
 
-    end = text.find("```", start)
-    if end == -1:
-        return None
 
-    return text[start:end].strip()
+def _response_text(content: Iterable[ContentBlock]) -> str:
+    """Join the text blocks of a model response."""
+    return "\n".join(block.text for block in content if block.type == "text")
 
 
 def _parse_llm_json(raw: str) -> dict[str, Any] | None:
-    """Parse LLM response JSON."""
-    json_str = _extract_json(raw)
-    if json_str is None:
+    """Parse the fenced JSON object out of an LLM response."""
+    match = _JSON_FENCE_RE.search(raw)
+    if match is None:
         logger.warning("No JSON block found in LLM scale verification response")
         return None
 
     try:
-        data: dict[str, Any] = json.loads(json_str)
+        data: dict[str, Any] = json.loads(match.group(1))
     except json.JSONDecodeError:
         logger.warning("Invalid JSON in LLM scale verification response")
         return None
@@ -5,17 +5,24 @@ polygons.  CAD exports often have tiny floating-point gaps (1–3 pts).
 This module clusters nearby endpoints and replaces each cluster with
 its centroid, producing segments that polygonize cleanly.
 
-If performance becomes an issue with large point sets, the O(n²)
-pairwise distance check can be replaced with a scipy.spatial.KDTree
-approach — see ``_cluster_endpoints`` for the upgrade path.
+Candidate pairs come from one bulk STRtree ``dwithin`` query, so
+clustering stays near-linear on plans with thousands of endpoints.
 """
 
 from __future__ import annotations
 
 import math
 
+import numpy as np
+import shapely
+from shapely.strtree import STRtree
+
 from cantena.geometry.extractor import Point2D
-from cantena.geometry.walls import Orientation, WallSegment
+from cantena.geometry.walls import Orientation, WallSegment, segments_to_xyxy
+
+# Endpoints are keyed on a 0.001 pt integer grid, so extraction noise
+# far below the snap tolerance does not create distinct cluster inputs.
+_KEY_SCALE = 1000.0
 
 
 def _distance(a: Point2D, b: Point2D) -> float:
@@ -45,22 +52,22 @@ def snap_to_grid(point: Point2D, grid_size_pts: float = 1.0) -> Point2D:
 
 
 def _cluster_endpoints(
-    points: list[Point2D],
+    coords: np.ndarray,
     tolerance_pts: float,
-) -> dict[tuple[float, float], Point2D]:
-    """Cluster nearby points and map each original point to its cluster centroid.
+) -> tuple[np.ndarray, np.ndarray]:
+    """Cluster nearby points and compute each cluster's centroid.
 
-    Uses a simple O(n²) pairwise distance check.  For large point sets
-    (>10 000) a ``scipy.spatial.KDTree`` would be more efficient — build
-    the tree, query ``ball_point(tolerance_pts)`` for each point, and
-    union-find the clusters.
+    Pairs within *tolerance_pts* come from a single STRtree ``dwithin``
+    query over the ``(N, 2)`` *coords*; clusters are the connected
+    components of those pairs (union-find), and centroids are
+    per-cluster means computed with ``np.bincount``.
 
     Returns
     -------
-    A mapping from ``(x, y)`` tuples of original points to their
-    replacement ``Point2D`` centroids.
+    ``(labels, centroids)``: the cluster index of each input point and
+    a ``(K, 2)`` array of cluster centroids.
     """
-    n = len(points)
+    n = len(coords)
     parent: list[int] = list(range(n))
 
     def find(i: int) -> int:
@@ -74,28 +81,25 @@ def _cluster_endpoints(
         if ri != rj:
             parent[ri] = rj
 
-    # O(n²) pairwise — fine for typical wall segment counts (<1000 endpoints).
-    for i in range(n):
-        for j in range(i + 1, n):
-            if _distance(points[i], points[j]) <= tolerance_pts:
-                union(i, j)
-
-    # Group by cluster root.
-    clusters: dict[int, list[Point2D]] = {}
-    for i in range(n):
-        root = find(i)
-        clusters.setdefault(root, []).append(points[i])
-
-    # Compute centroid per cluster.
-    mapping: dict[tuple[float, float], Point2D] = {}
-    for members in clusters.values():
-        cx = sum(p.x for p in members) / len(members)
-        cy = sum(p.y for p in members) / len(members)
-        centroid = Point2D(cx, cy)
-        for p in members:
-            mapping[(p.x, p.y)] = centroid
-
-    return mapping
+    geoms = shapely.points(coords)
+    left, right = STRtree(geoms).query(
+        geoms, predicate="dwithin", distance=tolerance_pts
+    )
+    upper = left < right
+    for i, j in zip(left[upper].tolist(), right[upper].tolist(), strict=True):
+        union(i, j)
+
+    # Per-cluster centroids.
+    _, labels = np.unique(
+        np.array([find(i) for i in range(n)], dtype=np.int64),
+        return_inverse=True,
+    )
+    counts = np.bincount(labels)
+    centroids = np.column_stack([
+        np.bincount(labels, weights=coords[:, 0]) / counts,
+        np.bincount(labels, weights=coords[:, 1]) / counts,
+    ]).reshape(-1, 2)
+    return labels, centroids
 
 
 def _reclassify_orientation(start: Point2D, end: Point2D) -> Orientation:
@@ -132,38 +136,38 @@ def snap_endpoints(
     if not segments:
         return []
 
-    # Collect all unique endpoints.
-    seen: set[tuple[float, float]] = set()
-    unique_points: list[Point2D] = []
-    for seg in segments:
-        for pt in (seg.start, seg.end):
-            key = (pt.x, pt.y)
-            if key not in seen:
-                seen.add(key)
-                unique_points.append(pt)
+    # Unique endpoints, keyed on the integer grid and kept in the order
+    # they are first met along the segments.
+    points = segments_to_xyxy(segments).reshape(-1, 2)
+    keys = np.rint(points * _KEY_SCALE).astype(np.int64)
+    _, first, inverse = np.unique(
+        keys, axis=0, return_index=True, return_inverse=True
+    )
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
 
-    # Build cluster mapping.
-    mapping = _cluster_endpoints(unique_points, tolerance_pts)
+    # Cluster, then map every segment end to its cluster centroid.
+    labels, centroids = _cluster_endpoints(points[first[order]], tolerance_pts)
+    end_labels = labels[rank[inverse.ravel()]].reshape(-1, 2)
+    snapped = [Point2D(x, y) for x, y in centroids.tolist()]
 
     # Rebuild segments with snapped endpoints, removing duplicates.
     result: list[WallSegment] = []
-    seen_pairs: set[tuple[tuple[float, float], tuple[float, float]]] = set()
-    for seg in segments:
-        new_start = mapping[(seg.start.x, seg.start.y)]
-        new_end = mapping[(seg.end.x, seg.end.y)]
-
+    seen_pairs: set[tuple[int, int]] = set()
+    for seg, (a, b) in zip(segments, end_labels.tolist(), strict=True):
         # Skip degenerate (zero-length) segments.
-        if new_start.x == new_end.x and new_start.y == new_end.y:
+        if a == b:
             continue
 
         # Canonical key for duplicate detection (order-independent).
-        key_a = (new_start.x, new_start.y)
-        key_b = (new_end.x, new_end.y)
-        pair_key = (min(key_a, key_b), max(key_a, key_b))
+        pair_key = (a, b) if a < b else (b, a)
         if pair_key in seen_pairs:
             continue
         seen_pairs.add(pair_key)
 
+        new_start = snapped[a]
+        new_end = snapped[b]
         new_length = _distance(new_start, new_end)
         new_orientation = _reclassify_orientation(new_start, new_end)
 
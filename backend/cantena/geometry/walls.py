@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import math
-import statistics
 from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
+    from shapely.geometry.base import BaseGeometry
+
     from cantena.geometry.extractor import DrawingData
 
 from cantena.geometry.extractor import PathType, Point2D, VectorPath
@@ -63,6 +66,18 @@ class WallAnalysis:
     outer_boundary: list[Point2D] | None = None
 
 
+def segments_to_xyxy(segments: list[WallSegment]) -> np.ndarray:
+    """Return segment endpoints as an ``(N, 4)`` float64 array.
+
+    Each row is ``(start_x, start_y, end_x, end_y)``.  This is the
+    struct-of-arrays form consumed by the vectorized geometry code.
+    """
+    return np.array(
+        [(s.start.x, s.start.y, s.end.x, s.end.y) for s in segments],
+        dtype=np.float64,
+    ).reshape(-1, 4)
+
+
 def _line_angle_deg(p1: Point2D, p2: Point2D) -> float:
     """Return the angle (0-180) of the line from *p1* to *p2*."""
     dx = p2.x - p1.x
@@ -79,56 +94,165 @@ def _classify_orientation(p1: Point2D, p2: Point2D) -> Orientation:
     return Orientation.ANGLED
 
 
-def _is_dark_color(color: tuple[float, float, float] | None) -> bool:
-    """Return True if *color* is black or dark grey."""
-    if color is None:
-        return True  # No stroke colour often means default black
-    return sum(color) <= _MAX_DARK_COLOR_SUM
-
-
-def _line_length(p1: Point2D, p2: Point2D) -> float:
-    dx = p2.x - p1.x
-    dy = p2.y - p1.y
-    return math.sqrt(dx * dx + dy * dy)
-
-
-def _lines_are_parallel_pair(
-    seg_a: VectorPath,
-    seg_b: VectorPath,
+def _paths_to_xyxy(paths: list[VectorPath]) -> np.ndarray:
+    """Return the first two points of each path as an ``(N, 4)`` array.
+
+    Callers pass only paths with at least two points.
+    """
+    return np.array(
+        [
+            (p.points[0].x, p.points[0].y, p.points[1].x, p.points[1].y)
+            for p in paths
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 4)
+
+
+def _segment_lengths(xyxy: np.ndarray) -> np.ndarray:
+    dx = xyxy[:, 2] - xyxy[:, 0]
+    dy = xyxy[:, 3] - xyxy[:, 1]
+    lengths: np.ndarray = np.sqrt(dx * dx + dy * dy)
+    return lengths
+
+
+def _segment_angles_deg(xyxy: np.ndarray) -> np.ndarray:
+    """Vectorized ``_line_angle_deg``: angles in [0, 180)."""
+    dx = xyxy[:, 2] - xyxy[:, 0]
+    dy = xyxy[:, 3] - xyxy[:, 1]
+    angles: np.ndarray = np.abs(np.degrees(np.arctan2(dy, dx))) % 180
+    return angles
+
+
+def _window_pairs(
+    coord: np.ndarray, lo: float, hi: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Index pairs whose *coord* values differ by between *lo* and *hi*.
+
+    Coordinates are sorted once and each element's partners are a
+    contiguous ``searchsorted`` window among the elements after it in
+    sorted order, so every unordered pair appears once.  With *lo* at
+    or below zero, pairs with equal coordinates are included.
+    """
+    order = np.argsort(coord, kind="stable")
+    c = coord[order]
+    start = np.maximum(
+        np.searchsorted(c, c + lo, side="left"), np.arange(1, len(c) + 1)
+    )
+    stop = np.searchsorted(c, c + hi, side="right")
+    counts = np.maximum(stop - start, 0)
+    rows = np.repeat(np.arange(len(c)), counts)
+    offsets = np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return order[rows], order[start[rows] + offsets]
+
+
+def _axis_window_pairs(
+    xyxy: np.ndarray,
+    members: np.ndarray,
+    axis: int,
     min_gap: float,
     max_gap: float,
-) -> float | None:
-    """If two lines are parallel and within *min_gap*–*max_gap* apart, return gap."""
-    if len(seg_a.points) < 2 or len(seg_b.points) < 2:
-        return None
-
-    a1, a2 = seg_a.points[0], seg_a.points[1]
-    b1, b2 = seg_b.points[0], seg_b.points[1]
-
-    angle_a = _line_angle_deg(a1, a2)
-    angle_b = _line_angle_deg(b1, b2)
-
-    # Must be roughly parallel (within 5°)
-    angle_diff = abs(angle_a - angle_b)
-    if angle_diff > 5 and angle_diff < 175:
-        return None
-
-    # Compute perpendicular distance between the two lines using midpoints
-    mid_b = Point2D((b1.x + b2.x) / 2, (b1.y + b2.y) / 2)
-
-    # Direction vector of line A
-    dx = a2.x - a1.x
-    dy = a2.y - a1.y
-    length = math.sqrt(dx * dx + dy * dy)
-    if length < 0.001:
+) -> tuple[np.ndarray, np.ndarray]:
+    """Candidate pairs among near-axis lines, windowed on the perpendicular.
+
+    *members* index lines within ``_ANGLE_TOLERANCE_DEG`` of *axis*
+    (0 = horizontal, 1 = vertical).  Lines are keyed by the midpoint's
+    perpendicular coordinate.  A line tilted by θ drifts ``|tan θ|``
+    per point along the axis, so the window is widened by the largest
+    ``|tan θ|`` times the extent of the midpoints along the axis; exact
+    axis lines get the plain ``min_gap``–``max_gap`` window.
+    """
+    if len(members) < 2:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    sub = xyxy[members]
+    along = np.abs(sub[:, 2 + axis] - sub[:, axis])
+    across = np.abs(sub[:, 3 - axis] - sub[:, 1 - axis])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tan = np.where(along > 0, across / along, 0.0)
+    max_tan = float(tan.max())
+    mid_along = (sub[:, axis] + sub[:, 2 + axis]) / 2
+    mid_across = (sub[:, 1 - axis] + sub[:, 3 - axis]) / 2
+    widen = max_tan * float(np.ptp(mid_along))
+
+    # A small slack on the window keeps the exact check authoritative.
+    slack = 1e-6 * max(1.0, max_gap)
+    lo = min_gap - widen - slack
+    hi = max_gap * math.sqrt(1.0 + max_tan * max_tan) + widen + slack
+    a, b = _window_pairs(mid_across, lo, hi)
+    return members[a], members[b]
+
+
+def _parallel_pair_gaps(
+    xyxy: np.ndarray,
+    min_gap: float,
+    max_gap: float,
+) -> np.ndarray:
+    """Gaps of all line pairs that are parallel and *min_gap*–*max_gap* apart.
+
+    For every pair ``i < j`` the lines must be within 5° of parallel,
+    and the gap is the perpendicular distance from the midpoint of
+    line ``j`` to the infinite line through ``i``.
+
+    Only plausible pairs are scored.  Lines within
+    ``_ANGLE_TOLERANCE_DEG`` of horizontal or vertical (everything the
+    wall candidate filter keeps) are paired only within a tilt-widened
+    window of each other (see ``_axis_window_pairs``); any other line
+    is paired with every line.  Gaps are returned in ``(i, j)`` order.
+    """
+    n = len(xyxy)
+    dx = xyxy[:, 2] - xyxy[:, 0]
+    dy = xyxy[:, 3] - xyxy[:, 1]
+    angle = _segment_angles_deg(xyxy)
+    is_horiz = (angle <= _ANGLE_TOLERANCE_DEG) | (
+        angle >= 180 - _ANGLE_TOLERANCE_DEG
+    )
+    is_vert = ~is_horiz & (np.abs(angle - 90) <= _ANGLE_TOLERANCE_DEG)
+    other = np.flatnonzero(~is_horiz & ~is_vert)
+
+    hi_a, hi_b = _axis_window_pairs(
+        xyxy, np.flatnonzero(is_horiz), 0, min_gap, max_gap
+    )
+    vi_a, vi_b = _axis_window_pairs(
+        xyxy, np.flatnonzero(is_vert), 1, min_gap, max_gap
+    )
+    oi_a = np.repeat(other, n)
+    oi_b = np.tile(np.arange(n), len(other))
+    a = np.concatenate([hi_a, vi_a, oi_a])
+    b = np.concatenate([hi_b, vi_b, oi_b])
+    i, j = np.minimum(a, b), np.maximum(a, b)
+    pairs = np.unique(np.stack([i, j], axis=1)[i != j], axis=0)
+    i, j = pairs[:, 0], pairs[:, 1]
+
+    length = _segment_lengths(xyxy)
+    diff = np.abs(angle[i] - angle[j])
+    mid_x = (xyxy[j, 0] + xyxy[j, 2]) / 2
+    mid_y = (xyxy[j, 1] + xyxy[j, 3]) / 2
+    cross = (mid_x - xyxy[i, 0]) * dy[i] - (mid_y - xyxy[i, 1]) * dx[i]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dist = np.abs(cross) / length[i]
+    ok = (
+        ((diff <= 5) | (diff >= 175))
+        & (length[i] >= 0.001)
+        & (dist >= min_gap)
+        & (dist <= max_gap)
+    )
+    gaps: np.ndarray = dist[ok]
+    return gaps
+
+
+def _endpoint_hull(segments: list[WallSegment]) -> BaseGeometry | None:
+    """Convex hull of all segment endpoints, or None below three points.
+
+    The endpoints go to GEOS as one ``(N, 2)`` array rather than a
+    per-point list of tuples.
+    """
+    import shapely
+
+    points = segments_to_xyxy(segments).reshape(-1, 2)
+    if len(points) < 3:
         return None
-
-    # Signed distance from mid_b to line through a1→a2
-    dist = abs((mid_b.x - a1.x) * dy - (mid_b.y - a1.y) * dx) / length
-
-    if min_gap <= dist <= max_gap:
-        return dist
-    return None
+    hull: BaseGeometry = shapely.convex_hull(shapely.multipoints(points))
+    return hull
 
 
 class WallDetector:
@@ -144,51 +268,39 @@ class WallDetector:
         - Dark colour (black / dark gray)
         - IQR-based outlier removal (e.g. title block borders)
         """
-        candidates = self._filter_wall_candidates(data.paths)
+        # Endpoints and lengths are computed once here and carried
+        # through every later step.
+        candidates, xyxy, lengths = self._filter_wall_candidates(data.paths)
 
         if not candidates:
             return WallAnalysis()
 
         # Remove length outliers (e.g. title block border lines)
-        candidates = self._remove_length_outliers(candidates)
+        keep = np.flatnonzero(self._length_inlier_mask(lengths))
+        candidates = [candidates[k] for k in keep]
+        xyxy, lengths = xyxy[keep], lengths[keep]
 
         if not candidates:
             return WallAnalysis()
 
-        segments: list[WallSegment] = []
-        thicknesses: list[float] = []
-
         # Check for parallel pairs to detect wall thickness
-        paired: set[int] = set()
-        for i, path_a in enumerate(candidates):
-            for j in range(i + 1, len(candidates)):
-                path_b = candidates[j]
-                gap = _lines_are_parallel_pair(path_a, path_b, 2.0, 20.0)
-                if gap is not None:
-                    paired.add(i)
-                    paired.add(j)
-                    thicknesses.append(gap)
+        thicknesses = _parallel_pair_gaps(xyxy, 2.0, 20.0)
 
         # Build wall segments from all candidates
-        for path in candidates:
-            if len(path.points) < 2:
-                continue
-            p1, p2 = path.points[0], path.points[1]
-            orientation = _classify_orientation(p1, p2)
-            length = _line_length(p1, p2)
-            segments.append(
-                WallSegment(
-                    start=p1,
-                    end=p2,
-                    thickness_pts=None,
-                    orientation=orientation,
-                    length_pts=length,
-                )
+        segments = [
+            WallSegment(
+                start=path.points[0],
+                end=path.points[1],
+                thickness_pts=None,
+                orientation=_classify_orientation(path.points[0], path.points[1]),
+                length_pts=length,
             )
+            for path, length in zip(candidates, lengths.tolist(), strict=True)
+        ]
 
         total_length = sum(seg.length_pts for seg in segments)
         median_thickness = (
-            statistics.median(thicknesses) if thicknesses else None
+            float(np.median(thicknesses)) if len(thicknesses) else None
         )
 
         # Try to find outer boundary from wall endpoints
@@ -209,19 +321,10 @@ class WallDetector:
         Uses the convex hull of all wall endpoints as the outer boundary.
         Returns area in square PDF points, or None if insufficient data.
         """
-        from shapely.geometry import MultiPoint
-
-        points = []
-        for seg in segments:
-            points.append((seg.start.x, seg.start.y))
-            points.append((seg.end.x, seg.end.y))
-
-        if len(points) < 3:
+        hull = _endpoint_hull(segments)
+        if hull is None:
             return None
 
-        mp = MultiPoint(points)
-        hull = mp.convex_hull
-
         area: float = hull.area
         if area <= 0:
             return None
@@ -229,81 +332,79 @@ class WallDetector:
 
     def _filter_wall_candidates(
         self, paths: list[VectorPath]
-    ) -> list[VectorPath]:
-        """Filter paths to those likely representing walls."""
-        candidates: list[VectorPath] = []
-        for path in paths:
-            if path.path_type != PathType.LINE:
-                continue
-            if len(path.points) < 2:
-                continue
+    ) -> tuple[list[VectorPath], np.ndarray, np.ndarray]:
+        """Filter paths to those likely representing walls.
+
+        All numeric checks run as boolean masks over struct-of-arrays
+        columns built once from the line paths.  Returns the surviving
+        paths with their ``(N, 4)`` endpoint array and lengths.
+        """
+        lines = [
+            p for p in paths
+            if p.path_type == PathType.LINE and len(p.points) >= 2
+        ]
+        xyxy = _paths_to_xyxy(lines)
+        lengths = _segment_lengths(xyxy)
+        if not lines:
+            return [], xyxy, lengths
+
+        widths = np.array([p.line_width for p in lines], dtype=np.float64)
+        # No stroke colour often means default black.
+        color_sums = np.array(
+            [
+                sum(p.stroke_color) if p.stroke_color is not None else 0.0
+                for p in lines
+            ],
+            dtype=np.float64,
+        )
+        angles = _segment_angles_deg(xyxy)
+
+        keep = np.flatnonzero(
             # Stroke width check
-            if path.line_width < _MIN_WALL_WIDTH_PTS:
-                continue
+            (widths >= _MIN_WALL_WIDTH_PTS)
             # Minimum length check (excludes annotation ticks)
-            length = _line_length(path.points[0], path.points[1])
-            if length < _MIN_WALL_LENGTH_PTS:
-                continue
+            & (lengths >= _MIN_WALL_LENGTH_PTS)
             # Color check
-            if not _is_dark_color(path.stroke_color):
-                continue
+            & (color_sums <= _MAX_DARK_COLOR_SUM)
             # Orientation check (H or V within tolerance)
-            orientation = _classify_orientation(
-                path.points[0], path.points[1]
+            & (
+                (angles <= _ANGLE_TOLERANCE_DEG)
+                | (angles >= 180 - _ANGLE_TOLERANCE_DEG)
+                | (np.abs(angles - 90) <= _ANGLE_TOLERANCE_DEG)
             )
-            if orientation == Orientation.ANGLED:
-                continue
-
-            candidates.append(path)
-        return candidates
+        )
+        return [lines[k] for k in keep], xyxy[keep], lengths[keep]
 
     @staticmethod
-    def _remove_length_outliers(
-        candidates: list[VectorPath],
-    ) -> list[VectorPath]:
-        """Remove extreme length outliers using IQR method.
+    def _length_inlier_mask(lengths: np.ndarray) -> np.ndarray:
+        """Mask out extreme length outliers using IQR method.
 
         Title block borders and other non-wall lines are often
         much longer than any structural wall. This removes lines
         above Q3 + 3*IQR.
         """
-        if len(candidates) < 4:
-            return candidates
+        if len(lengths) < 4:
+            return np.ones(len(lengths), dtype=bool)
 
-        lengths = sorted(
-            _line_length(p.points[0], p.points[1])
-            for p in candidates
-        )
-        q1 = lengths[len(lengths) // 4]
-        q3 = lengths[3 * len(lengths) // 4]
+        ordered = np.sort(lengths)
+        q1 = ordered[len(ordered) // 4]
+        q3 = ordered[3 * len(ordered) // 4]
         iqr = q3 - q1
         upper = q3 + _OUTLIER_IQR_FACTOR * iqr
 
-        return [
-            p
-            for p in candidates
-            if _line_length(p.points[0], p.points[1]) <= upper
-        ]
+        mask: np.ndarray = lengths <= upper
+        return mask
 
     def _find_outer_boundary(
         self, segments: list[WallSegment]
     ) -> list[Point2D] | None:
         """Attempt to find the outer boundary as a convex hull."""
-        from shapely.geometry import MultiPoint, Polygon
-
-        points = []
-        for seg in segments:
-            points.append((seg.start.x, seg.start.y))
-            points.append((seg.end.x, seg.end.y))
-
-        if len(points) < 3:
-            return None
-
-        mp = MultiPoint(points)
-        hull = mp.convex_hull
+        import shapely
+        from shapely.geometry import Polygon
 
+        hull = _endpoint_hull(segments)
         if not isinstance(hull, Polygon) or hull.is_empty:
             return None
 
-        coords = list(hull.exterior.coords)
+        coords = shapely.get_coordinates(hull.exterior).tolist()
         return [Point2D(x, y) for x, y in coords]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Annotated
+
 from pydantic import BaseModel, Field, field_validator
 
 from cantena.models.enums import (
@@ -23,6 +25,10 @@ class Location(BaseModel):
     zip_code: str | None = None
 
 
+# A single 1-5 complexity score; shared by every ComplexityScores field.
+ComplexityScore = Annotated[int, Field(ge=1, le=5)]
+
+
 class ComplexityScores(BaseModel):
     """Complexity scores (1-5) for different building aspects.
 
@@ -30,10 +36,10 @@ class ComplexityScores(BaseModel):
     1 = very simple, 3 = typical, 5 = very complex.
     """
 
-    structural: int = Field(default=3, ge=1, le=5)
-    mep: int = Field(default=3, ge=1, le=5)
-    finishes: int = Field(default=3, ge=1, le=5)
-    site: int = Field(default=3, ge=1, le=5)
+    structural: ComplexityScore = 3
+    mep: ComplexityScore = 3
+    finishes: ComplexityScore = 3
+    site: ComplexityScore = 3
 
 
 class BuildingModel(BaseModel):
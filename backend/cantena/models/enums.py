@@ -124,6 +124,11 @@ class RoomType(StrEnum):
     OTHER = "other"
 
 
+# Valid RoomType values, for checking LLM-supplied strings without
+# raising ValueError out of RoomType() on every miss.
+ROOM_TYPE_VALUES: frozenset[str] = frozenset(RoomType)
+
+
 class Confidence(StrEnum):
     """Confidence level for extracted/assumed field values."""
 
@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
+import base64
+import heapq
+import math
 from datetime import datetime
-from typing import Any
-
-from pydantic import BaseModel, Field, model_validator
-
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationInfo,
+    computed_field,
+    field_validator,
+    model_validator,
+)
+
+from cantena.formatting import format_cost_range, format_currency, format_sf_cost
 from cantena.models.enums import Confidence
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 
 class CostRange(BaseModel):
     """A cost range with low, expected, and high values.
@@ -17,19 +33,23 @@ class CostRange(BaseModel):
     This matches RSMeans ROM estimate accuracy of ±20-25%.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     low: float
     expected: float
     high: float
 
-    @model_validator(mode="after")
-    def low_le_expected_le_high(self) -> CostRange:
-        if not (self.low <= self.expected <= self.high):
-            msg = (
-                f"Must satisfy low <= expected <= high, "
-                f"got {self.low} <= {self.expected} <= {self.high}"
-            )
+    @field_validator("high")
+    @classmethod
+    def low_le_expected_le_high(cls, v: float, info: ValidationInfo) -> float:
+        # Runs last (fields validate in order), so low/expected are in info.data
+        # unless they already failed their own float validation.
+        low = info.data.get("low", -math.inf)
+        expected = info.data.get("expected", low)
+        if not (low <= expected <= v):
+            msg = f"Must satisfy low <= expected <= high, got {low} <= {expected} <= {v}"
             raise ValueError(msg)
-        return self
+        return v
 
     def __format__(self, format_spec: str) -> str:
         """Delegate formatting to the expected value."""
@@ -114,13 +134,35 @@ class SpaceCost(BaseModel):
     source: str
 
 
+def _trusted_division_cost(data: dict[str, Any]) -> DivisionCost:
+    """Construct a DivisionCost (and its nested models) without validation."""
+    return DivisionCost.model_construct(
+        **{
+            **data,
+            "cost": CostRange.model_construct(**data["cost"]),
+            "geometry_refs": [
+                GeometryRef.model_construct(**g) for g in data.get("geometry_refs", [])
+            ],
+        }
+    )
+
+
+# cached_property names on CostEstimate, cleared by model_copy.
+_CACHED_DICTS = ("summary_dict", "export_dict")
+
+
 class CostEstimate(BaseModel):
     """Complete cost estimate output from the Cantena engine.
 
     This is the primary output model, containing the full breakdown
     of costs by CSI division with confidence ranges.
+
+    Estimates are frozen, so the summary and export dicts are built once
+    per instance and cached; treat the returned dicts as read-only.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     project_name: str
     building_summary: BuildingSummary
     total_cost: CostRange
@@ -132,14 +174,68 @@ class CostEstimate(BaseModel):
     metadata: EstimateMetadata
     space_breakdown: list[SpaceCost] | None = None
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any]) -> CostEstimate:
+        """Rebuild an estimate from this engine's own ``model_dump()`` output.
+
+        Uses ``model_construct`` all the way down, so no field validation
+        or CostRange ordering check runs. Only use this for data we wrote
+        ourselves (cache, DB); anything else goes through ``model_validate``.
+        Accepts both python-mode and ``mode="json"`` dumps.
+        """
+        generated_at = data["generated_at"]
+        if isinstance(generated_at, str):
+            generated_at = datetime.fromisoformat(generated_at)
+        space_breakdown = data.get("space_breakdown")
+        return cls.model_construct(
+            project_name=data["project_name"],
+            building_summary=BuildingSummary.model_construct(**data["building_summary"]),
+            total_cost=CostRange.model_construct(**data["total_cost"]),
+            cost_per_sf=CostRange.model_construct(**data["cost_per_sf"]),
+            breakdown=[_trusted_division_cost(d) for d in data["breakdown"]],
+            assumptions=[
+                Assumption.model_construct(**{**a, "confidence": Confidence(a["confidence"])})
+                for a in data["assumptions"]
+            ],
+            generated_at=generated_at,
+            location_factor=data["location_factor"],
+            metadata=EstimateMetadata.model_construct(**data["metadata"]),
+            space_breakdown=(
+                None
+                if space_breakdown is None
+                else [
+                    SpaceCost.model_construct(
+                        **{
+                            **s,
+                            "cost_per_sf": CostRange.model_construct(**s["cost_per_sf"]),
+                            "total_cost": CostRange.model_construct(**s["total_cost"]),
+                        }
+                    )
+                    for s in space_breakdown
+                ]
+            ),
+        )
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> CostEstimate:
+        """Copy the estimate, dropping cached dicts so they reflect ``update``."""
+        copied = super().model_copy(update=update, deep=deep)
+        for name in _CACHED_DICTS:
+            copied.__dict__.pop(name, None)
+        return copied
+
     def to_summary_dict(self) -> dict[str, Any]:
         """Produce a flat summary dict for frontend consumption.
 
         Returns a dict with formatted strings for direct display in a React UI.
         """
-        from cantena.formatting import format_cost_range, format_currency, format_sf_cost
+        return self.summary_dict
 
-        top_drivers = sorted(self.breakdown, key=lambda d: d.cost.expected, reverse=True)[:3]
+    @cached_property
+    def summary_dict(self) -> dict[str, Any]:
+        """Cached result of :meth:`to_summary_dict`."""
+        top_drivers = heapq.nlargest(3, self.breakdown, key=lambda d: d.cost.expected)
 
         return {
             "project_name": self.project_name,
@@ -170,6 +266,11 @@ class CostEstimate(BaseModel):
         Returns a dict with full nested data suitable for generating
         detailed export documents.
         """
+        return self.export_dict
+
+    @cached_property
+    def export_dict(self) -> dict[str, Any]:
+        """Cached result of :meth:`to_export_dict`."""
         return {
             "project_name": self.project_name,
             "building_summary": self.building_summary.model_dump(),
@@ -221,7 +322,11 @@ class SerializedWallSegment(BaseModel):
 
 
 class GeometryPayload(BaseModel):
-    """Top-level geometry data for API responses."""
+    """Top-level geometry data for API responses.
+
+    The page image is held as raw PNG bytes and only base64-encoded when
+    the payload is dumped, as ``page_image_base64``.
+    """
 
     page_width_pts: float
     page_height_pts: float
@@ -229,4 +334,21 @@ class GeometryPayload(BaseModel):
     wall_segments: list[SerializedWallSegment] = Field(default_factory=list)
     outer_boundary: list[list[float]] | None = None
     scale_factor: float | None = None
-    page_image_base64: str | None = None
+    page_image_png: bytes | None = Field(default=None, exclude=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _decode_page_image_base64(cls, data: Any) -> Any:
+        # Accept our own dumped form so payloads round-trip.
+        if isinstance(data, dict) and data.get("page_image_base64") is not None:
+            data = dict(data)
+            data["page_image_png"] = base64.b64decode(data.pop("page_image_base64"))
+        return data
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def page_image_base64(self) -> str | None:
+        """The page image as a base64 string, for ``data:`` URLs."""
+        if self.page_image_png is None:
+            return None
+        return base64.b64encode(self.page_image_png).decode("ascii")
@@ -10,12 +10,13 @@ This ensures the cost engine always has a room-by-room program to price.
 
 from __future__ import annotations
 
+import re
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
 
-from cantena.models.enums import BuildingType, Confidence, RoomType
+from cantena.models.enums import ROOM_TYPE_VALUES, BuildingType, Confidence, RoomType
 
 if TYPE_CHECKING:
     from cantena.geometry.rooms import DetectedRoom
@@ -32,6 +33,9 @@ class SpaceSource(StrEnum):
     USER_OVERRIDE = "user_override"
 
 
+# Per-room area estimate embedded in LLM notes ("estimated_area_sf: 120").
+_ESTIMATED_AREA_RE = re.compile(r"estimated_area_sf\s*:\s*([\d.]+)")
+
 # Map DetectedRoom.label (uppercase, as found on drawings) to RoomType.
 LABEL_TO_ROOM_TYPE: dict[str, RoomType] = {
     "LIVING ROOM": RoomType.LIVING_ROOM,
@@ -73,6 +77,21 @@ LABEL_TO_ROOM_TYPE: dict[str, RoomType] = {
 }
 
 
+def _label_to_room_type(label: str | None) -> RoomType:
+    """Map a drawing label to a RoomType, ignoring a trailing suffix token.
+
+    The full label is tried first; only on a miss is the last token dropped
+    (e.g., "BEDROOM 1" -> "BEDROOM"), so most labels cost one dict probe.
+    """
+    if not label:
+        return RoomType.OTHER
+    label_upper = label.strip().upper()
+    room_type = LABEL_TO_ROOM_TYPE.get(label_upper)
+    if room_type is None and " " in label_upper:
+        room_type = LABEL_TO_ROOM_TYPE.get(label_upper.rsplit(" ", 1)[0])
+    return room_type or RoomType.OTHER
+
+
 class Space(BaseModel):
     """A single space in a space program."""
 
@@ -104,15 +123,7 @@ class SpaceProgram(BaseModel):
         """Build a SpaceProgram from geometry-detected room polygons."""
         spaces: list[Space] = []
         for room in rooms:
-            label_upper = room.label.strip().upper() if room.label else ""
-            # Strip numeric suffix for mapping (e.g., "BEDROOM 1" -> "BEDROOM")
-            base_label = label_upper.rsplit(" ", 1)[0] if label_upper else ""
-
-            room_type = (
-                LABEL_TO_ROOM_TYPE.get(label_upper)
-                or LABEL_TO_ROOM_TYPE.get(base_label)
-                or RoomType.OTHER
-            )
+            room_type = _label_to_room_type(room.label)
             name = room.label if room.label else f"Room {room.room_index}"
             area_sf = room.area_sf if room.area_sf is not None else 0.0
 
@@ -138,16 +149,14 @@ class SpaceProgram(BaseModel):
         (``estimated_area_sf: <number>``).  Falls back to equal
         distribution if no estimates are found.
         """
-        import re
-
         spaces: list[Space] = []
         estimated_areas: dict[int, float] = {}
 
         # First pass: extract any area estimates from notes
         for i, llm_room in enumerate(interp.rooms):
-            match = re.search(
-                r"estimated_area_sf\s*:\s*([\d.]+)", llm_room.notes
-            )
+            if not llm_room.notes:
+                continue
+            match = _ESTIMATED_AREA_RE.search(llm_room.notes)
             if match:
                 estimated_areas[i] = float(match.group(1))
 
@@ -155,12 +164,26 @@ class SpaceProgram(BaseModel):
         has_estimates = bool(estimated_areas)
         estimated_total = sum(estimated_areas.values()) if has_estimates else 0.0
 
+        # Share of the remainder for each room without an estimate; the
+        # remainder is loop-invariant, so compute it once.
+        remainder_share = 0.0
+        if has_estimates:
+            remaining = total_area_sf - sum(
+                estimated_areas[j] / estimated_total * total_area_sf
+                for j in estimated_areas
+            ) if estimated_total > 0 else total_area_sf
+            unestimated_count = len(interp.rooms) - len(estimated_areas)
+            if unestimated_count > 0:
+                remainder_share = remaining / unestimated_count
+
         for i, llm_room in enumerate(interp.rooms):
             # Try to map LLM room_type_enum string to RoomType
-            try:
-                room_type = RoomType(llm_room.room_type_enum.lower())
-            except ValueError:
-                room_type = RoomType.OTHER
+            room_type_value = llm_room.room_type_enum.lower()
+            room_type = (
+                RoomType(room_type_value)
+                if room_type_value in ROOM_TYPE_VALUES
+                else RoomType.OTHER
+            )
 
             if has_estimates and i in estimated_areas:
                 # Use the LLM's area estimate, scaled to match total
@@ -172,16 +195,7 @@ class SpaceProgram(BaseModel):
                     area_sf = estimated_areas[i]
             elif has_estimates:
                 # This room has no estimate; give it a share of the remainder
-                remaining = total_area_sf - sum(
-                    estimated_areas[j] / estimated_total * total_area_sf
-                    for j in estimated_areas
-                ) if estimated_total > 0 else total_area_sf
-                unestimated_count = len(interp.rooms) - len(estimated_areas)
-                area_sf = (
-                    remaining / unestimated_count
-                    if unestimated_count > 0
-                    else 0.0
-                )
+                area_sf = remainder_share
             else:
                 # No estimates at all — equal split
                 area_sf = (
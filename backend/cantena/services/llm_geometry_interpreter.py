@@ -8,8 +8,12 @@ and enriches computed geometry rather than guessing measurements from pixels.
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
 import logging
+import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -21,6 +25,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Text blocks listed in the prompt; the rest are only counted.
+_MAX_TEXT_BLOCKS = 50
+
+# Parsed interpretations kept per LlmGeometryInterpreter instance.
+_INTERPRETATION_MEMO_SIZE = 64
+
+# Body of the first ```json ... ``` (or bare ```) code fence.
+_JSON_FENCE_RE = re.compile(r"```(?:json)?(.*?)```", re.DOTALL)
+
 
 # ---------------------------------------------------------------------------
 # Data models
@@ -158,7 +171,12 @@ _SYSTEM_PROMPT = (
 
 
 class LlmGeometryInterpreter:
-    """Sends extracted geometry to Claude for semantic interpretation."""
+    """Sends extracted geometry to Claude for semantic interpretation.
+
+    Parsed interpretations are memoized per instance in a small LRU keyed
+    by a hash of the model, the serialized summary and the page image, so
+    re-analyzing an unchanged drawing skips the API.
+    """
 
     def __init__(
         self,
@@ -171,6 +189,8 @@ class LlmGeometryInterpreter:
             timeout=timeout,
         )
         self._model = model
+        self._memo: OrderedDict[str, LlmInterpretation] = OrderedDict()
+        self._memo_lock = threading.Lock()
 
     def interpret(
         self,
@@ -195,9 +215,16 @@ class LlmGeometryInterpreter:
             user_content = self._build_user_content(
                 geometry_summary, page_image_path
             )
+            key = self._memo_key(user_content)
+            with self._memo_lock:
+                cached = self._memo.get(key)
+                if cached is not None:
+                    self._memo.move_to_end(key)
+                    return cached
             raw_response = self._call_api(user_content)
             result = self._parse_response(raw_response)
             if result is not None:
+                self._remember(key, result)
                 return result
             logger.warning("Could not parse LLM geometry response")
             return _DEFAULT_INTERPRETATION
@@ -219,13 +246,13 @@ class LlmGeometryInterpreter:
 
         # Optionally include page image.
         if image_path is not None and image_path.exists():
-            image_data = base64.b64encode(
-                image_path.read_bytes()
-            ).decode("utf-8")
-            suffix = image_path.suffix.lower()
-            media_type: Literal[
-                "image/jpeg", "image/png", "image/gif", "image/webp"
-            ] = "image/jpeg" if suffix in {".jpg", ".jpeg"} else "image/png"
+            image_bytes = image_path.read_bytes()
+            media_type = _sniff_media_type(image_bytes)
+            encoded = base64.b64encode(image_bytes)
+            # Release the raw bytes before decoding so they are not alive
+            # alongside both the encoded bytes and the str.
+            del image_bytes
+            image_data = encoded.decode("ascii")
             parts.append(
                 ImageBlockParam(
                     type="image",
@@ -242,6 +269,27 @@ class LlmGeometryInterpreter:
         parts.append(TextBlockParam(type="text", text=text))
         return parts
 
+    def _memo_key(
+        self, user_content: list[ImageBlockParam | TextBlockParam]
+    ) -> str:
+        """Hash the model and every text/image part of a request."""
+        digest = hashlib.blake2b(self._model.encode(), digest_size=16)
+        for part in user_content:
+            if part["type"] == "image":
+                data = part["source"].get("data", "")
+                digest.update(b"\0image\0" + str(data).encode("ascii"))
+            else:
+                digest.update(b"\0text\0" + part["text"].encode())
+        return digest.hexdigest()
+
+    def _remember(self, key: str, result: LlmInterpretation) -> None:
+        """Add *result* to the LRU, evicting the oldest entry."""
+        with self._memo_lock:
+            self._memo[key] = result
+            self._memo.move_to_end(key)
+            if len(self._memo) > _INTERPRETATION_MEMO_SIZE:
+                self._memo.popitem(last=False)
+
     def _call_api(
         self,
         user_content: list[ImageBlockParam | TextBlockParam],
@@ -302,35 +350,35 @@ def _serialize_geometry_summary(summary: GeometrySummary) -> str:
                 f"- Room {room.room_index}: {label} — {area}, {perim}"
             )
 
-    if summary.all_text_blocks:
-        lines.append(f"\n### Text Blocks ({len(summary.all_text_blocks)})\n")
-        # Show up to 50 text blocks to keep context manageable.
-        for tb in summary.all_text_blocks[:50]:
-            lines.append(f"- {tb}")
-        if len(summary.all_text_blocks) > 50:
-            lines.append(
-                f"... and {len(summary.all_text_blocks) - 50} more"
-            )
+    n_blocks = len(summary.all_text_blocks)
+    if n_blocks:
+        lines.append(f"\n### Text Blocks ({n_blocks})\n")
+        # Cap the listed blocks to keep context manageable.
+        lines.extend(f"- {tb}" for tb in summary.all_text_blocks[:_MAX_TEXT_BLOCKS])
+        if n_blocks > _MAX_TEXT_BLOCKS:
+            lines.append(f"... and {n_blocks - _MAX_TEXT_BLOCKS} more")
 
     return "\n".join(lines)
 
 
-def _extract_json(text: str) -> str | None:
-    """Extract JSON from ```json ... ``` code fences."""
-    start = text.find("```json")
-    if start == -1:
-        start = text.find("```")
-        if start == -1:
-            return None
-        start += 3
-    else:
-        start += 7
+_ImageMediaType = Literal["image/jpeg", "image/png", "image/gif", "image/webp"]
 
-    end = text.find("```", start)
-    if end == -1:
-        return None
 
-    return text[start:end].strip()
+def _sniff_media_type(image_bytes: bytes) -> _ImageMediaType:
+    """Pick the image media type from magic bytes, defaulting to PNG."""
+    if image_bytes.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if image_bytes.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if image_bytes[:4] == b"RIFF" and image_bytes[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/png"
+
+
+def _extract_json(text: str) -> str | None:
+    """Extract JSON from ```json ... ``` code fences."""
+    match = _JSON_FENCE_RE.search(text)
+    return match.group(1).strip() if match else None
 
 
 def _build_interpretation(data: dict[str, Any]) -> LlmInterpretation | None:
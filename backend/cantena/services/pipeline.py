@@ -321,8 +321,6 @@ class AnalysisPipeline:
         best_page: PageResult,
     ) -> GeometryPayload | None:
         """Build a GeometryPayload from measurements and page image."""
-        import base64
-
         from cantena.models.estimate import (
             GeometryPayload,
             SerializedRoom,
@@ -400,15 +398,12 @@ class AnalysisPipeline:
                 list(pt) for pt in measurements.outer_boundary_polygon
             ]
 
-        # Read page image as base64
-        page_image_base64: str | None = None
+        # Read page image; GeometryPayload base64-encodes it on dump
+        page_image_png: bytes | None = None
         try:
             image_path = best_page.image_path
             if image_path.exists():
-                image_bytes = image_path.read_bytes()
-                page_image_base64 = base64.b64encode(
-                    image_bytes
-                ).decode("ascii")
+                page_image_png = image_path.read_bytes()
         except Exception:
             logger.warning(
                 "Failed to read page image for geometry payload",
@@ -425,7 +420,7 @@ class AnalysisPipeline:
                 measurements.scale.scale_factor
                 if measurements.scale else None
             ),
-            page_image_base64=page_image_base64,
+            page_image_png=page_image_png,
         )
 
     @staticmethod
@@ -19,7 +19,7 @@ if TYPE_CHECKING:
     from cantena.models.building import BuildingModel
     from cantena.services.llm_geometry_interpreter import LlmInterpretation
 
-from cantena.models.enums import Confidence, RoomType
+from cantena.models.enums import ROOM_TYPE_VALUES, Confidence, RoomType
 from cantena.models.space_program import (
     LABEL_TO_ROOM_TYPE,
     Space,
@@ -31,6 +31,7 @@ logger = logging.getLogger(__name__)
 
 # WC / bathroom typical max area in SF — flag if larger.
 _WC_MAX_AREA_SF = 150.0
+_WC_ROOM_TYPES = frozenset({RoomType.WC, RoomType.BATHROOM, RoomType.RESTROOM})
 
 
 class SpaceAssembler:
@@ -154,12 +155,9 @@ class SpaceAssembler:
                     mapped = LABEL_TO_ROOM_TYPE.get(label_upper)
                     if mapped is None:
                         # Try room_type_enum directly
-                        try:
-                            mapped = RoomType(
-                                llm_room.room_type_enum.lower()
-                            )
-                        except ValueError:
-                            mapped = None
+                        room_type_value = llm_room.room_type_enum.lower()
+                        if room_type_value in ROOM_TYPE_VALUES:
+                            mapped = RoomType(room_type_value)
 
                     if mapped is not None:
                         space = Space(
@@ -176,10 +174,12 @@ class SpaceAssembler:
         geometry_indices = set(range(len(program.spaces)))
         for llm_room in llm_interp.rooms:
             if llm_room.room_index not in geometry_indices:
-                try:
-                    room_type = RoomType(llm_room.room_type_enum.lower())
-                except ValueError:
-                    room_type = RoomType.OTHER
+                room_type_value = llm_room.room_type_enum.lower()
+                room_type = (
+                    RoomType(room_type_value)
+                    if room_type_value in ROOM_TYPE_VALUES
+                    else RoomType.OTHER
+                )
                 updated_spaces.append(Space(
                     room_type=room_type,
                     name=llm_room.confirmed_label,
@@ -197,7 +197,7 @@ class SpaceAssembler:
 def _flag_anomalies(space: Space) -> None:
     """Log warnings for anomalous room data."""
     if (
-        space.room_type in (RoomType.WC, RoomType.BATHROOM, RoomType.RESTROOM)
+        space.room_type in _WC_ROOM_TYPES
         and space.area_sf > _WC_MAX_AREA_SF
     ):
         logger.warning(
@@ -219,6 +219,18 @@ class TestCloseGaps:
         assert len(result) == 1
         assert result[0].length_pts == pytest.approx(400, abs=5)
 
+    def test_unsorted_and_contained_segments_merged(self) -> None:
+        """Out-of-order input and a segment nested inside another merge."""
+        segs = [
+            _seg((390, 200), (500, 200)),
+            _seg((100, 200), (350, 200)),
+            _seg((150, 200), (200, 200)),  # fully inside the previous one
+        ]
+        result = close_gaps(segs, max_gap_pts=60)
+        assert len(result) == 1
+        assert result[0].start.x == pytest.approx(100, abs=1)
+        assert result[0].end.x == pytest.approx(500, abs=1)
+
     def test_no_segments(self) -> None:
         assert close_gaps([]) == []
 
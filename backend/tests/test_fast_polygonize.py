@@ -0,0 +1,92 @@
+"""Tests for cantena.geometry.fast_polygonize — grid face tracing."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import shapely
+
+from cantena.geometry.fast_polygonize import fast_polygonize
+
+
+def _rect(x: float, y: float, w: float, h: float) -> list[tuple[float, ...]]:
+    return [
+        (x, y, x + w, y),
+        (x + w, y, x + w, y + h),
+        (x + w, y + h, x, y + h),
+        (x, y + h, x, y),
+    ]
+
+
+class TestFastPolygonize:
+    def test_single_rectangle(self) -> None:
+        polygons = fast_polygonize(np.array(_rect(100, 100, 200, 150)), 1.0)
+        assert polygons is not None
+        assert len(polygons) == 1
+        assert shapely.area(polygons[0]) == pytest.approx(30000.0)
+
+    def test_shared_wall_gives_two_rooms(self) -> None:
+        segs = _rect(100, 100, 400, 150) + [(300, 100, 300, 250)]
+        polygons = fast_polygonize(np.array(segs), 1.0)
+        assert polygons is not None
+        assert sorted(shapely.area(polygons).tolist()) == pytest.approx(
+            [30000.0, 30000.0]
+        )
+
+    def test_near_miss_closed_by_extension(self) -> None:
+        segs = [
+            (100, 100, 299.5, 100),
+            (300, 100.5, 300, 250),
+            (300, 250, 100, 250),
+            (100, 250, 100, 100),
+        ]
+        polygons = fast_polygonize(np.array(segs), 1.0)
+        assert polygons is not None
+        assert len(polygons) == 1
+        assert shapely.area(polygons[0]) == pytest.approx(30000.0, rel=0.01)
+
+    def test_dangling_stub_ignored(self) -> None:
+        segs = _rect(100, 100, 200, 150) + [(300, 175, 400, 175)]
+        polygons = fast_polygonize(np.array(segs), 1.0)
+        assert polygons is not None
+        assert len(polygons) == 1
+
+    def test_matches_shapely_on_grid(self) -> None:
+        from shapely.ops import polygonize
+
+        segs = (
+            _rect(0, 0, 300, 200)
+            + [(100, 0, 100, 200), (100, 120, 300, 120), (200, 120, 200, 200)]
+        )
+        polygons = fast_polygonize(np.array(segs), 0.0)
+        ref = list(polygonize(shapely.union_all(shapely.linestrings(
+            np.array(segs).reshape(-1, 2, 2)
+        ))))
+        assert polygons is not None
+        assert sorted(shapely.area(polygons).tolist()) == pytest.approx(
+            sorted(p.area for p in ref)
+        )
+
+    def test_diagonal_segment_falls_back(self) -> None:
+        segs = _rect(100, 100, 200, 150) + [(100, 100, 300, 250)]
+        assert fast_polygonize(np.array(segs), 1.0) is None
+
+    def test_skewed_wall_falls_back(self) -> None:
+        # East wall leans 3 pt over its height; flattening it onto one
+        # grid line would open both of its corners.
+        segs = [
+            (100, 100, 250, 100), (250, 100, 400, 100),
+            (100, 250, 250, 250), (250, 250, 403, 250),
+            (100, 100, 100, 250), (250, 100, 250, 250),
+            (400, 100, 403, 250),
+        ]
+        assert fast_polygonize(np.array(segs), 1.0) is None
+
+    def test_disconnected_components_fall_back(self) -> None:
+        segs = _rect(0, 0, 400, 400) + _rect(100, 100, 50, 50)
+        assert fast_polygonize(np.array(segs), 1.0) is None
+
+    def test_no_cycles_returns_empty(self) -> None:
+        polygons = fast_polygonize(np.array([(0, 0, 100, 0)]), 1.0)
+        assert polygons is not None
+        assert len(polygons) == 0
@@ -0,0 +1,38 @@
+"""Tests for cantena.geometry.kernels — vectorized ring kernels."""
+
+from __future__ import annotations
+
+import pytest
+
+from cantena.geometry.kernels import as_xy, perimeter_xy, polygon_area_xy
+
+
+class TestPerimeterXy:
+    def test_open_square(self) -> None:
+        xy = as_xy([(0, 0), (10, 0), (10, 10), (0, 10)])
+        assert perimeter_xy(xy) == pytest.approx(40.0)
+
+    def test_closed_ring_same_as_open(self) -> None:
+        xy = as_xy([(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)])
+        assert perimeter_xy(xy) == pytest.approx(40.0)
+
+    def test_triangle(self) -> None:
+        xy = as_xy([(0, 0), (3, 0), (3, 4)])
+        assert perimeter_xy(xy) == pytest.approx(12.0)
+
+    def test_degenerate(self) -> None:
+        assert perimeter_xy(as_xy([])) == 0.0
+        assert perimeter_xy(as_xy([(5, 5)])) == 0.0
+
+
+class TestPolygonAreaXy:
+    def test_square(self) -> None:
+        xy = as_xy([(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)])
+        assert polygon_area_xy(xy) == pytest.approx(100.0)
+
+    def test_orientation_independent(self) -> None:
+        xy = as_xy([(0, 0), (0, 10), (20, 10), (20, 0)])
+        assert polygon_area_xy(xy) == pytest.approx(200.0)
+
+    def test_degenerate(self) -> None:
+        assert polygon_area_xy(as_xy([(0, 0), (1, 1)])) == 0.0
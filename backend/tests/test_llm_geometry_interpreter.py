@@ -14,6 +14,7 @@ from cantena.services.llm_geometry_interpreter import (
     GeometrySummary,
     LlmGeometryInterpreter,
     RoomSummary,
+    _extract_json,
     _serialize_geometry_summary,
 )
 
@@ -268,6 +269,19 @@ class TestMalformedResponse:
         assert result.rooms == []
 
 
+class TestExtractJson:
+    def test_json_fence(self) -> None:
+        text = 'Reasoning first.\n```json\n{"a": 1}\n```\nTrailing.'
+        assert _extract_json(text) == '{"a": 1}'
+
+    def test_bare_fence(self) -> None:
+        assert _extract_json('```\n{"a": 1}\n```') == '{"a": 1}'
+
+    def test_no_fence_or_unterminated(self) -> None:
+        assert _extract_json('{"a": 1}') is None
+        assert _extract_json('```json\n{"a": 1}') is None
+
+
 # ---------------------------------------------------------------------------
 # Tests: timeout and API error fallback
 # ---------------------------------------------------------------------------
@@ -441,6 +455,77 @@ class TestVisionInput:
         image_parts = [p for p in user_content if p["type"] == "image"]
         assert len(image_parts) == 0
 
+    def test_media_type_sniffed_from_bytes(
+        self,
+        interpreter: LlmGeometryInterpreter,
+        sample_image: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Media type follows the file contents, not the suffix."""
+        jpeg_named_png = tmp_path / "page.PNG"
+        jpeg_named_png.write_bytes(b"\xff\xd8\xff\xe0" + b"\x00" * 16)
+        summary = _make_summary()
+
+        content = interpreter._build_user_content(summary, jpeg_named_png)
+        assert content[0]["source"]["media_type"] == "image/jpeg"  # type: ignore[typeddict-item]
+
+        content = interpreter._build_user_content(summary, sample_image)
+        assert content[0]["source"]["media_type"] == "image/png"  # type: ignore[typeddict-item]
+
+
+# ---------------------------------------------------------------------------
+# Tests: interpretation memo
+# ---------------------------------------------------------------------------
+
+
+class TestInterpretationMemo:
+    def test_repeat_request_skips_api(
+        self,
+        interpreter: LlmGeometryInterpreter,
+        sample_image: Path,
+    ) -> None:
+        mock_response = _mock_api_response(_make_interpretation_json())
+
+        with patch.object(
+            interpreter._client.messages, "create", return_value=mock_response
+        ) as mock_create:
+            first = interpreter.interpret(_make_summary(), page_image_path=sample_image)
+            second = interpreter.interpret(_make_summary(), page_image_path=sample_image)
+
+        assert mock_create.call_count == 1
+        assert second is first
+
+    def test_changed_input_calls_api(
+        self,
+        interpreter: LlmGeometryInterpreter,
+        sample_image: Path,
+    ) -> None:
+        mock_response = _mock_api_response(_make_interpretation_json())
+
+        with patch.object(
+            interpreter._client.messages, "create", return_value=mock_response
+        ) as mock_create:
+            interpreter.interpret(_make_summary(), page_image_path=sample_image)
+            interpreter.interpret(_make_summary(), page_image_path=None)
+
+        assert mock_create.call_count == 2
+
+    def test_unparseable_reply_not_cached(
+        self,
+        interpreter: LlmGeometryInterpreter,
+    ) -> None:
+        bad = _mock_api_response("no json here")
+        good = _mock_api_response(_make_interpretation_json())
+
+        with patch.object(
+            interpreter._client.messages, "create", side_effect=[bad, good]
+        ) as mock_create:
+            interpreter.interpret(_make_summary())
+            result = interpreter.interpret(_make_summary())
+
+        assert mock_create.call_count == 2
+        assert result.rooms
+
 
 # ---------------------------------------------------------------------------
 # Tests: default interpretation model
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import multiprocessing
 import tempfile
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import fitz  # type: ignore[import-untyped]
+import numpy as np
 import pytest
 
 from cantena.geometry.extractor import (
     BoundingRect,
+    DrawingData,
     PathType,
     Point2D,
     VectorExtractor,
@@ -18,6 +23,7 @@ from cantena.geometry.extractor import (
 from cantena.geometry.measurement import (
     MeasurementConfidence,
     MeasurementService,
+    _detect_from_text_cached,
     pts_to_real_lf,
     pts_to_real_sf,
 )
@@ -25,9 +31,20 @@ from cantena.geometry.scale import (
     Confidence,
     ScaleDetector,
     ScaleResult,
+    TextBlock,
+)
+from cantena.geometry.scale_verify import (
+    ScaleVerificationResult,
+    ScaleVerifier,
 )
 from cantena.geometry.walls import WallDetector
 
+if TYPE_CHECKING:
+    from cantena.services.llm_geometry_interpreter import (
+        GeometrySummary,
+        LlmInterpretation,
+    )
+
 
 def _make_line(
     p1: tuple[float, float],
@@ -104,6 +121,13 @@ class TestConversionFunctions:
         result = pts_to_real_lf(72.0, _SCALE_1_8)
         assert result == pytest.approx(8.0, rel=0.01)
 
+    def test_conversions_broadcast_over_arrays(self) -> None:
+        """Both converters accept ndarrays and convert element-wise."""
+        areas = pts_to_real_sf(np.array([900.0 * 450.0, 0.0]), _SCALE_1_8)
+        lengths = pts_to_real_lf(np.array([2700.0, 72.0]), _SCALE_1_8)
+        assert areas.tolist() == pytest.approx([5000.0, 0.0])
+        assert lengths.tolist() == pytest.approx([300.0, 8.0])
+
 
 class TestMeasurementServiceKnownPDF:
     """Test full pipeline with a PDF containing a known-size rectangle."""
@@ -263,3 +287,236 @@ class TestMissingScale:
             assert "estimated" in result.scale.notation
         finally:
             pdf_path.unlink(missing_ok=True)
+
+
+class TestDetectFromTextCache:
+    def test_repeated_text_parsed_once(self) -> None:
+        calls: list[str] = []
+
+        class CountingDetector(ScaleDetector):
+            def detect_from_text(self, page_text: str) -> ScaleResult | None:
+                calls.append(page_text)
+                return super().detect_from_text(page_text)
+
+        detector = CountingDetector()
+        text = "FLOOR PLAN SCALE: 3/16\"=1'-0\" unique-cache-test"
+        first = _detect_from_text_cached(detector, text)
+        second = _detect_from_text_cached(detector, text)
+
+        assert first is not None
+        assert first.scale_factor == pytest.approx(64.0)
+        assert second is first
+        assert calls == [text]
+
+    def test_misses_are_cached(self) -> None:
+        text = "no scale here unique-cache-test"
+        assert _detect_from_text_cached(ScaleDetector(), text) is None
+        assert _detect_from_text_cached(ScaleDetector(), text) is None
+
+
+class TestDetectScale:
+    def test_split_arch_notation_beats_metric_block(self) -> None:
+        texts = ['SCALE: 1/4"', "= 1'-0\"", "DETAIL 3  1:20"]
+
+        class FixedTextDetector(ScaleDetector):
+            def extract_text_blocks(self, page: fitz.Page) -> list[TextBlock]:
+                return [
+                    TextBlock(
+                        text=t,
+                        position=Point2D(0, 0),
+                        bounding_rect=BoundingRect(x=0, y=0, width=10, height=10),
+                    )
+                    for t in texts
+                ]
+
+        service = MeasurementService(
+            VectorExtractor(), FixedTextDetector(), WallDetector()
+        )
+        data = DrawingData(
+            paths=[], page_width_pts=1200, page_height_pts=800,
+            page_size_inches=(1200 / 72, 800 / 72),
+        )
+
+        _, scale = service._detect_scale(fitz.open().new_page(), data)
+
+        assert scale is not None
+        assert scale.scale_factor == pytest.approx(48.0)
+
+
+class _RecordingInterpreter:
+    """Stand-in interpreter that, like the real one, holds a lock."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.summaries: list[GeometrySummary] = []
+
+    def interpret(self, summary: GeometrySummary) -> LlmInterpretation | None:
+        with self._lock:
+            self.summaries.append(summary)
+        return None
+
+
+class _CountingExtractor(VectorExtractor):
+    """Extractor that appends a line to *log_path* on every call."""
+
+    def __init__(self, log_path: Path) -> None:
+        self._log_path = log_path
+
+    def extract(self, page: fitz.Page) -> DrawingData:
+        with self._log_path.open("a") as log:
+            log.write(f"{page.number}\n")
+        return super().extract(page)
+
+
+class _RecoveringVerifier:
+    """Stand-in verifier that recovers 1/4"=1'-0" on every page."""
+
+    _SCALE = ScaleResult(
+        drawing_units=0.25,
+        real_units=12.0,
+        scale_factor=48.0,
+        notation="1/4\"=1'-0\"",
+        confidence=Confidence.HIGH,
+    )
+
+    def _result(self) -> ScaleVerificationResult:
+        return ScaleVerificationResult(
+            scale=self._SCALE, verification_source="LLM_RECOVERED"
+        )
+
+    def verify_or_recover_scale(
+        self, page: fitz.Page, detected: ScaleResult | None,
+        text_blocks: list[TextBlock],
+    ) -> ScaleVerificationResult:
+        return self._result()
+
+    async def verify_or_recover_scale_async(
+        self, page: fitz.Page, detected: ScaleResult | None,
+        text_blocks: list[TextBlock],
+    ) -> ScaleVerificationResult:
+        return self._result()
+
+
+class TestMeasurePages:
+    def _write_pdf(self, path: Path, note: str = "SCALE: 1/8\"=1'-0\"") -> None:
+        doc = fitz.open()
+        for width in (300.0, 500.0):
+            page = doc.new_page(width=1200, height=800)
+            shape = page.new_shape()
+            x0, y0, x1, y1 = 100.0, 100.0, 100.0 + width, 400.0
+            for a, b in [
+                ((x0, y0), (x1, y0)),
+                ((x1, y0), (x1, y1)),
+                ((x1, y1), (x0, y1)),
+                ((x0, y1), (x0, y0)),
+            ]:
+                shape.draw_line(fitz.Point(*a), fitz.Point(*b))
+                shape.finish(color=(0, 0, 0), width=2.0)
+            shape.commit()
+            page.insert_text((100, 700), note, fontsize=10)
+        doc.save(str(path))
+        doc.close()
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_results_match_serial_in_order(
+        self, tmp_path: Path, workers: int
+    ) -> None:
+        pdf_path = tmp_path / "two_pages.pdf"
+        self._write_pdf(pdf_path)
+        service = MeasurementService(
+            extractor=VectorExtractor(),
+            scale_detector=ScaleDetector(),
+            wall_detector=WallDetector(),
+        )
+
+        results = service.measure_pages(str(pdf_path), [1, 0], workers=workers)
+
+        with fitz.open(str(pdf_path)) as doc:
+            expected = [service.measure(doc[1]), service.measure(doc[0])]
+        assert [r.gross_area_sf for r in results] == pytest.approx(
+            [e.gross_area_sf for e in expected]
+        )
+        assert results[0].gross_area_sf > results[1].gross_area_sf
+
+    def test_spawn_with_llm_components(self, tmp_path: Path) -> None:
+        pdf_path = tmp_path / "two_pages.pdf"
+        self._write_pdf(pdf_path)
+        interpreter = _RecordingInterpreter()
+        service = MeasurementService(
+            extractor=VectorExtractor(),
+            scale_detector=ScaleDetector(),
+            wall_detector=WallDetector(),
+            llm_interpreter=interpreter,  # type: ignore[arg-type]
+            scale_verifier=ScaleVerifier(api_key="test-key"),
+        )
+
+        results = service.measure_pages(
+            str(pdf_path),
+            [1, 0],
+            workers=2,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+        with fitz.open(str(pdf_path)) as doc:
+            expected = [service.measure(doc[1]), service.measure(doc[0])]
+        assert [r.gross_area_sf for r in results] == pytest.approx(
+            [e.gross_area_sf for e in expected]
+        )
+        assert [r.scale_verification for r in results] == [
+            e.scale_verification for e in expected
+        ]
+        assert all(
+            r.scale_verification is not None
+            and r.scale_verification.verification_source == "TEXT_CONFIRMED"
+            for r in results
+        )
+        # Two pages in measure_pages, then the same two serially.
+        assert len(interpreter.summaries) == 4
+        assert interpreter.summaries[:2] == interpreter.summaries[2:]
+
+    def test_confirmed_pages_are_extracted_once(self, tmp_path: Path) -> None:
+        pdf_path = tmp_path / "two_pages.pdf"
+        self._write_pdf(pdf_path)
+        log_path = tmp_path / "extract.log"
+        service = MeasurementService(
+            extractor=_CountingExtractor(log_path),
+            scale_detector=ScaleDetector(),
+            wall_detector=WallDetector(),
+            scale_verifier=ScaleVerifier(api_key="test-key"),
+        )
+
+        results = service.measure_pages(
+            str(pdf_path), [0, 1], workers=2,
+            mp_context=multiprocessing.get_context("fork"),
+        )
+
+        assert sorted(log_path.read_text().split()) == ["0", "1"]
+        assert all(
+            r.scale_verification is not None
+            and r.scale_verification.verification_source == "TEXT_CONFIRMED"
+            for r in results
+        )
+
+    def test_recovered_scale_remeasures_page(self, tmp_path: Path) -> None:
+        pdf_path = tmp_path / "two_pages.pdf"
+        self._write_pdf(pdf_path, note="FIRST FLOOR PLAN")
+        service = MeasurementService(
+            extractor=VectorExtractor(),
+            scale_detector=ScaleDetector(),
+            wall_detector=WallDetector(),
+            scale_verifier=_RecoveringVerifier(),  # type: ignore[arg-type]
+        )
+
+        results = service.measure_pages(str(pdf_path), [1, 0], workers=2)
+
+        with fitz.open(str(pdf_path)) as doc:
+            expected = [service.measure(doc[1]), service.measure(doc[0])]
+        assert [r.scale for r in results] == [e.scale for e in expected]
+        assert [r.confidence for r in results] == [
+            e.confidence for e in expected
+        ]
+        assert [r.gross_area_sf for r in results] == pytest.approx(
+            [e.gross_area_sf for e in expected]
+        )
+        assert results[0].scale is not None
+        assert results[0].scale.scale_factor == 48.0
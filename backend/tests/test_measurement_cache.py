@@ -0,0 +1,147 @@
+"""Tests for cantena.geometry.measurement_cache — content-hash measurement cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import fitz  # type: ignore[import-untyped]
+import pytest
+
+from cantena.geometry.extractor import VectorExtractor
+from cantena.geometry.measurement import MeasurementService
+from cantena.geometry.measurement_cache import (
+    cache_key,
+    compute_page_hash,
+    read_cache,
+    write_cache,
+)
+from cantena.geometry.scale import ScaleDetector
+from cantena.geometry.walls import WallDetector
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _make_doc(offset: float = 0.0) -> fitz.Document:
+    """Create an in-memory PDF with a 900x450 pt rectangle and a scale note."""
+    doc = fitz.open()
+    page = doc.new_page(width=1200, height=800)
+    shape = page.new_shape()
+    x0, y0 = 100.0 + offset, 100.0
+    x1, y1 = 1000.0, 550.0
+    for a, b in [
+        ((x0, y0), (x1, y0)),
+        ((x1, y0), (x1, y1)),
+        ((x1, y1), (x0, y1)),
+        ((x0, y1), (x0, y0)),
+    ]:
+        shape.draw_line(fitz.Point(*a), fitz.Point(*b))
+        shape.finish(color=(0, 0, 0), width=2.0)
+    shape.commit()
+    page.insert_text((100, 700), "SCALE: 1/8\"=1'-0\"", fontsize=10)
+    return doc
+
+
+def _placed_doc(offset: float = 0.0) -> fitz.Document:
+    """Place ``_make_doc(offset)`` on a new page as a Form XObject."""
+    doc = fitz.open()
+    page = doc.new_page(width=1200, height=800)
+    page.show_pdf_page(page.rect, _make_doc(offset), 0)
+    return doc
+
+
+def _service(cache_dir: Path) -> MeasurementService:
+    return MeasurementService(
+        VectorExtractor(), ScaleDetector(), WallDetector(), cache_dir=cache_dir,
+    )
+
+
+class TestPageHash:
+    def test_same_content_same_hash(self) -> None:
+        assert compute_page_hash(_make_doc()[0]) == compute_page_hash(_make_doc()[0])
+
+    def test_different_content_different_hash(self) -> None:
+        assert compute_page_hash(_make_doc()[0]) != compute_page_hash(
+            _make_doc(offset=5.0)[0]
+        )
+
+    def test_form_xobject_pages_do_not_collide(self) -> None:
+        a, b = _placed_doc()[0], _placed_doc(offset=5.0)[0]
+        assert a.read_contents() == b.read_contents()
+        assert compute_page_hash(a) != compute_page_hash(b)
+
+    def test_same_placed_content_same_hash(self) -> None:
+        assert compute_page_hash(_placed_doc()[0]) == compute_page_hash(
+            _placed_doc()[0]
+        )
+
+    def test_variant_changes_key(self) -> None:
+        assert cache_key("abc", "llm=True") != cache_key("abc", "llm=False")
+
+
+class TestReadWriteCache:
+    def test_miss_returns_none(self, tmp_path: Path) -> None:
+        assert read_cache(tmp_path, "missing") is None
+
+    def test_corrupt_entry_returns_none(self, tmp_path: Path) -> None:
+        (tmp_path / "bad.json").write_text("{not json")
+        assert read_cache(tmp_path, "bad") is None
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        svc = MeasurementService(VectorExtractor(), ScaleDetector(), WallDetector())
+        result = svc.measure(_make_doc()[0])
+        write_cache(tmp_path, "k", result)
+        cached = read_cache(tmp_path, "k")
+
+        assert cached is not None
+        assert cached.scale == result.scale
+        assert cached.gross_area_sf == pytest.approx(result.gross_area_sf)
+        assert cached.confidence == result.confidence
+        assert cached.rooms == result.rooms
+        assert cached.wall_segments == result.wall_segments
+        assert cached.outer_boundary_polygon == result.outer_boundary_polygon
+        # raw_data is a stub carrying page dimensions only
+        assert cached.raw_data.paths == []
+        assert cached.raw_data.page_width_pts == result.raw_data.page_width_pts
+
+    def test_write_leaves_no_temp_files(self, tmp_path: Path) -> None:
+        svc = MeasurementService(VectorExtractor(), ScaleDetector(), WallDetector())
+        result = svc.measure(_make_doc()[0])
+        write_cache(tmp_path, "k", result)
+        write_cache(tmp_path, "k", result)
+
+        assert [p.name for p in tmp_path.iterdir()] == ["k.json"]
+
+
+class TestMeasurementServiceCache:
+    def test_second_measure_hits_cache(self, tmp_path: Path) -> None:
+        svc = _service(tmp_path)
+        first = svc.measure(_make_doc()[0])
+        assert first.raw_data.paths  # computed, not cached
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        second = svc.measure(_make_doc()[0])
+        assert second.raw_data.paths == []  # served from cache
+        assert second.gross_area_sf == pytest.approx(first.gross_area_sf)
+        assert second.rooms == first.rooms
+
+    def test_changed_page_misses_cache(self, tmp_path: Path) -> None:
+        svc = _service(tmp_path)
+        svc.measure(_make_doc()[0])
+        svc.measure(_make_doc(offset=5.0)[0])
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    def test_no_cache_dir_writes_nothing(self, tmp_path: Path) -> None:
+        svc = MeasurementService(VectorExtractor(), ScaleDetector(), WallDetector())
+        svc.measure(_make_doc()[0])
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unwritable_cache_dir_still_measures(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "cache"
+        blocker.write_text("not a directory")
+        svc = _service(blocker)
+
+        result = svc.measure(_make_doc()[0])
+
+        assert result.gross_area_sf is not None
+        assert blocker.is_file()
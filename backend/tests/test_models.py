@@ -15,8 +15,10 @@ from cantena.models import (
     FireProtection,
     Location,
     MechanicalSystem,
+    RoomType,
     StructuralSystem,
 )
+from cantena.models.enums import ROOM_TYPE_VALUES
 
 
 def _make_building(**overrides: object) -> BuildingModel:
@@ -176,3 +178,8 @@ class TestEnumValues:
 
     def test_confidence_has_3_values(self) -> None:
         assert len(Confidence) == 3
+
+    def test_room_type_values_matches_enum(self) -> None:
+        assert {RoomType(v) for v in ROOM_TYPE_VALUES} == set(RoomType)
+        assert "kitchen" in ROOM_TYPE_VALUES
+        assert "KITCHEN" not in ROOM_TYPE_VALUES
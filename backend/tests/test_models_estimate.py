@@ -51,6 +51,12 @@ class TestCostRange:
         with pytest.raises(ValidationError, match="low <= expected <= high"):
             CostRange(low=300.0, expected=200.0, high=100.0)
 
+    def test_is_frozen(self) -> None:
+        cr = CostRange(low=100.0, expected=150.0, high=200.0)
+        with pytest.raises(ValidationError):
+            cr.low = 50.0  # type: ignore[misc]
+        assert hash(cr) == hash(CostRange(low=100.0, expected=150.0, high=200.0))
+
     def test_json_round_trip(self) -> None:
         cr = CostRange(low=100.0, expected=150.0, high=200.0)
         json_str = cr.model_dump_json()
@@ -300,6 +306,24 @@ class TestCostEstimate:
                 ),
             )
 
+    def test_summary_and_export_dicts_are_cached(self) -> None:
+        estimate = _build_realistic_estimate()
+        assert estimate.to_summary_dict() is estimate.to_summary_dict()
+        assert estimate.to_export_dict() is estimate.to_export_dict()
+
+    def test_model_copy_drops_cached_dicts(self) -> None:
+        estimate = _build_realistic_estimate()
+        assert estimate.to_summary_dict()["project_name"] == "Downtown Office Tower"
+        renamed = estimate.model_copy(update={"project_name": "Renamed"})
+        assert renamed.to_summary_dict()["project_name"] == "Renamed"
+        assert renamed.to_export_dict()["project_name"] == "Renamed"
+        assert renamed.model_copy() == renamed
+
+    def test_is_frozen(self) -> None:
+        estimate = _build_realistic_estimate()
+        with pytest.raises(ValidationError):
+            estimate.project_name = "Other"  # type: ignore[misc]
+
     def test_realistic_example_helper(self) -> None:
         """The helper function produces a valid, realistic estimate."""
         estimate = _build_realistic_estimate()
@@ -307,3 +331,24 @@ class TestCostEstimate:
         assert estimate.cost_per_sf.expected == pytest.approx(316.67, abs=0.01)
         assert estimate.building_summary.gross_sf == 120_000.0
         assert estimate.metadata.estimation_method == "square_foot_conceptual"
+
+
+class TestFromTrustedDict:
+    def test_round_trips_python_dump(self) -> None:
+        estimate = _build_realistic_estimate()
+        restored = CostEstimate.from_trusted_dict(estimate.model_dump())
+        assert restored == estimate
+
+    def test_round_trips_json_dump(self) -> None:
+        estimate = _build_realistic_estimate()
+        restored = CostEstimate.from_trusted_dict(estimate.model_dump(mode="json"))
+        assert restored.generated_at == estimate.generated_at
+        assert restored.assumptions[0].confidence is Confidence.MEDIUM
+        assert restored.breakdown[0].cost == estimate.breakdown[0].cost
+        assert restored.to_summary_dict() == estimate.to_summary_dict()
+
+    def test_skips_cost_range_validation(self) -> None:
+        data = _build_realistic_estimate().model_dump()
+        data["total_cost"] = {"low": 999.0, "expected": 1.0, "high": 999.0}
+        restored = CostEstimate.from_trusted_dict(data)
+        assert restored.total_cost.expected == 1.0
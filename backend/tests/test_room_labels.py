@@ -4,8 +4,22 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+import pytest
+import shapely
+from shapely.geometry import Polygon
+from shapely.strtree import STRtree
+
 from cantena.geometry.extractor import BoundingRect, Point2D
-from cantena.geometry.rooms import RoomDetector
+from cantena.geometry.rooms import (
+    _ROOM_NAME_TRIGRAMS,
+    _ROOM_NAMES,
+    _ROOM_NAMES_SORTED,
+    RoomDetector,
+    _candidates_by_point,
+    _containing_by_point,
+    _match_room_name,
+)
 from cantena.geometry.scale import TextBlock
 from cantena.geometry.walls import Orientation, WallSegment
 
@@ -220,3 +234,72 @@ class TestSubstringMatch:
         labeled = [r for r in result.rooms if r.label is not None]
         assert len(labeled) == 1
         assert labeled[0].label == "LIVING ROOM"
+
+
+class TestMatchRoomName:
+    """Direct tests for the room-name scanner."""
+
+    def test_exact_match(self) -> None:
+        assert _match_room_name("kitchen") == "KITCHEN"
+
+    def test_longest_name_wins_regardless_of_position(self) -> None:
+        assert _match_room_name("KITCHEN / DINING ROOM") == "DINING ROOM"
+        assert _match_room_name("MASTER BEDROOM 12'x14'") == "MASTER BEDROOM"
+
+    def test_overlapping_names(self) -> None:
+        # "DINING" and "DINING ROOM" start at the same position.
+        assert _match_room_name("THE DINING ROOM") == "DINING ROOM"
+
+    def test_whole_words_only(self) -> None:
+        assert _match_room_name("WOOD DECKING") is None
+        assert _match_room_name("GARDEN") is None
+        assert _match_room_name("COVERED DECK") == "DECK"
+
+    def test_sorted_names_cover_set_longest_first(self) -> None:
+        assert set(_ROOM_NAMES_SORTED) == _ROOM_NAMES
+        lengths = [len(n) for n in _ROOM_NAMES_SORTED]
+        assert lengths == sorted(lengths, reverse=True)
+
+    def test_no_match(self) -> None:
+        assert _match_room_name("12'-6\"") is None
+
+    def test_multiline_label_passes_prefilter(self) -> None:
+        assert _match_room_name("living\nroom") == "LIVING ROOM"
+
+    def test_trigrams_cover_every_name(self) -> None:
+        assert all(n[:3] in _ROOM_NAME_TRIGRAMS for n in _ROOM_NAMES)
+        assert all(" " not in tg for tg in _ROOM_NAME_TRIGRAMS)
+
+
+class TestCandidatesByPoint:
+    """Bulk radius query behind label_rooms."""
+
+    def test_index_and_distance_order(self) -> None:
+        centroids = shapely.points([(30.0, 0.0), (10.0, 0.0), (20.0, 0.0)])
+        pts = shapely.points([(0.0, 0.0), (500.0, 500.0)])
+        tree = STRtree(centroids)
+
+        by_index = _candidates_by_point(tree, centroids, pts, 25.0)
+        assert [i for i, _ in by_index[0]] == [1, 2]
+        assert by_index[1] == []
+
+        by_dist = _candidates_by_point(
+            tree, centroids, pts, 35.0, by_distance=True
+        )
+        assert [i for i, _ in by_dist[0]] == [1, 2, 0]
+        assert [d for _, d in by_dist[0]] == pytest.approx([10.0, 20.0, 30.0])
+
+
+class TestContainingByPoint:
+    def test_inside_and_strictly_near_boundary(self) -> None:
+        polys = np.array(
+            [
+                Polygon([(0, 0), (100, 0), (100, 100), (0, 100)]),
+                Polygon([(50, 0), (150, 0), (150, 100), (50, 100)]),
+            ],
+            dtype=object,
+        )
+        pts = shapely.points(
+            [(75.0, 50.0), (-0.5, 50.0), (-1.0, 50.0), (125.0, 50.0)]
+        )
+        assert _containing_by_point(polys, pts, 1.0) == [[0, 1], [0], [], [1]]
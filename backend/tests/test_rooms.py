@@ -4,10 +4,19 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 import pytest
 
 from cantena.geometry.extractor import Point2D
-from cantena.geometry.rooms import RoomDetector
+from cantena.geometry.rooms import (
+    RoomDetector,
+    _area_mask,
+    _can_enclose_room,
+    _cascaded_union,
+    _closed_network_lines,
+    _extend_segments,
+    _outer_boundary_of_rooms,
+)
 from cantena.geometry.walls import Orientation, WallSegment
 
 
@@ -136,6 +145,23 @@ class TestDetectRoomsTwoAdjacent:
         for room in result.rooms:
             assert room.area_pts == pytest.approx(expected_each, rel=0.05)
 
+    def test_slightly_skewed_outer_wall_keeps_both_rooms(self) -> None:
+        segs = [
+            _seg((100, 100), (250, 100)),
+            _seg((250, 100), (400, 100)),
+            _seg((100, 250), (250, 250)),
+            _seg((250, 250), (403, 250)),
+            _seg((100, 100), (100, 250)),
+            _seg((250, 100), (250, 250)),
+            _seg((400, 100), (403, 250)),
+        ]
+        result = RoomDetector().detect_rooms(segs)
+
+        assert result.room_count == 2
+        assert sorted(r.area_pts for r in result.rooms) == pytest.approx(
+            [22500.0, 22725.0], rel=0.01
+        )
+
 
 class TestSmallGapsSnapped:
     """Segments with small gaps (within snap tolerance) should still form rooms."""
@@ -177,6 +203,79 @@ class TestNonClosingFallback:
             assert result.room_count == 1
             assert result.rooms[0].area_pts > 0
 
+    def test_fallback_boundary_matches_room_ring(self) -> None:
+        segs = [_seg((100, 100), (300, 100)), _seg((300, 100), (300, 250))]
+        result = RoomDetector().detect_rooms(segs)
+
+        assert result.polygonize_success is False
+        assert result.outer_boundary_polygon == result.rooms[0].polygon_pts
+        assert result.outer_boundary_polygon is not result.rooms[0].polygon_pts
+        assert all(
+            type(x) is float and type(y) is float
+            for x, y in result.outer_boundary_polygon
+        )
+
+
+class TestExtendSegments:
+    def test_extends_both_ends_along_direction(self) -> None:
+        xyxy = np.array([(0.0, 0.0, 10.0, 0.0), (5.0, 5.0, 5.0, -5.0)])
+        out = _extend_segments(xyxy, 1.0)
+        assert out.shape == (2, 2, 2)
+        assert out[0].tolist() == [[-1.0, 0.0], [11.0, 0.0]]
+        assert out[1].tolist() == [[5.0, 6.0], [5.0, -6.0]]
+
+    def test_diagonal_extension_length(self) -> None:
+        out = _extend_segments(np.array([(0.0, 0.0, 3.0, 4.0)]), 5.0)
+        assert out[0].ravel().tolist() == pytest.approx([-3.0, -4.0, 6.0, 8.0])
+
+    def test_zero_length_unchanged(self) -> None:
+        out = _extend_segments(np.array([(2.0, 2.0, 2.0, 2.0)]), 1.0)
+        assert out[0].tolist() == [[2.0, 2.0], [2.0, 2.0]]
+
+
+class TestCascadedUnion:
+    def test_chunked_union_matches_single_union(self) -> None:
+        import shapely
+        from shapely.ops import polygonize
+
+        # 4x3 grid of cells with diagonals so lines cross mid-span.
+        segs = [(0.0, y, 400.0, y) for y in (0.0, 100.0, 200.0, 300.0)]
+        segs += [(x, 0.0, x, 300.0) for x in (0.0, 100.0, 200.0, 300.0, 400.0)]
+        segs += [(0.0, 0.0, 400.0, 300.0)]
+        lines = shapely.linestrings(np.array(segs).reshape(-1, 2, 2))
+
+        chunked = sorted(p.area for p in polygonize(_cascaded_union(lines, 3)))
+        single = sorted(p.area for p in polygonize(shapely.union_all(lines)))
+        assert len(chunked) == len(single)
+        assert chunked == pytest.approx(single)
+
+
+class TestAreaMask:
+    def test_min_area_only_without_page(self) -> None:
+        areas = np.array([50.0, 100.0, 1e9])
+        assert _area_mask(areas, None).tolist() == [False, True, True]
+
+    def test_page_fraction_filter(self) -> None:
+        areas = np.array([50.0, 500.0, 800.0, 900.0])
+        assert _area_mask(areas, 1000.0).tolist() == [False, True, True, False]
+
+
+class TestCanEncloseRoom:
+    def test_rectangle_can_enclose(self) -> None:
+        xyxy = np.array([(0, 0, 100, 0), (100, 0, 100, 100), (0, 100, 0, 0)])
+        assert _can_enclose_room(xyxy) is True
+
+    def test_too_few_segments(self) -> None:
+        assert _can_enclose_room(np.array([(0, 0, 100, 0), (0, 0, 0, 100)])) is False
+
+    def test_parallel_segments(self) -> None:
+        xyxy = np.array([(0, 0, 100, 0), (0, 50, 100, 50), (100, 90, 0, 90)])
+        assert _can_enclose_room(xyxy) is False
+
+    def test_tiny_bounding_box(self) -> None:
+        xyxy = np.array([(0, 0, 5, 0), (5, 0, 5, 5), (5, 5, 0, 0)])
+        assert _can_enclose_room(xyxy) is False
+
 
 class TestTinyArtifactsFiltered:
     """Polygons smaller than 100 sq pts should be filtered out."""
@@ -218,6 +317,47 @@ class TestEmptyInput:
         # Should at least not crash
 
 
+class TestNonAxisAlignedRooms:
+    """Diagonal walls bypass the grid tracer and use Shapely polygonize."""
+
+    _TRIANGLE = [
+        _seg((100, 100), (400, 100)),
+        _seg((400, 100), (250, 300)),
+        _seg((250, 300), (100, 100)),
+    ]
+
+    def test_closed_triangle_detected(self) -> None:
+        result = RoomDetector().detect_rooms(self._TRIANGLE)
+
+        assert result.polygonize_success is True
+        assert result.room_count == 1
+        assert result.rooms[0].area_pts == pytest.approx(30000.0, rel=0.01)
+
+    def test_closed_network_skips_union(self) -> None:
+        xyxy = np.array(
+            [(s.start.x, s.start.y, s.end.x, s.end.y) for s in self._TRIANGLE]
+        )
+        assert _closed_network_lines(xyxy) is not None
+
+    def test_crossing_or_dangling_needs_union(self) -> None:
+        xyxy = np.array(
+            [(s.start.x, s.start.y, s.end.x, s.end.y) for s in self._TRIANGLE]
+        )
+        crossing = np.vstack([xyxy, [(250, 50, 250, 350)]])
+        dangling = xyxy[:2]
+        assert _closed_network_lines(crossing) is None
+        assert _closed_network_lines(dangling) is None
+
+    def test_crossing_diagonal_still_split(self) -> None:
+        segs = [*self._TRIANGLE, _seg((250, 50), (250, 350))]
+        result = RoomDetector().detect_rooms(segs)
+
+        assert result.room_count == 2
+        assert sum(r.area_pts for r in result.rooms) == pytest.approx(
+            30000.0, rel=0.01
+        )
+
+
 class TestPageBoundaryFilter:
     """Polygons covering >80% of page area should be filtered."""
 
@@ -290,6 +430,46 @@ class TestRoomAnalysisModel:
         assert result.outer_boundary_polygon is not None
         assert len(result.outer_boundary_polygon) >= 4
 
+    def test_outer_boundary_spans_adjacent_rooms(self) -> None:
+        """Shared-wall vertices are deduplicated; the hull is the outer box."""
+        segs = [
+            _seg((100, 100), (300, 100)),
+            _seg((100, 100), (100, 250)),
+            _seg((100, 250), (300, 250)),
+            _seg((300, 100), (300, 250)),
+            _seg((300, 100), (500, 100)),
+            _seg((500, 100), (500, 250)),
+            _seg((500, 250), (300, 250)),
+        ]
+        result = RoomDetector().detect_rooms(segs)
+
+        ring = result.outer_boundary_polygon
+        assert ring is not None
+        assert ring[0] == ring[-1]
+        assert len(ring) == 5
+        xs = [x for x, _ in ring]
+        ys = [y for _, y in ring]
+        assert min(xs) == pytest.approx(100.0, abs=1.0)
+        assert max(xs) == pytest.approx(500.0, abs=1.0)
+        assert min(ys) == pytest.approx(100.0, abs=1.0)
+        assert max(ys) == pytest.approx(250.0, abs=1.0)
+
+    def test_hull_of_room_hulls_matches_full_hull(self) -> None:
+        import shapely
+        from shapely.geometry import Polygon
+
+        polys = np.array(
+            [
+                Polygon([(0, 0), (200, 0), (200, 50), (50, 50), (50, 200), (0, 200)]),
+                Polygon([(200, 0), (300, 0), (300, 100), (200, 100)]),
+            ],
+            dtype=object,
+        )
+        ring = _outer_boundary_of_rooms(polys)
+        full = shapely.convex_hull(shapely.union_all(polys))
+        assert ring is not None
+        assert shapely.equals(Polygon(ring), full)
+
     def test_room_index_sequential(self) -> None:
         segs = [
             _seg((100, 100), (300, 100)),
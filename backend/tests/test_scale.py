@@ -17,6 +17,7 @@ from cantena.geometry.extractor import (
 from cantena.geometry.scale import (
     Confidence,
     ScaleDetector,
+    ScaleResult,
     TextBlock,
     parse_dimension_string,
 )
@@ -97,6 +98,23 @@ class TestScaleNotationParsing:
         assert result is not None
         assert result.scale_factor == pytest.approx(50.0)
 
+    def test_two_inch_equals_ten_feet(self) -> None:
+        """2"=10'-0" is not a mapped fraction but parses as whole-inch."""
+        result = self.detector.detect_from_text('2"=10\'-0"')
+        assert result is not None
+        assert result.drawing_units == pytest.approx(2.0)
+        assert result.scale_factor == pytest.approx(60.0)
+
+    def test_arch_preferred_over_earlier_metric(self) -> None:
+        result = self.detector.detect_from_text('1:100  1/4"=1\'-0"')
+        assert result is not None
+        assert result.scale_factor == pytest.approx(48.0)
+
+    def test_whole_inch_preferred_over_earlier_metric(self) -> None:
+        result = self.detector.detect_from_text('1:100  2"=10\'-0"')
+        assert result is not None
+        assert result.scale_factor == pytest.approx(60.0)
+
 
 class TestMessyText:
     """Test that scale detection handles inconsistent spacing/punctuation."""
@@ -130,6 +148,13 @@ class TestMessyText:
         assert result.scale_factor == pytest.approx(96.0)
         assert result.confidence == Confidence.HIGH
 
+    def test_unicode_quotes_and_tabs(self) -> None:
+        """Curly quotes, primes and tabs normalize to the ASCII notation."""
+        result = self.detector.detect_from_text("1/4\u2033\t=\t1\u2032-0\u201d")
+        assert result is not None
+        assert result.scale_factor == pytest.approx(48.0)
+        assert result.notation == "1/4\" = 1'-0\""
+
     def test_metric_with_spaces(self) -> None:
         """1 : 50 with spaces should parse."""
         result = self.detector.detect_from_text("1 : 50")
@@ -154,6 +179,54 @@ class TestUnparseableText:
         assert self.detector.detect_from_text(text) is None
 
 
+def _block(text: str) -> TextBlock:
+    return TextBlock(
+        text=text,
+        position=Point2D(0, 0),
+        bounding_rect=BoundingRect(x=0, y=0, width=10, height=10),
+    )
+
+
+class TestDetectFromTextBlocks:
+    """Tests for ScaleDetector.detect_from_text_blocks."""
+
+    def setup_method(self) -> None:
+        self.detector = ScaleDetector()
+
+    def test_finds_scale_in_one_block(self) -> None:
+        blocks = [_block("FIRST FLOOR PLAN"), _block("SCALE: 1/4\" = 1'-0\"")]
+        result = self.detector.detect_from_text_blocks(blocks)
+        assert result is not None
+        assert result.scale_factor == pytest.approx(48.0)
+
+    def test_arch_scale_preferred_over_earlier_metric(self) -> None:
+        blocks = [_block("DETAIL 1:20"), _block("SCALE: 1/8\"=1'-0\"")]
+        result = self.detector.detect_from_text_blocks(blocks)
+        assert result is not None
+        assert result.scale_factor == pytest.approx(96.0)
+
+    def test_split_notation_not_found_per_block(self) -> None:
+        blocks = [_block("SCALE: 1/4\""), _block("= 1'-0\"")]
+        assert self.detector.detect_from_text_blocks(blocks) is None
+        joined = "\n".join(b.text for b in blocks)
+        assert self.detector.detect_from_text(joined) is not None
+
+    def test_architectural_only_skips_metric_block(self) -> None:
+        blocks = [
+            _block("SCALE: 1/4\""), _block("= 1'-0\""), _block("DETAIL 3  1:20"),
+        ]
+        metric = self.detector.detect_from_text_blocks(blocks)
+        assert metric is not None
+        assert metric.scale_factor == pytest.approx(20.0)
+        assert (
+            self.detector.detect_from_text_blocks(blocks, architectural_only=True)
+            is None
+        )
+
+    def test_no_blocks(self) -> None:
+        assert self.detector.detect_from_text_blocks([]) is None
+
+
 class TestDetectFromDimensions:
     """Tests for ScaleDetector.detect_from_dimensions."""
 
@@ -219,6 +292,37 @@ class TestDetectFromDimensions:
         )
         assert self.detector.detect_from_dimensions([line], [text]) is None
 
+    def test_closest_text_line_pair_wins(self) -> None:
+        """Across all texts and lines, the nearest pair sets the scale."""
+        lines = [
+            VectorPath(
+                path_type=PathType.LINE,
+                points=[Point2D(x, 100), Point2D(x + length, 100)],
+                stroke_color=None,
+                fill_color=None,
+                line_width=0.5,
+                bounding_rect=BoundingRect(x=x, y=100, width=length, height=0),
+            )
+            for x, length in [(0, 72), (300, 144)]
+        ]
+        texts = [
+            TextBlock(
+                text="10'-0\"",
+                position=Point2D(36, 130),  # 30 pts from the first line
+                bounding_rect=BoundingRect(x=20, y=125, width=32, height=10),
+            ),
+            TextBlock(
+                text="20'-0\"",
+                position=Point2D(372, 105),  # 5 pts from the second line
+                bounding_rect=BoundingRect(x=356, y=100, width=32, height=10),
+            ),
+        ]
+        result = self.detector.detect_from_dimensions(lines, texts)
+        assert result is not None
+        assert result.notation == "20'-0\""
+        assert result.drawing_units == pytest.approx(2.0)
+        assert result.scale_factor == pytest.approx(120.0)
+
 
 class TestExtractTextBlocks:
     """Tests for ScaleDetector.extract_text_blocks using a real PDF."""
@@ -252,3 +356,10 @@ class TestExtractTextBlocks:
             assert scale_block.bounding_rect.height > 0
         finally:
             pdf_path.unlink(missing_ok=True)
+
+
+class TestSlots:
+    def test_results_have_no_instance_dict(self) -> None:
+        result = ScaleResult(0.125, 12.0, 96.0, "1/8\"=1'-0\"", Confidence.HIGH)
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(_block("x"), "__dict__")
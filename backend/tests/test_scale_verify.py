@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import json
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import anthropic
 import pytest
@@ -12,8 +15,13 @@ from cantena.geometry.scale import Confidence, ScaleResult, TextBlock
 from cantena.geometry.scale_verify import (
     ScaleVerificationResult,
     ScaleVerifier,
+    _parse_llm_json,
+    _select_blocks,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -96,7 +104,7 @@ class TestDeterministicHighLlmAgrees:
         verifier = ScaleVerifier(api_key="test-key")
         page = _mock_page()
         detected = _make_scale(factor=48.0)
-        text_blocks = [_make_text_block('SCALE: 1/4"=1\'-0"', y=750.0)]
+        text_blocks = [_make_text_block("SCALE: QUARTER INCH", y=750.0)]
 
         with patch.object(
             verifier._client.messages,
@@ -118,7 +126,7 @@ class TestDeterministicHighLlmAgrees:
         verifier = ScaleVerifier(api_key="test-key")
         page = _mock_page()
         detected = _make_scale(factor=48.0)
-        text_blocks = [_make_text_block('SCALE: 1/4"=1\'-0"', y=750.0)]
+        text_blocks = [_make_text_block("SCALE: QUARTER INCH", y=750.0)]
 
         # 49.0 is ~2% off from 48.0 -> within 5%
         with patch.object(
@@ -460,6 +468,375 @@ class TestMalformedResponse:
         assert result.verification_source == "UNVERIFIED"
         assert result.scale is not None
 
+    def test_parse_bare_fence_and_surrounding_text(self) -> None:
+        raw = 'Here you go:\n```\n{"a": {"b": 1}}\n```\nDone.'
+        assert _parse_llm_json(raw) == {"a": {"b": 1}}
+
+
+# ---------------------------------------------------------------------------
+# Tests: Message Batches path
+# ---------------------------------------------------------------------------
+
+
+def _batch_item(custom_id: str, text: str | None) -> MagicMock:
+    """Build a mock batch result; ``text=None`` means the request errored."""
+    item = MagicMock()
+    item.custom_id = custom_id
+    if text is None:
+        item.result.type = "errored"
+    else:
+        item.result.type = "succeeded"
+        item.result.message = _mock_api_response(text)
+    return item
+
+
+class TestBatchVerification:
+    """verify_or_recover_scales_batch maps batch results back per page."""
+
+    def test_results_in_input_order(self) -> None:
+        verifier = ScaleVerifier(api_key="test-key")
+        pages = [
+            (_mock_page(), _make_scale(factor=48.0), []),
+            (_mock_page(), None, []),
+            (_mock_page(), _make_scale(factor=96.0), []),
+        ]
+        batches = MagicMock()
+        batches.create.return_value.processing_status = "in_progress"
+        batches.retrieve.return_value.processing_status = "ended"
+        batches.results.return_value = [
+            _batch_item("page-2", None),
+            _batch_item("page-0", _make_llm_response(scale_factor=48.0)),
+            _batch_item(
+                "page-1",
+                _make_llm_response(scale_factor=96.0, confidence="MEDIUM"),
+            ),
+        ]
+
+        with patch.object(verifier._client.messages, "batches", batches):
+            results = verifier.verify_or_recover_scales_batch(
+                pages, poll_interval=0.0
+            )
+
+        assert [r.verification_source for r in results] == [
+            "LLM_CONFIRMED",
+            "LLM_RECOVERED",
+            "UNVERIFIED",
+        ]
+        assert results[1].scale is not None
+        assert results[1].scale.scale_factor == 96.0
+        requests = batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == [
+            "page-0", "page-1", "page-2",
+        ]
+        batches.retrieve.assert_called_once()
+
+    def test_single_page_uses_sync_path(self) -> None:
+        verifier = ScaleVerifier(api_key="test-key")
+        batches = MagicMock()
+
+        with (
+            patch.object(verifier._client.messages, "batches", batches),
+            patch.object(
+                verifier._client.messages,
+                "create",
+                return_value=_mock_api_response(_make_llm_response()),
+            ),
+        ):
+            results = verifier.verify_or_recover_scales_batch(
+                [(_mock_page(), _make_scale(factor=48.0), [])]
+            )
+
+        assert results[0].verification_source == "LLM_CONFIRMED"
+        batches.create.assert_not_called()
+
+    def test_submit_error_returns_unverified(self) -> None:
+        verifier = ScaleVerifier(api_key="test-key")
+        batches = MagicMock()
+        batches.create.side_effect = anthropic.APIConnectionError(
+            request=MagicMock()
+        )
+        pages = [
+            (_mock_page(), _make_scale(factor=48.0), []),
+            (_mock_page(), None, []),
+        ]
+
+        with patch.object(verifier._client.messages, "batches", batches):
+            results = verifier.verify_or_recover_scales_batch(pages)
+
+        assert [r.verification_source for r in results] == [
+            "UNVERIFIED",
+            "UNVERIFIED",
+        ]
+        assert results[0].scale is not None
+
+    def test_unexpected_error_returns_unverified(self) -> None:
+        verifier = ScaleVerifier(api_key="test-key")
+        batches = MagicMock()
+        batches.create.return_value.processing_status = "ended"
+        batches.results.side_effect = ValueError("bad JSONL line")
+        pages = [
+            (_mock_page(), _make_scale(factor=48.0), []),
+            (_mock_page(), None, []),
+        ]
+
+        with patch.object(verifier._client.messages, "batches", batches):
+            results = verifier.verify_or_recover_scales_batch(pages)
+
+        assert [r.verification_source for r in results] == [
+            "UNVERIFIED",
+            "UNVERIFIED",
+        ]
+        assert results[0].warnings == ["LLM verification failed unexpectedly"]
+
+    def test_deadline_cancels_and_returns_unverified(self) -> None:
+        verifier = ScaleVerifier(api_key="test-key")
+        batches = MagicMock()
+        batches.create.return_value.processing_status = "in_progress"
+        batches.retrieve.return_value.processing_status = "in_progress"
+        pages = [
+            (_mock_page(), _make_scale(factor=48.0), []),
+            (_mock_page(), None, []),
+        ]
+
+        with patch.object(verifier._client.messages, "batches", batches):
+            results = verifier.verify_or_recover_scales_batch(
+                pages, poll_interval=0.0, max_wait_s=0.0
+            )
+
+        assert [r.verification_source for r in results] == [
+            "UNVERIFIED",
+            "UNVERIFIED",
+        ]
+        assert results[0].scale is not None
+        assert results[0].scale.scale_factor == 48.0
+        batches.cancel.assert_called_once()
+        batches.results.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Tests: async path
+# ---------------------------------------------------------------------------
+
+
+class TestAsyncVerification:
+    """verify_or_recover_scale_async mirrors the sync decision logic."""
+
+    def test_gather_confirms_each_page(self) -> None:
+        verifier = ScaleVerifier(api_key="test-key")
+        create = AsyncMock(
+            return_value=_mock_api_response(_make_llm_response())
+        )
+
+        async def run() -> list[ScaleVerificationResult]:
+            return await asyncio.gather(*[
+                verifier.verify_or_recover_scale_async(
+                    _mock_page(),
+                    _make_scale(factor=48.0),
+                    [_make_text_block(f"SHEET A-10{i}", y=750.0)],
+                )
+                for i in range(3)
+            ])
+
+        with patch.object(verifier._async_client.messages, "create", create):
+            results = asyncio.run(run())
+
+        assert [r.verification_source for r in results] == ["LLM_CONFIRMED"] * 3
+        assert create.await_count == 3
+
+    def test_api_error_returns_unverified(self) -> None:
+        verifier = ScaleVerifier(api_key="test-key")
+        create = AsyncMock(
+            side_effect=anthropic.APITimeoutError(request=MagicMock())
+        )
+
+        with patch.object(verifier._async_client.messages, "create", create):
+            result = asyncio.run(
+                verifier.verify_or_recover_scale_async(
+                    _mock_page(), _make_scale(factor=48.0), []
+                )
+            )
+
+        assert result.verification_source == "UNVERIFIED"
+        assert result.scale is not None
+
+
+# ---------------------------------------------------------------------------
+# Tests: prompt text selection
+# ---------------------------------------------------------------------------
+
+
+class TestSelectBlocks:
+    def test_title_block_and_candidates_in_one_pass(self) -> None:
+        blocks = [
+            _make_text_block("  KITCHEN  ", y=300.0),
+            _make_text_block('1/4"=1\'-0"', y=300.0),
+            _make_text_block("  ", y=750.0),
+            _make_text_block("SHEET A-101", y=750.0),
+            _make_text_block("Scale: as noted", y=780.0),
+        ]
+        tb_texts, candidates = _select_blocks(blocks, 800.0)
+        assert tb_texts == ["SHEET A-101", "Scale: as noted"]
+        assert candidates == ['1/4"=1\'-0"', "Scale: as noted"]
+
+
+class TestTextConfirmation:
+    """Standard scale notations confirm the detected scale without the LLM."""
+
+    def test_standard_notation_skips_llm(self) -> None:
+        verifier = ScaleVerifier(api_key="test-key")
+        text_blocks = [_make_text_block("SCALE: 1/4\u201d = 1\u2019-0\u201d", y=750.0)]
+        create = MagicMock()
+
+        with patch.object(verifier._client.messages, "create", create):
+            result = verifier.verify_or_recover_scale(
+                _mock_page(), _make_scale(factor=48.0), text_blocks
+            )
+
+        assert result.verification_source == "TEXT_CONFIRMED"
+        assert result.scale is not None
+        assert result.scale.scale_factor == 48.0
+        create.assert_not_called()
+
+    def test_disagreeing_notation_still_asks_llm(self) -> None:
+        verifier = ScaleVerifier(api_key="test-key")
+        text_blocks = [_make_text_block('SCALE: 1/8"=1\'-0"', y=750.0)]
+        create = MagicMock(
+            return_value=_mock_api_response(_make_llm_response())
+        )
+
+        with patch.object(verifier._client.messages, "create", create):
+            result = verifier.verify_or_recover_scale(
+                _mock_page(), _make_scale(factor=48.0), text_blocks
+            )
+
+        assert result.verification_source == "LLM_CONFIRMED"
+        create.assert_called_once()
+
+    def test_longer_fraction_not_mistaken_for_standard(self) -> None:
+        verifier = ScaleVerifier(api_key="test-key")
+        text_blocks = [_make_text_block('SCALE: 11/8"=1\'-0"', y=750.0)]
+        create = MagicMock(
+            return_value=_mock_api_response(
+                _make_llm_response(scale_factor=96.0)
+            )
+        )
+
+        with patch.object(verifier._client.messages, "create", create):
+            verifier.verify_or_recover_scale(
+                _mock_page(), _make_scale(factor=96.0), text_blocks
+            )
+
+        create.assert_called_once()
+
+
+class TestRequestParams:
+    def test_small_budget_and_cached_system_prompt(self) -> None:
+        verifier = ScaleVerifier(api_key="test-key")
+        create = MagicMock(
+            return_value=_mock_api_response(_make_llm_response())
+        )
+
+        with patch.object(verifier._client.messages, "create", create):
+            verifier.verify_or_recover_scale(_mock_page(), None, [])
+
+        kwargs = create.call_args.kwargs
+        assert kwargs["max_tokens"] == 128
+        assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+
+
+# ---------------------------------------------------------------------------
+# Tests: reply cache
+# ---------------------------------------------------------------------------
+
+
+class TestReplyCache:
+    """Parsed LLM replies are memoized on disk by prompt text."""
+
+    def test_second_call_served_from_cache(self, tmp_path: Path) -> None:
+        verifier = ScaleVerifier(api_key="test-key", cache_dir=tmp_path)
+        text_blocks = [_make_text_block("SCALE: AS NOTED", y=750.0)]
+        create = MagicMock(
+            return_value=_mock_api_response(_make_llm_response())
+        )
+
+        with patch.object(verifier._client.messages, "create", create):
+            first = verifier.verify_or_recover_scale(
+                _mock_page(), _make_scale(factor=48.0), text_blocks
+            )
+            second = verifier.verify_or_recover_scale(
+                _mock_page(), _make_scale(factor=48.0), text_blocks
+            )
+
+        assert first == second
+        assert second.verification_source == "LLM_CONFIRMED"
+        assert create.call_count == 1
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_repeat_call_memoized_in_process(self) -> None:
+        verifier = ScaleVerifier(api_key="test-key")
+        create = MagicMock(
+            return_value=_mock_api_response(_make_llm_response())
+        )
+
+        with patch.object(verifier._client.messages, "create", create):
+            for _ in range(3):
+                verifier.verify_or_recover_scale(
+                    _mock_page(), _make_scale(factor=48.0), []
+                )
+
+        assert create.call_count == 1
+
+    def test_writes_leave_no_temp_files(self, tmp_path: Path) -> None:
+        verifier = ScaleVerifier(api_key="test-key", cache_dir=tmp_path)
+        verifier._write_cached_reply("prompt", {"scale_factor": 48.0})
+        verifier._write_cached_reply("prompt", {"scale_factor": 96.0})
+
+        files = list(tmp_path.iterdir())
+        assert [p.suffix for p in files] == [".json"]
+        assert json.loads(files[0].read_text()) == {"scale_factor": 96.0}
+
+    def test_failed_replace_removes_temp_file(self, tmp_path: Path) -> None:
+        verifier = ScaleVerifier(api_key="test-key", cache_dir=tmp_path)
+
+        with patch(
+            "cantena.geometry.scale_verify.os.replace",
+            side_effect=OSError("disk full"),
+        ):
+            verifier._write_cached_reply("prompt", {"scale_factor": 48.0})
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unparseable_reply_not_cached(self, tmp_path: Path) -> None:
+        verifier = ScaleVerifier(api_key="test-key", cache_dir=tmp_path)
+
+        with patch.object(
+            verifier._client.messages,
+            "create",
+            return_value=_mock_api_response("no json here"),
+        ):
+            verifier.verify_or_recover_scale(_mock_page(), None, [])
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_expired_entry_ignored(self, tmp_path: Path) -> None:
+        verifier = ScaleVerifier(
+            api_key="test-key", cache_dir=tmp_path, cache_ttl_s=0.0
+        )
+        create = MagicMock(
+            return_value=_mock_api_response(_make_llm_response())
+        )
+
+        with (
+            patch.object(verifier._client.messages, "create", create),
+            patch("cantena.geometry.scale_verify.time.time") as now,
+        ):
+            now.return_value = 0.0
+            verifier.verify_or_recover_scale(_mock_page(), None, [])
+            now.return_value = 1e12
+            verifier.verify_or_recover_scale(_mock_page(), None, [])
+
+        assert create.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # Tests: ScaleVerificationResult model
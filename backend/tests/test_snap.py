@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import math
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from cantena.geometry.extractor import Point2D
-from cantena.geometry.snap import snap_endpoints, snap_to_grid
+from cantena.geometry.snap import (
+    _cluster_endpoints,
+    snap_endpoints,
+    snap_to_grid,
+)
 from cantena.geometry.walls import Orientation, WallSegment
 
 
@@ -139,6 +145,38 @@ class TestSnapEndpoints:
         assert result[2].start.y == pytest.approx(centroid_y)
 
 
+class TestClusterEndpoints:
+    """Direct tests for the indexed endpoint clustering."""
+
+    def test_chain_within_tolerance_is_one_cluster(self) -> None:
+        """Clusters are transitive: 0-2.5-5 merge though 0 and 5 are 5 apart."""
+        pts = np.array([(0, 0), (2.5, 0), (5, 0), (20, 0)], dtype=np.float64)
+        labels, centroids = _cluster_endpoints(pts, 3.0)
+
+        assert labels[0] == labels[1] == labels[2] != labels[3]
+        assert centroids[labels[0]].tolist() == pytest.approx([2.5, 0.0])
+        assert centroids[labels[3]].tolist() == [20.0, 0.0]
+
+    def test_tolerance_is_inclusive(self) -> None:
+        labels, _ = _cluster_endpoints(np.array([(0.0, 0.0), (3.0, 0.0)]), 3.0)
+        assert labels[0] == labels[1]
+
+    def test_empty(self) -> None:
+        labels, centroids = _cluster_endpoints(np.empty((0, 2)), 3.0)
+        assert len(labels) == 0
+        assert centroids.shape == (0, 2)
+
+    def test_float_noise_endpoints_share_one_input(self) -> None:
+        """Endpoints differing by extraction noise dedup before clustering."""
+        segs = [_seg((0, 0), (100, 0)), _seg((1e-9, 0), (0, 100))]
+        with patch(
+            "cantena.geometry.snap._cluster_endpoints",
+            wraps=_cluster_endpoints,
+        ) as spy:
+            snap_endpoints(segs, tolerance_pts=0.5)
+        assert len(spy.call_args.args[0]) == 3
+
+
 class TestSnapToGrid:
     """Verify grid snapping rounds coordinates correctly."""
 
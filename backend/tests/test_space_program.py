@@ -115,6 +115,12 @@ class TestLabelMappings:
         prog = SpaceProgram.from_detected_rooms(rooms, BuildingType.APARTMENT_LOW_RISE)
         assert prog.spaces[0].room_type == RoomType.PORCH
 
+    def test_numbered_suffix_stripped(self) -> None:
+        rooms = [_make_room(" Bedroom 2 ", 120.0), _make_room("LIVING ROOM 1", 300.0)]
+        prog = SpaceProgram.from_detected_rooms(rooms, BuildingType.APARTMENT_LOW_RISE)
+        assert prog.spaces[0].room_type == RoomType.BEDROOM
+        assert prog.spaces[1].room_type == RoomType.LIVING_ROOM
+
 
 class TestUnlabeledRoom:
     """Unlabeled DetectedRoom maps to OTHER."""
@@ -236,6 +242,40 @@ class TestFromLlmInterpretation:
         )
         assert prog.spaces[0].room_type == RoomType.OTHER
 
+    def test_area_estimates_scaled_to_total(self) -> None:
+        interp = LlmInterpretation(
+            building_type="APARTMENT_LOW_RISE",
+            structural_system="WOOD_FRAME",
+            rooms=[
+                LlmRoomInterpretation(
+                    room_index=0,
+                    confirmed_label="Kitchen",
+                    room_type_enum="KITCHEN",
+                    notes="estimated_area_sf: 150",
+                ),
+                LlmRoomInterpretation(
+                    room_index=1,
+                    confirmed_label="Bedroom",
+                    room_type_enum="BEDROOM",
+                    notes="estimated_area_sf: 50",
+                ),
+                LlmRoomInterpretation(
+                    room_index=2,
+                    confirmed_label="Closet",
+                    room_type_enum="CLOSET",
+                    notes="",
+                ),
+            ],
+        )
+        prog = SpaceProgram.from_llm_interpretation(
+            interp, total_area_sf=1000.0, building_type=BuildingType.APARTMENT_LOW_RISE,
+        )
+        areas = [s.area_sf for s in prog.spaces]
+        assert areas[0] == 750.0
+        assert areas[1] == 250.0
+        # Estimates already account for the whole total; nothing is left over.
+        assert areas[2] == 0.0
+
 
 # -------------------------------------------------------------------
 # total_area_sf
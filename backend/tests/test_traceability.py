@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import base64
+
 import pytest
 
 from cantena.data.repository import CostDataRepository
@@ -208,6 +210,19 @@ class TestGeometryPayload:
         assert payload.outer_boundary is None
         assert payload.page_image_base64 is None
 
+    def test_page_image_encoded_on_dump(self) -> None:
+        png = b"\x89PNG\r\n\x1a\nfake"
+        payload = GeometryPayload(
+            page_width_pts=612.0,
+            page_height_pts=792.0,
+            page_image_png=png,
+        )
+        data = payload.model_dump(mode="json")
+        assert "page_image_png" not in data
+        assert base64.b64decode(data["page_image_base64"]) == png
+        restored = GeometryPayload.model_validate(data)
+        assert restored.page_image_png == png
+
 
 class TestDivisionCostBackwardCompat:
     """DivisionCost works with and without new traceability fields."""
@@ -6,6 +6,7 @@ import tempfile
 from pathlib import Path
 
 import fitz  # type: ignore[import-untyped]
+import numpy as np
 import pytest
 
 from cantena.geometry.extractor import (
@@ -16,7 +17,14 @@ from cantena.geometry.extractor import (
     VectorExtractor,
     VectorPath,
 )
-from cantena.geometry.walls import Orientation, WallDetector
+from cantena.geometry.walls import (
+    Orientation,
+    WallDetector,
+    WallSegment,
+    _axis_window_pairs,
+    _parallel_pair_gaps,
+    segments_to_xyxy,
+)
 
 
 def _make_line(
@@ -130,6 +138,52 @@ class TestParallelWallPairs:
         assert result.detected_wall_thickness_pts is not None
         assert result.detected_wall_thickness_pts == pytest.approx(6.0, abs=1.0)
 
+    def test_gap_kernel_pairs_only_parallel_lines_in_range(self) -> None:
+        xyxy = np.array([
+            (0.0, 0.0, 100.0, 0.0),     # horizontal
+            (0.0, 6.0, 100.0, 6.0),     # 6 pts above: paired
+            (0.0, 40.0, 100.0, 40.0),   # too far from both
+            (50.0, 0.0, 50.0, 100.0),   # perpendicular: never paired
+            (0.0, 1.0, 100.0, 1.0),     # 1 pt gap (too close), 5 pts to #1
+        ])
+        gaps = _parallel_pair_gaps(xyxy, 2.0, 20.0)
+        assert sorted(gaps.tolist()) == pytest.approx([5.0, 6.0])
+
+    def test_gap_kernel_scores_tilted_lines_exactly(self) -> None:
+        # A 1° tilt lifts line 0 by ~17.5 pts at x = 1000, so a line
+        # there at y = 10 is ~7.5 pts from it; a bucket on y alone
+        # (10 pts apart) would give the wrong gap.
+        xyxy = np.array([
+            (0.0, 0.0, 100.0, 100.0 * np.tan(np.radians(1.0))),
+            (990.0, 10.0, 1010.0, 10.0),
+        ])
+        gaps = _parallel_pair_gaps(xyxy, 2.0, 20.0)
+        assert gaps.tolist() == pytest.approx([7.45], abs=0.05)
+
+    def test_gap_kernel_windows_lines_with_float_drift(self) -> None:
+        # Lines a hair off axis (as PDF coordinates often are) must be
+        # windowed like exact ones and score the same gaps.
+        rng = np.random.default_rng(0)
+        y = np.arange(40) * 3.0
+        x = 500.0 + np.arange(40) * 3.0
+        exact = np.concatenate([
+            np.stack([np.zeros(40), y, np.full(40, 300.0), y], axis=1),
+            np.stack([x, np.zeros(40), x, np.full(40, 300.0)], axis=1),
+        ])
+        drifted = exact.copy()
+        drifted[:40, 3] += rng.uniform(-1e-3, 1e-3, 40)
+        drifted[40:, 2] += rng.uniform(-1e-3, 1e-3, 40)
+
+        gaps = _parallel_pair_gaps(drifted, 2.0, 20.0)
+        expected = _parallel_pair_gaps(exact, 2.0, 20.0)
+        assert len(expected) == 2 * (39 + 38 + 37 + 36 + 35 + 34)
+        assert sorted(gaps.tolist()) == pytest.approx(
+            sorted(expected.tolist()), abs=1e-2
+        )
+        # Each line is only paired with its neighbours, not all 80 lines.
+        cand, _ = _axis_window_pairs(drifted, np.arange(40), 0, 2.0, 20.0)
+        assert len(cand) <= 40 * 7
+
 
 class TestEnclosedArea:
     """Test area computation from wall segments."""
@@ -152,6 +206,24 @@ class TestEnclosedArea:
         # 300 * 200 = 60000 sq pts
         assert area == pytest.approx(60000.0, rel=0.01)
 
+    def test_outer_boundary_is_closed_hull(self) -> None:
+        """The outer boundary is the closed hull ring of the wall endpoints."""
+        detector = WallDetector()
+        paths = [
+            _make_line((100, 100), (400, 100), width=2.0),
+            _make_line((400, 100), (400, 300), width=2.0),
+            _make_line((100, 300), (400, 300), width=2.0),
+            _make_line((100, 100), (100, 300), width=2.0),
+        ]
+        data = DrawingData(paths=paths, page_width_pts=612, page_height_pts=792)
+        boundary = detector.detect(data).outer_boundary
+        assert boundary is not None
+        assert len(boundary) == 5
+        assert boundary[0] == boundary[-1]
+        assert {(p.x, p.y) for p in boundary} == {
+            (100.0, 100.0), (400.0, 100.0), (400.0, 300.0), (100.0, 300.0),
+        }
+
     def test_no_segments_returns_none(self) -> None:
         """Empty segments list should return None, not error."""
         detector = WallDetector()
@@ -216,3 +288,29 @@ class TestOrientation:
         data = DrawingData(paths=paths, page_width_pts=612, page_height_pts=792)
         result = detector.detect(data)
         assert len(result.segments) == 0
+
+
+class TestSegmentsToXyxy:
+    def test_rows_are_start_then_end(self) -> None:
+        segs = [
+            WallSegment(
+                start=Point2D(1.0, 2.0),
+                end=Point2D(3.0, 4.0),
+                thickness_pts=None,
+                orientation=Orientation.ANGLED,
+                length_pts=2.83,
+            ),
+            WallSegment(
+                start=Point2D(5.0, 6.0),
+                end=Point2D(7.0, 6.0),
+                thickness_pts=None,
+                orientation=Orientation.HORIZONTAL,
+                length_pts=2.0,
+            ),
+        ]
+        xyxy = segments_to_xyxy(segs)
+        assert xyxy.shape == (2, 4)
+        assert xyxy.tolist() == [[1.0, 2.0, 3.0, 4.0], [5.0, 6.0, 7.0, 6.0]]
+
+    def test_empty(self) -> None:
+        assert segments_to_xyxy([]).shape == (0, 4)